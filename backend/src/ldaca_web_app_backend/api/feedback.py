@@ -6,8 +6,9 @@ Follows architectural principles:
 - Auth required (even in single-user mode returns root user)
 """
 
+import asyncio
 import os
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException
 
@@ -26,6 +27,29 @@ Table = None  # type: ignore
 
 router = APIRouter(prefix="/feedback", tags=["feedback"])
 
+# Shared pyairtable Table so its HTTP session (and TLS connection) is reused
+# across submissions; rebuilt only if the Airtable settings change.
+_table: Any = None
+_table_key: Optional[Tuple[Any, Any, Any]] = None
+
+
+def _get_table() -> Any:
+    global _table, _table_key
+    key = (
+        settings.airtable_api_key,
+        settings.airtable_base_id,
+        settings.airtable_table_id,
+    )
+    if _table is None or _table_key != key:
+        # Import only when needed
+        from pyairtable import Table as _Table  # type: ignore
+
+        # pyairtable.Table signature: Table(api_key, base_id, table_name)
+        # (we pass the table ID which is accepted as name)
+        _table = _Table(*key)  # type: ignore[call-arg]
+        _table_key = key
+    return _table
+
 
 def _airtable_available() -> bool:
     # Disable network side-effects during test runs
@@ -63,15 +87,7 @@ async def submit_feedback(
         )
 
     try:
-        # Import only when needed
-        from pyairtable import Table as _Table  # type: ignore
-
-        # pyairtable.Table signature: Table(api_key, base_id, table_name)
-        table = _Table(  # type: ignore[call-arg]
-            settings.airtable_api_key,  # type: ignore[arg-type]
-            settings.airtable_base_id,  # type: ignore[arg-type]
-            settings.airtable_table_id,  # type: ignore[arg-type] (we pass the table ID which is accepted as name)
-        )
+        table = _get_table()
         # Build Airtable fields using configured field IDs if present; fallback to field names.
         # (pyairtable docs use field NAMES. Field IDs also work; we support both.)
         fields: Dict[str, Any] = {}
@@ -87,7 +103,8 @@ async def submit_feedback(
             fields[reply_key] = email_value
 
         # Minimal create (avoid adding unspecified columns to prevent UNKNOWN_FIELD_NAME)
-        record = table.create(fields)  # type: ignore[operator]
+        # pyairtable is synchronous; keep the HTTP round trip off the event loop
+        record = await asyncio.to_thread(table.create, fields)
         record_id = record.get("id") if isinstance(record, dict) else None
 
         return FeedbackResponse(
@@ -2,82 +2,307 @@
 File management endpoints
 """
 
-from typing import Any
+import asyncio
+import json
+import os
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from stat import S_ISREG
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import polars as pl
+import pyarrow.parquet as pq
 from fastapi import APIRouter, Depends, HTTPException, UploadFile
-from fastapi.responses import StreamingResponse
+from fastapi.responses import FileResponse
 
-from ..core.auth import get_current_user
+from ..core.auth import get_current_user, get_current_user_data_folder
+from ..core.fs_fast import fast_stat
 from ..core.utils import (
     detect_file_type,
-    get_user_data_folder,
-    load_data_file,
-    serialize_dataframe_for_json,
+    probe_schema,
+    save_upload,
     validate_file_path,
 )
 from ..models import FileUploadResponse
 
 router = APIRouter(prefix="/files", tags=["file_management"])
 
+# Upper bound on threads used to walk top-level subdirectories when listing
+LISTING_MAX_WORKERS = 8
+
+# JSON previews decode the top-level array incrementally in reads of this size
+JSON_PREVIEW_READ_SIZE = 1 << 16
+
+# -----------------------------------------------------------------------------
+# File Metadata Cache
+# -----------------------------------------------------------------------------
+# Keyed by (user_id, filename) -> {"path", "allowed", "stat", "created"}.
+# The UI typically requests preview, info and download for the same file in
+# quick succession, so path validation and stat results are kept briefly.
+# Misses are not cached, so a file written by any path is visible at once;
+# uploads and deletes invalidate their key, and the TTL bounds staleness for
+# changes made outside this process.
+FILE_META_CACHE_TTL = 5.0
+FILE_META_CACHE_MAX_ENTRIES = 8192
+FILE_META_CACHE: Dict[Tuple[str, str], dict] = {}
+
+
+def _get_file_meta(user_id: str, filename: str, data_folder: Path) -> dict:
+    key = (user_id, filename)
+    now = time.monotonic()
+    entry = FILE_META_CACHE.get(key)
+    if entry and now - entry["created"] < FILE_META_CACHE_TTL:
+        return entry
 
-def _lazy_scan(file_path, file_type: str) -> pl.LazyFrame:
+    file_path = data_folder / filename
+    allowed = validate_file_path(file_path, data_folder)
+    stat = None
+    if allowed:
+        try:
+            # Like the listing, don't follow symlinks: only regular files count
+            stat = fast_stat(file_path, follow_symlinks=False)
+        except (OSError, ValueError):
+            stat = None
+        if stat is not None and not S_ISREG(stat.st_mode):
+            stat = None
+
+    FILE_META_CACHE.pop(key, None)
+    if stat is None:
+        return {"path": file_path, "allowed": allowed, "stat": None, "created": now}
+    while len(FILE_META_CACHE) >= FILE_META_CACHE_MAX_ENTRIES:
+        # Dicts keep insertion order: drop the oldest entry
+        FILE_META_CACHE.pop(next(iter(FILE_META_CACHE)))
+    entry = {"path": file_path, "allowed": allowed, "stat": stat, "created": now}
+    FILE_META_CACHE[key] = entry
+    return entry
+
+
+def invalidate_file_meta(user_id: str, filename: str) -> None:
+    FILE_META_CACHE.pop((user_id, filename), None)
+
+
+def _read_json_array_head(file_path, limit: int) -> Optional[List[Any]]:
+    """Decode at most ``limit`` records from a top-level JSON array.
+
+    Only as much of the file as needed is read. Returns None when the document
+    is not an array so callers can fall back to a full read.
+    """
+    decoder = json.JSONDecoder()
+    records: List[Any] = []
+    buf = ""
+    pos = 0
+    started = False
+    eof = False
+    with open(file_path, "r", encoding="utf-8-sig") as fh:
+        while len(records) < limit:
+            # Skip whitespace and separators between values
+            while pos < len(buf) and buf[pos] in " \t\r\n,":
+                pos += 1
+            if pos >= len(buf):
+                if eof:
+                    break
+                chunk = fh.read(JSON_PREVIEW_READ_SIZE)
+                buf = buf[pos:] + chunk
+                pos = 0
+                eof = not chunk
+                continue
+            if not started:
+                if buf[pos] != "[":
+                    return None
+                started = True
+                pos += 1
+                continue
+            if buf[pos] == "]":
+                break
+            try:
+                value, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                value, end = None, -1
+            # A value ending exactly at the buffer edge may be a truncated
+            # number or literal; read more before trusting it.
+            if end < 0 or (end >= len(buf) and not eof):
+                chunk = fh.read(JSON_PREVIEW_READ_SIZE)
+                buf = buf[pos:] + chunk
+                pos = 0
+                eof = not chunk
+                continue
+            records.append(value)
+            pos = end
+    return records if started else None
+
+
+def _scan_ndjson(file_path, limit: Optional[int]) -> pl.LazyFrame:
+    # Prefer scan_ndjson when available
+    scan_ndjson: Any = getattr(pl, "scan_ndjson", None)
+    if callable(scan_ndjson):
+        try:
+            lf = scan_ndjson(file_path)
+            if isinstance(lf, pl.LazyFrame):
+                return lf
+        except Exception:
+            pass
+    return pl.read_ndjson(file_path).lazy()
+
+
+def _scan_json(file_path, limit: Optional[int]) -> pl.LazyFrame:
+    if limit is not None:
+        records = _read_json_array_head(file_path, limit)
+        if records is not None:
+            return pl.DataFrame(records).lazy()
+    return pl.read_json(file_path).lazy()
+
+
+# file type -> scanner(file_path, limit); one lookup on the preview hot path,
+# and new formats only need an entry here
+_SCANNERS: Dict[str, Callable[[Any, Optional[int]], pl.LazyFrame]] = {
+    "csv": lambda p, limit: pl.scan_csv(p),
+    "tsv": lambda p, limit: pl.scan_csv(p, separator="\t"),
+    "parquet": lambda p, limit: pl.scan_parquet(p),
+    "jsonl": _scan_ndjson,
+    "ndjson": _scan_ndjson,
+    "json": _scan_json,
+}
+
+
+def _lazy_scan(file_path, file_type: str, limit: Optional[int] = None) -> pl.LazyFrame:
     """Return a Polars LazyFrame for the given file if possible.
 
     Prefers scan_* readers to avoid loading the whole file into memory.
     Falls back to eager read + .lazy() for formats without a native scanner.
+    ``limit`` caps the rows a caller will look at, so eager readers only
+    need to parse that much.
     """
-    ft = (file_type or "").lower()
-    if ft == "csv":
-        return pl.scan_csv(file_path)
-    if ft == "tsv":
-        return pl.scan_csv(file_path, separator="\t")
-    if ft == "parquet":
-        return pl.scan_parquet(file_path)
-    if ft in ("jsonl", "ndjson"):
-        # Prefer scan_ndjson when available
-        scan_ndjson: Any = getattr(pl, "scan_ndjson", None)
-        if callable(scan_ndjson):
-            try:
-                lf = scan_ndjson(file_path)
-                if isinstance(lf, pl.LazyFrame):
-                    return lf
-            except Exception:
-                pass
-        return pl.read_ndjson(file_path).lazy()
-    if ft == "json":
-        return pl.read_json(file_path).lazy()
-    return pl.DataFrame().lazy()
+    scanner = _SCANNERS.get((file_type or "").lower())
+    if scanner is None:
+        return pl.DataFrame().lazy()
+    return scanner(file_path, limit)
 
 
-@router.get("/")
-async def get_user_files(current_user: dict = Depends(get_current_user)):
-    """Get user's files with path metadata and totals"""
-    user_id = current_user["id"]
-    data_folder = get_user_data_folder(user_id)
+def _known_row_count(file_path: Path, file_type: str) -> int:
+    """Row count available without scanning the data, or 0 if unknown.
+
+    Parquet stores it in the footer metadata; other formats would need a scan.
+    """
+    if file_type == "parquet":
+        return pq.ParquetFile(file_path).metadata.num_rows
+    return 0
+
+
+def _build_preview(
+    file_path: Path, file_type: str, offset: int, page_size: int
+) -> Tuple[list, list, int]:
+    """Collect one preview page and return (records, columns, total_rows)."""
+    # Build a lightweight preview using Polars LazyFrame where possible
+    lf = _lazy_scan(file_path, file_type, limit=offset + page_size).slice(
+        offset, page_size
+    )
+    df = lf.collect()
+
+    # Normalize preview output
+    try:
+        # Replace nulls for readability and convert to list of records
+        preview_df = df.fill_null("None") if hasattr(df, "fill_null") else df
+        preview_data = preview_df.to_dicts() if hasattr(preview_df, "to_dicts") else []
+        columns = list(df.columns) if hasattr(df, "columns") else []
+    except Exception:
+        preview_data, columns = [], []
+    return preview_data, columns, _known_row_count(file_path, file_type)
+
+
+def _walk_tree(top: str) -> list[os.DirEntry]:
+    """Return the directory entry of every visible file below ``top``.
+
+    Uses ``os.scandir`` so file/dir checks come from the cached directory
+    entry without an extra stat per entry.
+    """
+    found = []
+    stack = [top]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    found.append(entry)
+    return found
+
+
+def _walk_files(folder: Path) -> list[os.DirEntry]:
+    """Collect visible files below ``folder``, walking subtrees concurrently.
+
+    The first level is read inline; each top-level subdirectory (e.g.
+    ``sample_data/``) is then walked in its own pool thread so several
+    directory reads are in flight at once. A single subdirectory is walked
+    inline since a pool would only add overhead.
+    """
+    files: list[os.DirEntry] = []
+    subdirs = []
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                files.append(entry)
+
+    if len(subdirs) < 2:
+        for sub in subdirs:
+            files.extend(_walk_tree(sub))
+        return files
+
+    workers = min(LISTING_MAX_WORKERS, len(subdirs), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for found in pool.map(_walk_tree, subdirs):
+            files.extend(found)
+    return files
+
+
+def _list_files(data_folder: Path) -> list[dict]:
+    """Build the file listing: enumerate first, then stat each file."""
+    entries = _walk_files(data_folder)
+
+    # Entry paths are root + sep + relative; slice strings instead of building Paths
+    root_len = len(os.path.join(str(data_folder), ""))
+    sep = os.sep
 
     files = []
+    for entry in entries:
+        try:
+            st = fast_stat(entry.path, follow_symlinks=False)
+        except FileNotFoundError:  # removed while listing
+            continue
+        # Get relative path from the data folder
+        rel_str = entry.path[root_len:]
+        is_sample = rel_str.startswith("sample_data/")
+        files.append({
+            "filename": rel_str,  # full path relative to user data root
+            "full_path": rel_str,
+            "display_name": entry.name,
+            "size": st.st_size,
+            "created_at": st.st_ctime,
+            "file_type": detect_file_type(entry.name),
+            "folder": rel_str.rpartition(sep)[0],
+            "is_sample": is_sample,
+            "path_type": "sample" if is_sample else "user",
+        })
+    return files
+
 
-    # Recursively find all files in the user's data folder
-    for file_path in data_folder.rglob("*"):
-        if file_path.is_file() and not file_path.name.startswith("."):
-            # Get relative path from the data folder
-            relative_path = file_path.relative_to(data_folder)
-            rel_str = str(relative_path)
-            is_sample = rel_str.startswith("sample_data/")
-            files.append({
-                "filename": rel_str,  # full path relative to user data root
-                "full_path": rel_str,
-                "display_name": file_path.name,
-                "size": file_path.stat().st_size,
-                "created_at": file_path.stat().st_ctime,
-                "file_type": detect_file_type(file_path.name),
-                "folder": str(relative_path.parent)
-                if str(relative_path.parent) != "."
-                else "",
-                "is_sample": is_sample,
-                "path_type": "sample" if is_sample else "user",
-            })
+@router.get("/")
+async def get_user_files(
+    current_user: dict = Depends(get_current_user),
+    data_folder: Path = Depends(get_current_user_data_folder),
+):
+    """Get user's files with path metadata and totals"""
+    # Recursively list the user's data folder off the event loop
+    files = await asyncio.to_thread(_list_files, data_folder)
 
     return {
         "files": files,
@@ -87,10 +312,13 @@ async def get_user_files(current_user: dict = Depends(get_current_user)):
 
 
 @router.post("/upload", response_model=FileUploadResponse)
-async def upload_file(file: UploadFile, current_user: dict = Depends(get_current_user)):
+async def upload_file(
+    file: UploadFile,
+    current_user: dict = Depends(get_current_user),
+    data_folder: Path = Depends(get_current_user_data_folder),
+):
     """Upload file to user's data folder"""
     user_id = current_user["id"]
-    data_folder = get_user_data_folder(user_id)
 
     if not file.filename:
         raise HTTPException(status_code=400, detail="No filename provided")
@@ -98,24 +326,34 @@ async def upload_file(file: UploadFile, current_user: dict = Depends(get_current
     file_path = data_folder / file.filename
 
     # Check if file already exists
-    if file_path.exists():
+    # lexists: one lstat, and a dangling symlink still counts as taken
+    if os.path.lexists(file_path):
         raise HTTPException(
             status_code=409, detail=f"File {file.filename} already exists"
         )
 
-    # Save file
+    # Save file in a worker thread (chunked copy) so the event loop stays free.
+    # It is written under a hidden name unique to this request and renamed into
+    # place once complete, so a failed upload only ever removes its own file.
+    tmp_path = file_path.with_name(f".{file_path.name}.{uuid.uuid4().hex}.part")
     try:
-        with open(file_path, "wb") as buffer:
-            content = await file.read()
-            buffer.write(content)
+        # UploadFile.size is the spooled upload's exact size (the request's
+        # Content-Length also counts multipart framing)
+        total_size = await asyncio.to_thread(
+            save_upload, file.file, tmp_path, file.size
+        )
+        os.replace(tmp_path, file_path)
     except Exception as e:
+        tmp_path.unlink(missing_ok=True)
         raise HTTPException(status_code=500, detail=f"Failed to save file: {str(e)}")
+    finally:
+        invalidate_file_meta(user_id, file.filename)
 
     file_type = detect_file_type(file.filename)
 
     return {
         "filename": file.filename,
-        "size": len(content),
+        "size": total_size,
         "upload_time": str(file_path.stat().st_ctime),
         "file_type": file_type,
         "preview_available": file_type in ["csv", "json", "parquet"],
@@ -123,23 +361,28 @@ async def upload_file(file: UploadFile, current_user: dict = Depends(get_current
 
 
 @router.delete("/{filename:path}")
-async def delete_file(filename: str, current_user: dict = Depends(get_current_user)):
+async def delete_file(
+    filename: str,
+    current_user: dict = Depends(get_current_user),
+    data_folder: Path = Depends(get_current_user_data_folder),
+):
     """Delete user's file"""
     user_id = current_user["id"]
-    data_folder = get_user_data_folder(user_id)
-    file_path = data_folder / filename
+    meta = _get_file_meta(user_id, filename, data_folder)
+    file_path = meta["path"]
 
     # Security check
-    if not validate_file_path(file_path, data_folder):
+    if not meta["allowed"]:
         raise HTTPException(
             status_code=403, detail="Access denied: file outside allowed directory"
         )
 
-    if not file_path.exists():
+    if meta["stat"] is None:
         raise HTTPException(status_code=404, detail=f"File {filename} not found")
 
     try:
         file_path.unlink()
+        invalidate_file_meta(user_id, filename)
         return {"message": f"File {filename} deleted successfully"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to delete file: {str(e)}")
@@ -151,6 +394,7 @@ async def get_file_preview(
     page: int = 0,
     page_size: int = 20,
     current_user: dict = Depends(get_current_user),
+    data_folder: Path = Depends(get_current_user_data_folder),
 ):
     """Get file preview using Polars with simple pagination.
 
@@ -158,16 +402,16 @@ async def get_file_preview(
     Total rows may not be computed cheaply; we return 0 in that case and let the UI page optimistically.
     """
     user_id = current_user["id"]
-    data_folder = get_user_data_folder(user_id)
-    file_path = data_folder / filename
+    meta = _get_file_meta(user_id, filename, data_folder)
+    file_path = meta["path"]
 
     # Security check
-    if not validate_file_path(file_path, data_folder):
+    if not meta["allowed"]:
         raise HTTPException(
             status_code=403, detail="Access denied: file outside allowed directory"
         )
 
-    if not file_path.exists():
+    if meta["stat"] is None:
         raise HTTPException(status_code=404, detail=f"File {filename} not found")
 
     try:
@@ -178,23 +422,12 @@ async def get_file_preview(
         page_size = max(1, min(500, int(page_size)))
         offset = page * page_size
 
-        # Build a lightweight preview using Polars LazyFrame where possible
-        lf = _lazy_scan(file_path, file_type).slice(offset, page_size)
-        df = lf.collect()
-
-        # Normalize preview output
-        try:
-            # Replace nulls for readability and convert to list of records
-            preview_df = df.fill_null("None") if hasattr(df, "fill_null") else df
-            preview_data = (
-                preview_df.to_dicts() if hasattr(preview_df, "to_dicts") else []
-            )
-            columns = list(df.columns) if hasattr(df, "columns") else []
-        except Exception:
-            preview_data, columns = [], []
-
-        # Unknown without expensive count; return 0 to indicate unknown
-        total_rows = 0
+        # Parsing happens in a worker thread so other requests keep flowing
+        # Parquet row counts come from the footer; elsewhere total_rows is
+        # 0 (unknown without an expensive count)
+        preview_data, columns, total_rows = await asyncio.to_thread(
+            _build_preview, file_path, file_type, offset, page_size
+        )
 
         return {
             "filename": filename,
@@ -207,30 +440,33 @@ async def get_file_preview(
 
 
 @router.get("/{filename:path}/info")
-async def get_file_info(filename: str, current_user: dict = Depends(get_current_user)):
+async def get_file_info(
+    filename: str,
+    current_user: dict = Depends(get_current_user),
+    data_folder: Path = Depends(get_current_user_data_folder),
+):
     """Get detailed file information"""
     user_id = current_user["id"]
-    data_folder = get_user_data_folder(user_id)
-    file_path = data_folder / filename
+    meta = _get_file_meta(user_id, filename, data_folder)
+    file_path = meta["path"]
 
     # Security check
-    if not validate_file_path(file_path, data_folder):
+    if not meta["allowed"]:
         raise HTTPException(
             status_code=403, detail="Access denied: file outside allowed directory"
         )
 
-    if not file_path.exists():
+    if meta["stat"] is None:
         raise HTTPException(status_code=404, detail=f"File {filename} not found")
 
     try:
-        stat = file_path.stat()
+        stat = meta["stat"]
         file_type = detect_file_type(filename)
 
         # Try to get DataFrame info
         df_info = None
         try:
-            df = load_data_file(file_path)
-            df_info = serialize_dataframe_for_json(df)
+            df_info = await asyncio.to_thread(probe_schema, file_path, file_type)
         except Exception:
             pass
 
@@ -252,30 +488,31 @@ async def get_file_info(filename: str, current_user: dict = Depends(get_current_
 # Keep the catch-all download route LAST so that more specific routes like
 # "/{filename:path}/preview" and "/{filename:path}/info" are matched first.
 @router.get("/{filename:path}")
-async def download_file(filename: str, current_user: dict = Depends(get_current_user)):
+async def download_file(
+    filename: str,
+    current_user: dict = Depends(get_current_user),
+    data_folder: Path = Depends(get_current_user_data_folder),
+):
     """Download user's file"""
     user_id = current_user["id"]
-    data_folder = get_user_data_folder(user_id)
-    file_path = data_folder / filename
+    meta = _get_file_meta(user_id, filename, data_folder)
+    file_path = meta["path"]
 
     # Security check
-    if not validate_file_path(file_path, data_folder):
+    if not meta["allowed"]:
         raise HTTPException(
             status_code=403, detail="Access denied: file outside allowed directory"
         )
 
-    if not file_path.exists():
+    if meta["stat"] is None:
         raise HTTPException(status_code=404, detail=f"File {filename} not found")
 
-    def iterfile():
-        with open(file_path, mode="rb") as file_like:
-            yield from file_like
-
     # Get just the filename for the download header
     download_filename = file_path.name
 
-    return StreamingResponse(
-        iterfile(),
+    # FileResponse lets the server use sendfile() instead of copying in Python
+    return FileResponse(
+        file_path,
         media_type="application/octet-stream",
-        headers={"Content-Disposition": f"attachment; filename={download_filename}"},
+        filename=download_filename,
     )
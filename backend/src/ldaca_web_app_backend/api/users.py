@@ -2,9 +2,12 @@
 User management endpoints
 """
 
+import os
+from pathlib import Path
+
 from fastapi import APIRouter, Depends
 
-from ..core.auth import get_current_user
+from ..core.auth import get_current_user, get_current_user_data_folder
 from ..core.utils import (
     get_folder_size_mb,
     get_user_data_folder,
@@ -15,22 +18,33 @@ from ..models import UserFolderInfo, UserStorageInfo
 router = APIRouter(prefix="/user", tags=["user_management"])
 
 
+def _count_files(folder: Path, suffix: str = "") -> int:
+    """Count regular files directly in ``folder`` (optionally by suffix).
+
+    Uses scandir's cached entry type instead of a stat per globbed path.
+    """
+    with os.scandir(folder) as entries:
+        return sum(
+            1
+            for e in entries
+            if e.name.endswith(suffix) and e.is_file(follow_symlinks=False)
+        )
+
+
 @router.get("/folders", response_model=UserFolderInfo)
-async def get_user_folders(current_user: dict = Depends(get_current_user)):
+async def get_user_folders(
+    current_user: dict = Depends(get_current_user),
+    data_folder: Path = Depends(get_current_user_data_folder),
+):
     """Get user folder information"""
     user_id = current_user["id"]
-    data_folder = get_user_data_folder(user_id)
     workspace_folder = get_user_workspace_folder(user_id)
 
-    # Count files and workspaces
-    data_files = list(data_folder.glob("*"))
-    workspace_files = list(workspace_folder.glob("*.pkl"))
-
     return {
         "data_folder": str(data_folder),
         "workspace_folder": str(workspace_folder),
-        "total_files": len([f for f in data_files if f.is_file()]),
-        "total_workspaces": len(workspace_files),
+        "total_files": _count_files(data_folder),
+        "total_workspaces": _count_files(workspace_folder, ".pkl"),
     }
 
 
@@ -49,24 +63,22 @@ async def create_user_folders(current_user: dict = Depends(get_current_user)):
 
 
 @router.get("/storage", response_model=UserStorageInfo)
-async def get_user_storage(current_user: dict = Depends(get_current_user)):
+async def get_user_storage(
+    current_user: dict = Depends(get_current_user),
+    data_folder: Path = Depends(get_current_user_data_folder),
+):
     """Get user storage usage statistics"""
     user_id = current_user["id"]
-    data_folder = get_user_data_folder(user_id)
     workspace_folder = get_user_workspace_folder(user_id)
 
     # Calculate sizes
     data_files_size = get_folder_size_mb(data_folder)
     workspace_files_size = get_folder_size_mb(workspace_folder)
 
-    # Count files
-    data_files = list(data_folder.glob("*"))
-    workspace_files = list(workspace_folder.glob("*.pkl"))
-
     return {
-        "data_files_count": len([f for f in data_files if f.is_file()]),
+        "data_files_count": _count_files(data_folder),
         "data_files_size_mb": data_files_size,
-        "workspaces_count": len(workspace_files),
+        "workspaces_count": _count_files(workspace_folder, ".pkl"),
         "workspaces_size_mb": workspace_files_size,
         "total_size_mb": data_files_size + workspace_files_size,
         "quota_limit_mb": 1000.0,  # 1GB limit for demo
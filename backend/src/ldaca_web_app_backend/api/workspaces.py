@@ -5,21 +5,51 @@ These endpoints are now simple HTTP wrappers around DocWorkspace methods.
 All business logic is handled by the DocWorkspace library itself.
 """
 
+import asyncio
+import copy
+import functools
+import hashlib
+import io
 import logging
+import operator
 import re
+import threading
 import time
-from datetime import datetime
-from typing import Any, Dict, Optional, Tuple, cast
+import weakref
+from collections import OrderedDict, defaultdict
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional, Tuple, cast
 
+import orjson
 import polars as pl
-from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
-from fastapi.responses import FileResponse
+import pyarrow as pa
+import pyarrow.parquet as pq
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Request,
+    UploadFile,
+)
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import FileResponse, ORJSONResponse, Response
 
 from ..core.auth import get_current_user
 from ..core.docworkspace_api import DocWorkspaceAPIUtils
+from ..core.topic_modeling import (
+    resolve_embedding_options,
+    run_topic_visualization,
+)
 
 # Note: DocWorkspace API helpers are not used directly in this HTTP layer
-from ..core.utils import get_user_data_folder, get_user_workspace_folder, load_data_file
+from ..core.utils import (
+    get_user_data_folder,
+    get_user_workspace_folder,
+    load_data_file,
+    save_upload,
+)
 from ..core.workspace import workspace_manager
 from ..models import (
     ConcordanceDetachRequest,
@@ -37,9 +67,12 @@ from ..models import (
     WorkspaceCreateRequest,
     WorkspaceInfo,
 )
+from .files import invalidate_file_meta
 
 # Router for workspace endpoints (was accidentally removed during edits)
-router = APIRouter(prefix="/workspaces", tags=["workspace"])
+router = APIRouter(
+    prefix="/workspaces", tags=["workspace"], default_response_class=ORJSONResponse
+)
 
 # Optional docframe types (DocDataFrame / DocLazyFrame) used in conversions
 try:  # pragma: no cover - optional dependency handling
@@ -48,14 +81,31 @@ except Exception:  # pragma: no cover
     DocDataFrame = None  # type: ignore
     DocLazyFrame = None  # type: ignore
 
+# For isinstance checks; empty when docframe is unavailable
+_DOC_TYPES: Tuple[type, ...] = tuple(
+    t for t in (DocDataFrame, DocLazyFrame) if t is not None
+)
+
 logger = logging.getLogger(__name__)
 
 # -----------------------------------------------------------------------------
 # Concordance In-Memory Cache
 # -----------------------------------------------------------------------------
 # Keyed by (user_id, workspace_id, node_id, column, search_word, num_left, num_right,
-#           regex, case_sensitive) -> stored unsorted Polars DataFrame
-CONCORDANCE_CACHE: Dict[Tuple[str, str, str, str, str, int, int, bool, bool], dict] = {}
+#           regex, case_sensitive) -> stored unsorted Polars DataFrame, plus a
+# weak reference to the node data it was computed from (hits must match it)
+# Kept in LRU order and bounded by entry count and by the stored size, so
+# long-running servers don't accumulate results without limit. Frames are kept
+# as LZ4-compressed Arrow IPC bytes rather than live DataFrames; the most recent
+# hit stays decoded so paging through one result doesn't re-decode it.
+CONCORDANCE_CACHE_MAX_ENTRIES = 256
+CONCORDANCE_CACHE_MAX_BYTES = 1 << 30
+ConcordanceCacheKey = Tuple[str, str, str, str, str, int, int, bool, bool]
+CONCORDANCE_CACHE: "OrderedDict[ConcordanceCacheKey, dict]" = OrderedDict()
+_concordance_cache_bytes = 0
+_concordance_last_hit: Optional[Tuple[Any, pl.DataFrame]] = None
+# (user_id, workspace_id) -> cache keys, so per-workspace clears don't scan
+CONCORDANCE_INDEX: "defaultdict[Tuple[str, str], set]" = defaultdict(set)
 
 
 def _concordance_cache_key(
@@ -82,11 +132,97 @@ def _concordance_cache_key(
     )
 
 
-def _get_cached_concordance_df(key):  # pragma: no cover - simple accessor
+def _get_cached_concordance_df(key, data: Any = None):  # pragma: no cover
+    """Cached result for ``key`` if it was computed from this node data object.
+
+    Node ids survive in-place data replacement (cast, convert, document column
+    reset), so entries for other data are stale and dropped.
+    """
+    global _concordance_last_hit
     entry = CONCORDANCE_CACHE.get(key)
-    if entry:
-        return entry.get("df")
-    return None
+    if not entry:
+        return None
+    ref = entry.get("data")
+    if (ref() if ref is not None else None) is not data:
+        _pop_concordance_entry(key)
+        return None
+    CONCORDANCE_CACHE.move_to_end(key)
+    if _concordance_last_hit is not None and _concordance_last_hit[0] == key:
+        return _concordance_last_hit[1]
+    # Read the IPC file straight from the stored bytes (no BytesIO copy) and
+    # keep pyarrow's chunks as-is
+    with pa.ipc.open_file(pa.py_buffer(entry["ipc"])) as reader:
+        table = reader.read_all()
+    df = cast(pl.DataFrame, pl.from_arrow(table, rechunk=False))
+    _concordance_last_hit = (key, df)
+    return df
+
+
+# Column names tried, in order, when a node has no explicit document column
+DOCUMENT_COLUMN_CANDIDATES = ("document", "text", "content", "body", "message")
+
+# -----------------------------------------------------------------------------
+# Topic Modeling Result Cache
+# -----------------------------------------------------------------------------
+# Keyed by sha256 of the corpora contents + model parameters -> topic_visualization
+# output. Fits are expensive (embeddings + UMAP + HDBSCAN), so identical reruns
+# return the stored result. Kept in LRU order and capped at a few entries.
+TOPIC_MODELING_CACHE_MAX_ENTRIES = 32
+TOPIC_MODELING_CACHE: "OrderedDict[str, Tuple[float, dict]]" = OrderedDict()
+
+
+def _topic_modeling_cache_key(
+    corpora: list[list[str]], min_topic_size: int, use_ctfidf: bool, variant: str = ""
+) -> str:
+    digest = hashlib.sha256()
+    digest.update(f"{min_topic_size}\x1f{int(use_ctfidf)}\x1f{variant}".encode())
+    for docs in corpora:
+        digest.update(b"\x1e")  # corpus boundary
+        for doc in docs:
+            digest.update(doc.encode("utf-8", "surrogatepass"))
+            digest.update(b"\x1f")
+    return digest.hexdigest()
+
+
+def _get_cached_topic_modeling(key: str) -> Optional[dict]:
+    entry = TOPIC_MODELING_CACHE.get(key)
+    if entry is None:
+        return None
+    TOPIC_MODELING_CACHE.move_to_end(key)
+    return entry[1]
+
+
+def _store_topic_modeling(key: str, tv: dict) -> None:
+    TOPIC_MODELING_CACHE[key] = (time.time(), tv)
+    TOPIC_MODELING_CACHE.move_to_end(key)
+    while len(TOPIC_MODELING_CACHE) > TOPIC_MODELING_CACHE_MAX_ENTRIES:
+        TOPIC_MODELING_CACHE.popitem(last=False)
+
+
+# -----------------------------------------------------------------------------
+# Document Column Guess Cache
+# -----------------------------------------------------------------------------
+# (path, mtime_ns, size) -> guessed document column for data files added as
+# corpus nodes. Re-adding an unchanged file skips the guess, which samples rows.
+DOCUMENT_COLUMN_GUESS_CACHE_MAX_ENTRIES = 512
+DOCUMENT_COLUMN_GUESS_CACHE: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+
+
+def _guess_file_document_column(file_path: Any, data: Any, guess: Any) -> Optional[str]:
+    """``guess(data)`` for data loaded from ``file_path``, cached per file version"""
+    st = file_path.stat()
+    key = (str(file_path), st.st_mtime_ns, st.st_size)
+    cached = DOCUMENT_COLUMN_GUESS_CACHE.get(key)
+    if cached is not None:
+        DOCUMENT_COLUMN_GUESS_CACHE.move_to_end(key)
+        return cached
+    guessed = guess(data)
+    if guessed:
+        cache = DOCUMENT_COLUMN_GUESS_CACHE
+        cache[key] = guessed
+        while len(cache) > DOCUMENT_COLUMN_GUESS_CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
+    return guessed
 
 
 # ============================================================================
@@ -122,13 +258,9 @@ async def run_topic_modeling(
                 status_code=404, detail=f"Workspace {workspace_id} not found"
             )
 
-        try:
-            import polars as pl  # noqa: F401
-
-            from docframe import DocDataFrame, DocLazyFrame  # type: ignore
-        except Exception as e:  # pragma: no cover
+        if not _DOC_TYPES:  # pragma: no cover
             raise HTTPException(
-                status_code=500, detail=f"Required libraries unavailable: {e}"
+                status_code=500, detail="Required libraries unavailable: docframe"
             )
 
         corpora: list[list[str]] = []
@@ -144,14 +276,8 @@ async def run_topic_modeling(
             node_data = getattr(node, "data", node)
             node_name = getattr(node, "name", None) or node_id
 
-            if hasattr(node_data, "columns"):
-                available_columns = node_data.columns  # type: ignore[attr-defined]
-            elif hasattr(node_data, "collect_schema"):
-                available_columns = list(node_data.collect_schema().keys())  # type: ignore
-            elif hasattr(node_data, "schema"):
-                available_columns = list(node_data.schema.keys())  # type: ignore
-            else:
-                available_columns = []
+            available_columns = _schema_columns(node_data)
+            column_set = set(available_columns)
 
             column_name = node_columns.get(node_id)
             if not column_name:
@@ -160,19 +286,16 @@ async def run_topic_modeling(
                 ):
                     column_name = node_data.document_column  # type: ignore[attr-defined]
                 else:
-                    common = [
-                        c
-                        for c in ["document", "text", "content", "body", "message"]
-                        if c in available_columns
-                    ]
-                    if common:
-                        column_name = common[0]
+                    column_name = next(
+                        (c for c in DOCUMENT_COLUMN_CANDIDATES if c in column_set),
+                        None,
+                    )
             if not column_name:
                 raise HTTPException(
                     status_code=400,
                     detail=f"Could not determine text column for node {node_id}. Available: {available_columns}",
                 )
-            if column_name not in available_columns:
+            if column_name not in column_set:
                 raise HTTPException(
                     status_code=400,
                     detail=f"Column '{column_name}' not in node {node_id}. Available: {available_columns}",
@@ -180,8 +303,12 @@ async def run_topic_modeling(
 
             try:
                 if hasattr(node_data, "select"):
+                    # Convert and null-fill inside Polars so the column comes
+                    # out as ready-to-use strings in a single to_list()
                     selected = node_data.select(
-                        pl.col(column_name).alias("__doc_col__")
+                        _document_text_expr(
+                            column_name, _schema_dtype(node_data, column_name)
+                        )
                     )  # type: ignore
                 else:
                     raise HTTPException(
@@ -193,10 +320,10 @@ async def run_topic_modeling(
                         selected = selected.collect()
                     except Exception:  # pragma: no cover
                         pass
-                docs = [
-                    str(v) if v is not None else ""
-                    for v in selected["__doc_col__"].to_list()
-                ]  # type: ignore[index]
+                docs = selected.get_column("__doc_col__").to_list()  # type: ignore
+                # topic_visualization needs the list of str; release the Arrow
+                # copy now rather than holding it through the fit
+                del selected
                 corpora.append(docs)
                 node_names.append(node_name)
             except HTTPException:
@@ -214,12 +341,35 @@ async def run_topic_modeling(
                 status_code=500, detail=f"topic_visualization unavailable: {e}"
             )
 
+        min_topic_size = request.min_topic_size or 5
+        use_ctfidf = bool(request.use_ctfidf)
+        # Options this docframe can't take are dropped (and logged) up front so
+        # they don't split the cache
+        fast_embed, quantize = resolve_embedding_options(
+            topic_visualization, bool(request.fast_embed), bool(request.quantize)
+        )
+        variant = "fast" if fast_embed else ("int8" if quantize else "")
+        cache_key = _topic_modeling_cache_key(
+            corpora, min_topic_size, use_ctfidf, variant
+        )
         try:
-            tv = topic_visualization(
-                corpora=corpora,
-                min_topic_size=request.min_topic_size or 5,
-                use_ctfidf=bool(request.use_ctfidf),
-            )
+            tv = _get_cached_topic_modeling(cache_key)
+            if tv is None:
+                # One call fits a single model over all corpora (documents are
+                # embedded once and per-corpus counts are split afterwards), so
+                # corpora must not be fitted one at a time here.
+                # The fit takes seconds to minutes; run it in a worker thread so
+                # the event loop keeps serving other requests meanwhile
+                tv = await asyncio.to_thread(
+                    run_topic_visualization,
+                    topic_visualization,
+                    corpora,
+                    min_topic_size,
+                    use_ctfidf,
+                    fast_embed,
+                    quantize,
+                )
+                _store_topic_modeling(cache_key, tv)
         except ImportError as ie:
             return TopicModelingResponse(success=False, message=str(ie), data=None)
         except ValueError as ve:
@@ -246,19 +396,471 @@ async def run_topic_modeling(
         raise HTTPException(status_code=500, detail=f"Unexpected error: {e}")
 
 
-def _store_concordance_df(key, df):  # pragma: no cover
-    CONCORDANCE_CACHE[key] = {"df": df, "created": time.time()}
+def _pop_concordance_entry(key):
+    global _concordance_cache_bytes, _concordance_last_hit
+    if _concordance_last_hit is not None and _concordance_last_hit[0] == key:
+        _concordance_last_hit = None
+    entry = CONCORDANCE_CACHE.pop(key, None)
+    if entry:
+        _concordance_cache_bytes -= entry.get("bytes", 0)
+        owner = (key[0], key[1])
+        keys = CONCORDANCE_INDEX.get(owner)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del CONCORDANCE_INDEX[owner]
+    return entry
+
+
+def _store_concordance_df(key, df, data: Any = None):  # pragma: no cover
+    global _concordance_cache_bytes, _concordance_last_hit
+    _pop_concordance_entry(key)
+    buf = io.BytesIO()
+    try:
+        df.write_ipc(buf, compression="lz4")
+    except Exception as e:
+        logger.warning(f"Not caching concordance result: {e}")
+        return
+    ipc = buf.getvalue()
+    size = len(ipc)
+    if size > CONCORDANCE_CACHE_MAX_BYTES:
+        return  # larger than the whole budget; not worth evicting everything
+    CONCORDANCE_CACHE[key] = {
+        "ipc": ipc,
+        "bytes": size,
+        "created": time.time(),
+        "data": _node_cache_ref(data) if data is not None else None,
+    }
+    CONCORDANCE_INDEX[(key[0], key[1])].add(key)
+    _concordance_cache_bytes += size
+    _concordance_last_hit = (key, df)
+    # Evict least recently used entries until both bounds hold
+    while (
+        len(CONCORDANCE_CACHE) > CONCORDANCE_CACHE_MAX_ENTRIES
+        or _concordance_cache_bytes > CONCORDANCE_CACHE_MAX_BYTES
+    ):
+        _pop_concordance_entry(next(iter(CONCORDANCE_CACHE)))
+
+
+def _concordance_page(
+    df: pl.DataFrame,
+    sort_by: Optional[str],
+    sort_order: str,
+    start: int,
+    length: int,
+) -> pl.DataFrame:
+    """Rows ``start:start+length`` of ``df``, sorted by ``sort_by`` if a column.
+
+    Sort and slice run as one lazy query, so Polars only partially sorts the
+    rows up to the end of the page (top-k) instead of ordering the whole set.
+    """
+    lf = df.lazy()
+    if sort_by and sort_by in df.columns:
+        lf = lf.sort(sort_by, descending=sort_order.lower() == "desc")
+    return lf.slice(start, length).collect()
+
+
+# (user_id, workspace_id, node_id) -> (node data ref, node rows with a
+# document_idx row index), for concordance joins that need every match's
+# metadata. Whole-node copies, so only a few are kept.
+CONCORDANCE_METADATA_CACHE_MAX_ENTRIES = 4
+CONCORDANCE_METADATA_CACHE: "OrderedDict[Tuple[str, str, str], Tuple[Any, Any]]"
+CONCORDANCE_METADATA_CACHE = OrderedDict()
+
+
+def _concordance_metadata(
+    base: Any,
+    idx_dtype: pl.DataType,
+    ids: Optional[pl.Series] = None,
+    cache_key: Optional[Tuple[str, str, str]] = None,
+) -> pl.DataFrame:
+    """Original node rows with a ``document_idx`` row index of ``idx_dtype``.
+
+    With ``ids`` only those rows are kept; the filter runs inside the lazy
+    query, so just the matching rows are materialized. Without ``ids`` the
+    indexed rows are collected once per node data object under ``cache_key``,
+    and later lookups (including filtered ones) reuse them.
+    """
+    indexed = None
+    if cache_key is not None:
+        indexed = _get_node_cached(CONCORDANCE_METADATA_CACHE, cache_key, base)
+    if indexed is not None:
+        lf = indexed.lazy()
+    else:
+        if hasattr(base, "to_lazyframe"):
+            lf = base.to_lazyframe()
+        elif hasattr(base, "_df"):
+            lf = base._df.lazy()  # type: ignore[attr-defined]
+        elif isinstance(base, pl.DataFrame):
+            lf = base.lazy()
+        else:
+            lf = getattr(base, "lazyframe", base)
+        lf = lf.with_row_index("document_idx")
+        if ids is None and cache_key is not None:
+            indexed = lf.collect()
+            _store_node_cached(
+                CONCORDANCE_METADATA_CACHE,
+                cache_key,
+                base,
+                indexed,
+                CONCORDANCE_METADATA_CACHE_MAX_ENTRIES,
+            )
+            lf = indexed.lazy()
+    lf = lf.with_columns(pl.col("document_idx").cast(idx_dtype))
+    if ids is not None:
+        lf = lf.filter(pl.col("document_idx").is_in(ids.implode()))
+    return lf.collect()
+
+
+def _join_concordance_metadata(
+    cdf: pl.DataFrame,
+    base: Any,
+    cache_key: Optional[Tuple[str, str, str]] = None,
+    page: bool = True,
+) -> pl.DataFrame:
+    """Left-join each concordance row's original node row by ``document_idx``.
+
+    ``page=False`` marks a join over all matches, whose metadata is cached.
+    """
+    idx = cdf.get_column("document_idx")
+    ids = idx.unique() if page else None
+    orig = _concordance_metadata(base, idx.dtype, ids, cache_key)
+    # Pages arrive sorted; a plain join doesn't promise to keep row order
+    return cdf.join(orig, on="document_idx", how="left", maintain_order="left")
 
 
 def _clear_concordance_cache_for(user_id: str, workspace_id: str):  # pragma: no cover
-    to_delete = [
-        k for k in CONCORDANCE_CACHE if k[0] == user_id and k[1] == workspace_id
-    ]
+    to_delete = CONCORDANCE_INDEX.pop((user_id, workspace_id), set())
     for k in to_delete:
-        CONCORDANCE_CACHE.pop(k, None)
+        _pop_concordance_entry(k)
     return len(to_delete)
 
 
+def _schema_columns(data: Any) -> list[str]:
+    """Column names of node data, resolving a lazy schema only once.
+
+    Lazy frames (including a DocLazyFrame's inner LazyFrame) go straight to
+    collect_schema(), which plans but computes no rows; probing ``.columns``
+    first would resolve the schema twice and emit a performance warning.
+    """
+    lazy = data if isinstance(data, pl.LazyFrame) else getattr(data, "lazyframe", None)
+    if isinstance(lazy, pl.LazyFrame):
+        return lazy.collect_schema().names()
+    if hasattr(data, "columns"):
+        return list(data.columns)
+    if hasattr(data, "collect_schema"):
+        return list(data.collect_schema().keys())
+    if hasattr(data, "schema"):
+        return list(data.schema.keys())
+    return []
+
+
+def _schema_dtype(data: Any, column_name: str) -> Optional[pl.DataType]:
+    """Dtype of one column of node data, or None if it can't be resolved"""
+    lazy = data if isinstance(data, pl.LazyFrame) else getattr(data, "lazyframe", None)
+    try:
+        if isinstance(lazy, pl.LazyFrame):
+            return lazy.collect_schema().get(column_name)
+        if hasattr(data, "schema"):
+            return data.schema.get(column_name)
+    except Exception:
+        pass
+    return None
+
+
+def _document_text_expr(column_name: str, dtype: Optional[pl.DataType]) -> pl.Expr:
+    """Expression yielding a column as non-null strings, specialised by dtype.
+
+    String columns only need nulls filled; scalar columns are formatted by
+    Polars' native cast. Nested and object columns can't be cast to Utf8, so
+    only those fall back to formatting each value in Python.
+    """
+    col = pl.col(column_name)
+    if dtype == pl.Utf8:
+        expr = col
+    elif dtype is not None and (dtype.is_nested() or dtype == pl.Object):
+        expr = col.map_elements(str, return_dtype=pl.Utf8)
+    else:
+        expr = col.cast(pl.Utf8)
+    return expr.fill_null("").alias("__doc_col__")
+
+
+# (user_id, workspace_id, node_id) -> (node data ref, (rows, columns)).
+# Counting a lazy node scans its source, so paging through or polling the shape
+# of the same node reuses the result for as long as the node still holds the
+# same data object (nodes have no version number; replaced data is recounted).
+NODE_SHAPE_CACHE_MAX_ENTRIES = 256
+NODE_SHAPE_CACHE: "OrderedDict[Tuple[str, str, str], Tuple[Any, Tuple[int, int]]]"
+NODE_SHAPE_CACHE = OrderedDict()
+
+# (user_id, workspace_id, node_id, column, exact) -> (node data ref, JSON body)
+# for get_column_unique_values, validated the same way as NODE_SHAPE_CACHE
+UNIQUE_VALUES_CACHE_MAX_ENTRIES = 256
+# Rows scanned for sample values when the count is approximate
+UNIQUE_SAMPLE_SCAN_ROWS = 10_000
+UNIQUE_VALUES_CACHE: "OrderedDict[tuple, Tuple[Any, dict]]" = OrderedDict()
+
+
+# Some node caches are also used from conversion handlers in worker threads
+_node_cache_lock = threading.Lock()
+
+
+def _node_cache_ref(data: Any) -> Callable[[], Any]:
+    """Weak reference to node data, so cache entries don't keep it alive.
+
+    Objects that can't be weakly referenced fall back to a strong one; entries
+    for those are dropped by _evict_node_caches when the node goes away.
+    """
+    try:
+        return weakref.ref(data)
+    except TypeError:
+        return lambda: data
+
+
+def _get_node_cached(cache: OrderedDict, key: Any, data: Any) -> Any:
+    """Cached value for ``key`` if it was computed from this exact data object"""
+    with _node_cache_lock:
+        entry = cache.get(key)
+        if entry is None or entry[0]() is not data:
+            return None
+        cache.move_to_end(key)
+        return entry[1]
+
+
+def _store_node_cached(
+    cache: OrderedDict, key: Any, data: Any, value: Any, max_entries: int
+) -> None:
+    with _node_cache_lock:
+        cache[key] = (_node_cache_ref(data), value)
+        cache.move_to_end(key)
+        while len(cache) > max_entries:
+            cache.popitem(last=False)
+
+
+def _evict_node_caches(
+    user_id: str, workspace_id: str, node_id: Optional[str] = None
+) -> None:
+    """Drop cache entries of a deleted node, or of a whole workspace.
+
+    Covers the node caches and concordance results. Entries keyed by data id
+    instead of node are dropped once their data has been freed.
+    """
+    node_keyed = (
+        NODE_SHAPE_CACHE,
+        UNIQUE_VALUES_CACHE,
+        NODE_INFO_CACHE,
+        CONCORDANCE_METADATA_CACHE,
+    )
+    with _node_cache_lock:
+        for cache in node_keyed:
+            for key in [
+                k
+                for k in cache
+                if k[:2] == (user_id, workspace_id)
+                and (node_id is None or k[2] == node_id)
+            ]:
+                del cache[key]
+        for cache in (GUESS_CACHE, PARQUET_SCANS):
+            for key in [k for k, entry in cache.items() if entry[0]() is None]:
+                del cache[key]
+    if node_id is None:
+        _clear_concordance_cache_for(user_id, workspace_id)
+    else:
+        for key in list(CONCORDANCE_INDEX.get((user_id, workspace_id), ())):
+            if key[2] == node_id:
+                _pop_concordance_entry(key)
+
+
+# (id(node data), guesser) -> (node data ref, guessed document column)
+GUESS_CACHE_MAX_ENTRIES = 256
+GUESS_CACHE: "OrderedDict[Tuple[int, str], Tuple[Any, str]]" = OrderedDict()
+
+
+def _cached_guess(
+    guess: Callable[[Any], Optional[str]], data: Any, frame: Any = None
+) -> Optional[str]:
+    """``guess(frame or data)``, memoized while the node holds ``data``"""
+    key = (id(data), getattr(guess, "__qualname__", repr(guess)))
+    doc_col = _get_node_cached(GUESS_CACHE, key, data)
+    if doc_col is None:
+        doc_col = guess(data if frame is None else frame)
+        if doc_col:
+            _store_node_cached(GUESS_CACHE, key, data, doc_col, GUESS_CACHE_MAX_ENTRIES)
+    return doc_col
+
+
+# id(LazyFrame) -> (LazyFrame ref, path) for nodes added as a bare scan_parquet of
+# a data file; their row count is in the file footer, no scan needed
+PARQUET_SCANS_MAX_ENTRIES = 256
+PARQUET_SCANS: "OrderedDict[int, Tuple[pl.LazyFrame, Any]]" = OrderedDict()
+
+
+# Eagerly loaded frames up to this size are rechunked before being stored
+RECHUNK_MAX_BYTES = 64 << 20
+
+
+def _load_as_polars(file_path: Any) -> Any:
+    """load_data_file, with pandas results converted and DataFrames made lazy.
+
+    Blocking: eager readers (JSON, Excel, pandas fallbacks) and the pandas
+    conversion both run here, so async callers use a worker thread.
+    """
+    data = load_data_file(file_path)
+    if (
+        hasattr(data, "iloc")
+        and hasattr(data, "dtypes")
+        and not isinstance(data, (pl.DataFrame, pl.LazyFrame))
+    ):
+        # pandas: Polars adopts Arrow-backed columns as-is and converts the
+        # rest column by column; no rechunk copy, NaN becomes null as it
+        # would in a native read
+        data = pl.from_pandas(data, rechunk=False, nan_to_null=True)
+    if isinstance(data, pl.DataFrame):
+        # Small fragmented frames are made contiguous once so every later
+        # scan of the node runs over single chunks; large ones skip the copy
+        if data.n_chunks() > 1 and data.estimated_size() < RECHUNK_MAX_BYTES:
+            data = data.rechunk()
+        data = data.lazy()
+    return data
+
+
+def _register_parquet_scan(data: Any, file_path: Any) -> None:
+    if isinstance(data, pl.LazyFrame) and str(file_path).lower().endswith(".parquet"):
+        _store_node_cached(
+            PARQUET_SCANS, id(data), data, file_path, PARQUET_SCANS_MAX_ENTRIES
+        )
+
+
+def _count_shape(lazy: pl.LazyFrame, parquet_path: Any = None) -> Tuple[int, int]:
+    # Only the row count executes a query; the column count is plan metadata,
+    # so there is nothing for collect_all to run alongside it
+    columns = len(lazy.collect_schema())
+    if parquet_path is not None:
+        try:
+            return pq.ParquetFile(parquet_path).metadata.num_rows, columns
+        except Exception:
+            pass
+    return lazy.select(pl.len()).collect().item(), columns
+
+
+async def _lazy_shape(
+    key: Tuple[str, str, str], data: Any, lazy: pl.LazyFrame
+) -> Tuple[int, int]:
+    shape = _get_node_cached(NODE_SHAPE_CACHE, key, data)
+    if shape is None:
+        # Counting scans the source; keep it off the event loop
+        parquet_path = _get_node_cached(PARQUET_SCANS, id(lazy), lazy)
+        shape = await asyncio.to_thread(_count_shape, lazy, parquet_path)
+        _store_node_cached(
+            NODE_SHAPE_CACHE, key, data, shape, NODE_SHAPE_CACHE_MAX_ENTRIES
+        )
+    return shape
+
+
+# (user_id, workspace_id, node_id) -> (node data ref, (stamp, etag, body)).
+# Frontends poll node info; the serialized payload is reused while the node
+# holds the same data object and its name/operation/lineage stamp is unchanged
+NODE_INFO_CACHE_MAX_ENTRIES = 256
+NODE_INFO_CACHE: "OrderedDict[Tuple[str, str, str], Tuple[Any, tuple]]"
+NODE_INFO_CACHE = OrderedDict()
+
+
+def _node_info_stamp(node: Any) -> tuple:
+    """Cheap node attributes that node.info() reports besides the data"""
+    return (
+        node.name,
+        getattr(node, "operation", None),
+        tuple(getattr(p, "id", None) for p in getattr(node, "parents", None) or ()),
+        tuple(getattr(c, "id", None) for c in getattr(node, "children", None) or ()),
+    )
+
+
+def _node_info_payload(key: Tuple[str, str, str], node: Any) -> Tuple[str, bytes]:
+    """(etag, JSON body) of the node's API info, serialized once per version"""
+    data = node.data
+    stamp = _node_info_stamp(node)
+    cached = _get_node_cached(NODE_INFO_CACHE, key, data)
+    if cached is not None and cached[0] == stamp:
+        return cached[1], cached[2]
+    info = DocWorkspaceAPIUtils.convert_node_info_for_api(node)
+    body = orjson.dumps(
+        jsonable_encoder(info),
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+    )
+    etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+    _store_node_cached(
+        NODE_INFO_CACHE, key, data, (stamp, etag, body), NODE_INFO_CACHE_MAX_ENTRIES
+    )
+    return etag, body
+
+
+def _cursor_page(
+    lazy: pl.LazyFrame, cursor_col: str, cursor: Optional[str], page_size: int
+) -> Tuple[pl.DataFrame, Optional[str], bool]:
+    """Rows with ``cursor_col > cursor`` (page, next cursor, has_next).
+
+    The comparison is a plain predicate on the scan, so Polars pushes it into
+    the reader (parquet row groups are skipped by their min/max statistics)
+    instead of producing and discarding every earlier row as an offset does.
+    Assumes ``cursor_col`` increases with row order. Cursors travel as strings
+    and are cast back to the column dtype.
+    """
+    if cursor is not None:
+        dtype = lazy.collect_schema()[cursor_col]
+        lazy = lazy.filter(pl.col(cursor_col) > pl.lit(cursor).cast(dtype))
+    df = lazy.limit(page_size + 1).collect()
+    has_next = df.height > page_size
+    df = df.head(page_size)
+    next_cursor = (
+        df.select(pl.col(cursor_col).last().cast(pl.String)).item()
+        if df.height
+        else None
+    )
+    return df, next_cursor, has_next
+
+
+def _ndjson_matches_json(dtype: pl.DataType) -> bool:
+    """True when Polars' NDJSON writer encodes ``dtype`` like jsonable_encoder.
+
+    Temporal values differ (``"2024-01-02 03:04:05"`` vs ISO ``T``, ``"PT3S"``
+    vs seconds), as can Decimal and Binary, so those take the to_dicts() path.
+    """
+    if isinstance(dtype, (pl.List, pl.Array)):
+        return _ndjson_matches_json(dtype.inner)
+    if isinstance(dtype, pl.Struct):
+        return all(_ndjson_matches_json(field.dtype) for field in dtype.fields)
+    if isinstance(dtype, pl.Decimal):
+        return False
+    return (
+        dtype.is_numeric()
+        or dtype in (pl.String, pl.Boolean, pl.Null, pl.Categorical)
+        or isinstance(dtype, pl.Enum)
+    )
+
+
+def _rows_response(df: pl.DataFrame, meta: Dict[str, Any]) -> Response:
+    """JSON response ``{"data": [row objects], **meta}`` for a page of rows.
+
+    Polars writes the row objects natively (one NDJSON line per row, joined
+    into an array), so no Python dict is built per row. Frames with dtypes
+    whose NDJSON form differs from the usual JSON encoding (temporal, Decimal,
+    Binary) or that it cannot write (e.g. Object) fall back to to_dicts().
+    """
+    rows = None
+    if all(_ndjson_matches_json(dtype) for dtype in df.schema.values()):
+        try:
+            lines = df.write_ndjson().encode().splitlines()
+            rows = b"[" + b",".join(lines) + b"]"
+        except Exception:
+            rows = None
+    if rows is None:
+        rows = orjson.dumps(jsonable_encoder(df.to_dicts()))
+    # Splice meta's object body after "data" (an empty meta just closes it)
+    tail = (b"," + orjson.dumps(meta)[1:]) if meta else b"}"
+    body = b'{"data":' + rows + tail
+    return Response(content=body, media_type="application/json")
+
+
 def _handle_operation_result(result: Any):
     """Utility to unpack safe_operation results.
 
@@ -267,13 +869,10 @@ def _handle_operation_result(result: Any):
     - (False, error_message, None)
     - Direct object (treated as success)
     """
-    try:
-        if isinstance(result, tuple) and len(result) == 3:
-            return result  # already in (success, message, obj)
-        # Fallback interpret
-        return True, "ok", result
-    except Exception as e:  # pragma: no cover
-        return False, f"Unexpected result format: {e}", None
+    if isinstance(result, tuple) and len(result) == 3:
+        return result  # already in (success, message, obj)
+    # Fallback interpret
+    return True, "ok", result
 
 
 @router.get("/")
@@ -345,10 +944,7 @@ async def create_workspace(
         raise
     except Exception as e:
         # Log and convert unexpected errors to 500
-        import traceback
-
-        print(f"❌ Workspace creation error: {str(e)}")
-        print(f"Traceback: {traceback.format_exc()}")
+        logger.exception("Workspace creation error")
         raise HTTPException(
             status_code=500,
             detail=f"Internal server error during workspace creation: {str(e)}",
@@ -365,6 +961,7 @@ async def delete_workspace(
     success = workspace_manager.delete_workspace(user_id, workspace_id)
     if not success:
         raise HTTPException(status_code=404, detail="Workspace not found")
+    _evict_node_caches(user_id, workspace_id)
 
     return {
         "success": True,
@@ -389,6 +986,7 @@ async def unload_workspace(
     existed = workspace_manager.unload_workspace(user_id, workspace_id, save=save)
     if not existed:
         raise HTTPException(status_code=404, detail="Workspace not found")
+    _evict_node_caches(user_id, workspace_id)
     return {
         "success": True,
         "message": f"Workspace {workspace_id} unloaded",
@@ -428,7 +1026,7 @@ async def rename_workspace(
     try:
         workspace.name = new_name
         # Persist change
-        workspace_manager.persist(user_id, workspace_id)
+        workspace_manager.persist(user_id, workspace_id, defer=True)
         # Return updated info similar to other endpoints
         info = workspace_manager.get_workspace_info(user_id, workspace_id)
         if not info:
@@ -481,16 +1079,10 @@ async def save_workspace_as(
     source_workspace = workspace_manager.get_workspace(user_id, workspace_id)
     if not source_workspace:
         raise HTTPException(status_code=404, detail="Workspace not found")
-    # Collect nodes/data from source workspace via summary & graph
-    user_folder = get_user_data_folder(user_id)
-    tmp_path = user_folder / f"_tmp_clone_{workspace_id}.json"
     try:
-        source_workspace.serialize(tmp_path)
-        from docworkspace import Workspace as DWWorkspace  # type: ignore
-
         from ..core.utils import generate_workspace_id
 
-        new_workspace = DWWorkspace.deserialize(tmp_path)  # type: ignore
+        new_workspace = _clone_workspace(source_workspace, user_id, workspace_id)
         new_id = generate_workspace_id()
         new_workspace.set_metadata("id", new_id)
         new_workspace.set_metadata(
@@ -509,12 +1101,36 @@ async def save_workspace_as(
         raise HTTPException(
             status_code=500, detail=f"Failed to save workspace copy: {e}"
         )
+
+
+def _clone_workspace(source_workspace, user_id: str, workspace_id: str):
+    """Copy a workspace in memory, falling back to a JSON round-trip.
+
+    An in-memory copy avoids writing, re-reading and re-parsing the whole
+    workspace JSON; the round-trip is only used if the object can't be copied.
+    """
+    clone = getattr(source_workspace, "clone", None)
+    try:
+        if callable(clone):
+            return clone()
+        return copy.deepcopy(source_workspace)
+    except Exception as e:  # pragma: no cover - depends on node data types
+        logger.warning(f"In-memory workspace copy failed, using JSON round-trip: {e}")
+
+    from docworkspace import Workspace as DWWorkspace  # type: ignore
+
+    tmp_path = get_user_data_folder(user_id) / f"_tmp_clone_{workspace_id}.json"
+    try:
+        source_workspace.serialize(tmp_path)
+        return DWWorkspace.deserialize(tmp_path)  # type: ignore
     finally:
-        try:
-            if tmp_path.exists():
-                tmp_path.unlink()
-        except Exception:
-            pass
+        tmp_path.unlink(missing_ok=True)
+
+
+def _write_workspace_snapshot(workspace, user_id: str, workspace_id: str) -> None:
+    """Copy ``workspace`` and write the copy to its file (runs in a worker)."""
+    snapshot = _clone_workspace(workspace, user_id, workspace_id)
+    workspace_manager.write_workspace_file(user_id, workspace_id, snapshot)
 
 
 @router.get("/{workspace_id}/download")
@@ -531,7 +1147,13 @@ async def download_workspace(
         try:
             ws = workspace_manager.get_workspace(user_id, workspace_id)
             if ws:
-                workspace_manager.persist(user_id, workspace_id)
+                # Copying and serializing a large workspace are both slow; keep
+                # them off the event loop. The file is written from the copy so
+                # edits landing during the write can't tear it
+                workspace_manager.begin_save(user_id, workspace_id, ws)
+                await asyncio.to_thread(
+                    _write_workspace_snapshot, ws, user_id, workspace_id
+                )
         except Exception:
             pass
     user_folder = get_user_workspace_folder(user_id)
@@ -571,9 +1193,8 @@ async def import_workspace(
     tmp_path = target_folder / ("_tmp_upload_" + filename)
 
     try:
-        content = await file.read()
-        with open(tmp_path, "wb") as f:
-            f.write(content)
+        # Chunked copy from the spooled upload in a worker thread
+        await asyncio.to_thread(save_upload, file.file, tmp_path, file.size)
 
         # Validate/normalize by deserializing
         try:
@@ -654,7 +1275,9 @@ async def get_workspace_graph(
     if not graph_data:
         raise HTTPException(status_code=404, detail="Workspace not found")
 
-    return graph_data
+    # Already a plain dict (model_dump'd), so hand it straight to orjson and skip
+    # FastAPI's recursive jsonable_encoder pass over every node and edge
+    return ORJSONResponse(graph_data)
 
 
 @router.get("/{workspace_id}/nodes")
@@ -702,19 +1325,9 @@ async def add_node_to_workspace(
                 status_code=400, detail=f"Data file not found: {filename}"
             )
 
-        # Load the data
-        data = load_data_file(file_path)
-
-        # Convert pandas DataFrame to Polars if needed
-        if hasattr(data, "columns") and hasattr(data, "iloc"):
-            # This is a pandas DataFrame, convert to Polars
-            data = pl.DataFrame(data)
-        # Prefer LazyFrame for internal storage
-        try:
-            if isinstance(data, pl.DataFrame):
-                data = data.lazy()
-        except Exception:
-            pass
+        # Load the data (eager readers and pandas conversion run off the loop)
+        data = await asyncio.to_thread(_load_as_polars, file_path)
+        _register_parquet_scan(data, file_path)
 
         # Content mode handling (DocLazyFrame vs LazyFrame)
         if mode not in {"DocLazyFrame", "LazyFrame"}:
@@ -742,8 +1355,9 @@ async def add_node_to_workspace(
 
             if document_column is None:
                 try:
-                    guessed = _DDF.guess_document_column(data)  # type: ignore[arg-type]
-                    document_column = guessed
+                    document_column = _guess_file_document_column(
+                        file_path, data, _DDF.guess_document_column
+                    )
                 except Exception:
                     document_column = None
 
@@ -812,10 +1426,7 @@ async def add_node_to_workspace(
         raise
     except Exception as e:
         # Log and convert unexpected errors to 500
-        import traceback
-
-        print(f"❌ Add node error: {str(e)}")
-        print(f"Traceback: {traceback.format_exc()}")
+        logger.exception("Add node error")
         raise HTTPException(
             status_code=500, detail=f"Internal server error adding node: {str(e)}"
         )
@@ -826,20 +1437,38 @@ async def add_node_to_workspace(
 # ============================================================================
 
 
+async def get_workspace_node(
+    workspace_id: str, node_id: str, current_user: dict = Depends(get_current_user)
+) -> Any:
+    """Dependency resolving the path's node once per request (404 if missing)"""
+    node = workspace_manager.get_node_from_workspace(
+        current_user["id"], workspace_id, node_id
+    )
+    if not node:
+        raise HTTPException(status_code=404, detail="Node not found")
+    return node
+
+
 @router.get("/{workspace_id}/nodes/{node_id}")
 async def get_node_info(
-    workspace_id: str, node_id: str, current_user: dict = Depends(get_current_user)
+    workspace_id: str,
+    node_id: str,
+    request: Request,
+    node: Any = Depends(get_workspace_node),
+    current_user: dict = Depends(get_current_user),
 ):
     user_id = current_user["id"]
-    node = workspace_manager.get_node_from_workspace(user_id, workspace_id, node_id)
-    if not node:
-        raise HTTPException(status_code=404, detail="Node not found")
 
     try:
-        return DocWorkspaceAPIUtils.convert_node_info_for_api(node)
+        etag, body = _node_info_payload((user_id, workspace_id, node_id), node)
     except Exception as e:  # pragma: no cover
         raise HTTPException(status_code=500, detail=f"Failed to get node info: {e}")
 
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
 
 @router.get("/{workspace_id}/nodes/{node_id}/data")
 async def get_node_data(
@@ -847,77 +1476,148 @@ async def get_node_data(
     node_id: str,
     page: int = 1,
     page_size: int = 20,
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page (with cursor_col)"
+    ),
+    cursor_col: Optional[str] = Query(
+        None, description="Monotonic column for keyset pagination"
+    ),
+    node: Any = Depends(get_workspace_node),
     current_user: dict = Depends(get_current_user),
 ):
-    """Get node data rows with simple pagination."""
+    """Get node data rows with simple pagination.
+
+    With ``cursor_col`` the page is the rows after ``cursor`` in that column,
+    which stays cheap on deep pages; offset paging remains the default for
+    random access.
+    """
     user_id = current_user["id"]
-    node = workspace_manager.get_node_from_workspace(user_id, workspace_id, node_id)
-    if not node:
-        raise HTTPException(status_code=404, detail="Node not found")
+
+    if cursor_col is not None:
+        return await _get_node_data_after_cursor(
+            (user_id, workspace_id, node_id), node.data, cursor_col, cursor, page_size
+        )
 
     try:
         data_obj = node.data
-        if hasattr(data_obj, "collect"):
-            df = data_obj.collect()
+        start_idx = (page - 1) * page_size
+        lazy = (
+            data_obj
+            if isinstance(data_obj, pl.LazyFrame)
+            else getattr(data_obj, "lazyframe", None)
+        )
+        if isinstance(lazy, pl.LazyFrame):
+            # Slice before collecting so only the page's rows are materialised;
+            # Polars releases the GIL, so other requests run meanwhile
+            paginated_df = await asyncio.to_thread(
+                lazy.slice(start_idx, page_size).collect
+            )
+            node_key = (user_id, workspace_id, node_id)
+            total_rows = (await _lazy_shape(node_key, data_obj, lazy))[0]
         else:
-            df = data_obj
+            if hasattr(data_obj, "collect"):
+                df = await asyncio.to_thread(data_obj.collect)
+            else:
+                df = data_obj
+            total_rows = len(df)
+            paginated_df = df.slice(start_idx, page_size)
+
+        return _rows_response(
+            paginated_df,
+            {
+                "pagination": {
+                    "page": page,
+                    "page_size": page_size,
+                    "total_rows": total_rows,
+                    "total_pages": (total_rows + page_size - 1) // page_size,
+                    "has_next": start_idx + page_size < total_rows,
+                    "has_prev": page > 1,
+                },
+                "columns": list(paginated_df.columns),
+                "dtypes": {
+                    col: str(dtype) for col, dtype in paginated_df.schema.items()
+                },
+            },
+        )
+    except Exception as e:  # pragma: no cover
+        raise HTTPException(status_code=500, detail=f"Failed to get node data: {e}")
 
-        total_rows = len(df)
-        start_idx = (page - 1) * page_size
-        paginated_df = df.slice(start_idx, page_size)
 
-        return {
-            "data": paginated_df.to_dicts(),
+async def _get_node_data_after_cursor(
+    node_key: Tuple[str, str, str],
+    data_obj: Any,
+    cursor_col: str,
+    cursor: Optional[str],
+    page_size: int,
+) -> Response:
+    if cursor_col not in _schema_columns(data_obj):
+        raise HTTPException(status_code=404, detail=f"Column '{cursor_col}' not found")
+    lazy = data_obj if isinstance(data_obj, pl.LazyFrame) else None
+    if lazy is None:
+        lazy = getattr(data_obj, "lazyframe", None)
+    if lazy is None:
+        lazy = getattr(data_obj, "dataframe", data_obj).lazy()
+
+    try:
+        page_df, next_cursor, has_next = await asyncio.to_thread(
+            _cursor_page, lazy, cursor_col, cursor, page_size
+        )
+    except (pl.exceptions.InvalidOperationError, pl.exceptions.ComputeError) as e:
+        # A cursor string that does not cast to the column dtype
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: {e}")
+    except Exception as e:  # pragma: no cover
+        raise HTTPException(status_code=500, detail=f"Failed to get node data: {e}")
+    total_rows = (await _lazy_shape(node_key, data_obj, lazy))[0]
+
+    return _rows_response(
+        page_df,
+        {
             "pagination": {
-                "page": page,
                 "page_size": page_size,
                 "total_rows": total_rows,
-                "total_pages": (total_rows + page_size - 1) // page_size,
-                "has_next": start_idx + page_size < total_rows,
-                "has_prev": page > 1,
+                "cursor_col": cursor_col,
+                "cursor": cursor,
+                "next_cursor": next_cursor,
+                "has_next": has_next,
             },
-            "columns": list(df.columns),
-            "dtypes": {col: str(dtype) for col, dtype in df.schema.items()},
-        }
-    except Exception as e:  # pragma: no cover
-        raise HTTPException(status_code=500, detail=f"Failed to get node data: {e}")
+            "columns": list(page_df.columns),
+            "dtypes": {col: str(dtype) for col, dtype in page_df.schema.items()},
+        },
+    )
 
 
 @router.get("/{workspace_id}/nodes/{node_id}/shape")
 async def get_node_shape(
-    workspace_id: str, node_id: str, current_user: dict = Depends(get_current_user)
+    workspace_id: str,
+    node_id: str,
+    node: Any = Depends(get_workspace_node),
+    current_user: dict = Depends(get_current_user),
 ):
     """Return shape [rows, columns] for node data (lazy or eager) with minimal work."""
     user_id = current_user["id"]
-    node = workspace_manager.get_node_from_workspace(user_id, workspace_id, node_id)
-    if not node:
-        raise HTTPException(status_code=404, detail="Node not found")
 
     try:
         data_obj = node.data
         # Detect docframe wrapper (optional informational flag)
-        try:  # pragma: no cover
-            from docframe import DocDataFrame, DocLazyFrame  # type: ignore
-
-            doc_wrapper = isinstance(data_obj, (DocDataFrame, DocLazyFrame))
-        except Exception:  # pragma: no cover
-            doc_wrapper = False
+        doc_wrapper = isinstance(data_obj, _DOC_TYPES)
 
-        if (
+        lazy = (
+            data_obj
+            if isinstance(data_obj, pl.LazyFrame)
+            else getattr(data_obj, "lazyframe", None)
+        )
+        if node.is_lazy and isinstance(lazy, pl.LazyFrame):
+            node_key = (user_id, workspace_id, node_id)
+            shape = list(await _lazy_shape(node_key, data_obj, lazy))
+        elif (
             node.is_lazy
             and hasattr(data_obj, "select")
             and hasattr(data_obj, "collect")
         ):
-            # Row count via pl.len()
+            # Row count via pl.len(); a docframe wrapper result is unwrapped once
             try:
-                count_df = data_obj.select(pl.len().alias("_len"))
-                collected = count_df.collect()
-                polars_df = (
-                    collected.to_dataframe()
-                    if hasattr(collected, "to_dataframe")
-                    else collected
-                )
-                row_count = polars_df.to_series(0).item()
+                collected = data_obj.select(pl.len()).collect()
+                row_count = getattr(collected, "dataframe", collected).item()
             except Exception:
                 try:
                     full = data_obj.collect()
@@ -937,8 +1637,11 @@ async def get_node_shape(
                     names = schema.names() if hasattr(schema, "names") else []
                     column_count = len(names)
                 else:
-                    # Fallback minimal collect
-                    minimal = data_obj.collect()
+                    # Fallback minimal collect: no rows are needed to count columns
+                    zero_rows = (
+                        data_obj.limit(0) if hasattr(data_obj, "limit") else data_obj
+                    )
+                    minimal = zero_rows.collect()
                     polars_min = (
                         minimal.to_dataframe()
                         if hasattr(minimal, "to_dataframe")
@@ -979,23 +1682,27 @@ async def get_column_unique_values(
     workspace_id: str,
     node_id: str,
     column_name: str,
+    exact: bool = Query(
+        False, description="Exact distinct count instead of a HyperLogLog estimate"
+    ),
+    node: Any = Depends(get_workspace_node),
     current_user: dict = Depends(get_current_user),
 ):
-    """Get unique values count for a specific column."""
+    """Get unique values count for a specific column.
+
+    By default the count is a HyperLogLog estimate and the sample values come
+    from the first rows only (``sample_partial`` is set when the node has more),
+    so no hash set over the whole column is built. ``exact=true`` computes the
+    exact count and a global distinct sample.
+    """
     user_id = current_user["id"]
-    node = workspace_manager.get_node_from_workspace(user_id, workspace_id, node_id)
-    if not node:
-        raise HTTPException(status_code=404, detail="Node not found")
 
     try:
         data_obj = node.data
 
-        # Check if column exists
-        if hasattr(data_obj, "columns"):
-            columns = list(data_obj.columns)
-        elif hasattr(data_obj, "schema"):
-            columns = list(data_obj.schema.keys())
-        else:
+        # Check if column exists (lazy schemas are resolved once)
+        columns = _schema_columns(data_obj)
+        if not columns:
             raise HTTPException(status_code=400, detail="Cannot determine columns")
 
         if column_name not in columns:
@@ -1003,33 +1710,71 @@ async def get_column_unique_values(
                 status_code=404, detail=f"Column '{column_name}' not found"
             )
 
-        # Get unique values - handle both lazy and eager data
-        if hasattr(data_obj, "collect"):
-            # Lazy frame
-            df = data_obj.collect()
-        else:
-            # Already materialized
-            df = data_obj
+        cache_key = (user_id, workspace_id, node_id, column_name, exact)
+        cached = _get_node_cached(UNIQUE_VALUES_CACHE, cache_key, data_obj)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+
+        # Plain Polars frame underneath any docframe wrapper
+        lf = getattr(data_obj, "lazyframe", None)
+        if lf is None:
+            lf = getattr(data_obj, "dataframe", data_obj)
+        if isinstance(lf, pl.DataFrame):
+            lf = lf.lazy()
 
         # Get unique values using Polars
         try:
-            unique_values = df.select(column_name).unique().to_series().to_list()
-            unique_count = len(unique_values)
-
-            # Limit the actual values returned to avoid huge responses
+            # One lazy query: only this column is read, the distinct count comes
+            # from the hash aggregation, and at most one extra value past the
+            # returned sample is kept to detect has_more
             max_values_to_return = 100
-            if len(unique_values) > max_values_to_return:
-                sample_values = unique_values[:max_values_to_return]
+            col = pl.col(column_name)
+            if exact:
+                count_expr = col.n_unique()
+                values_expr = col.unique()
+                partial_expr = pl.lit(False)
             else:
-                sample_values = unique_values
+                count_expr = col.approx_n_unique()
+                values_expr = col.head(UNIQUE_SAMPLE_SCAN_ROWS).unique(
+                    maintain_order=True
+                )
+                # Values past the scanned rows may be missing from the sample
+                partial_expr = (
+                    col.head(UNIQUE_SAMPLE_SCAN_ROWS + 1).len()
+                    > UNIQUE_SAMPLE_SCAN_ROWS
+                )
+            query = lf.select(
+                count_expr.alias("unique_count"),
+                values_expr.head(max_values_to_return + 1).implode().alias("values"),
+                partial_expr.alias("sample_partial"),
+            )
+            result = await asyncio.to_thread(query.collect)
+            unique_count = result.item(0, "unique_count")
+            unique_values = result.item(0, "values").to_list()
+            sample_values = unique_values[:max_values_to_return]
 
-            return {
+            response = {
                 "column_name": column_name,
                 "unique_count": unique_count,
                 "sample_values": sample_values,
                 "total_values_returned": len(sample_values),
+                # From the sample itself, not the (possibly estimated) count
                 "has_more": len(unique_values) > max_values_to_return,
+                "sample_partial": result.item(0, "sample_partial"),
+                "approximate": not exact,
             }
+            # Encoded once with orjson (no jsonable_encoder pass over the
+            # sample; Decimal/Duration values fall back to str); cache hits
+            # return the stored bytes as-is
+            body = orjson.dumps(response, default=str)
+            _store_node_cached(
+                UNIQUE_VALUES_CACHE,
+                cache_key,
+                data_obj,
+                body,
+                UNIQUE_VALUES_CACHE_MAX_ENTRIES,
+            )
+            return Response(content=body, media_type="application/json")
 
         except Exception as e:
             raise HTTPException(
@@ -1057,10 +1802,152 @@ async def delete_node(
     )
     if not success:
         raise HTTPException(status_code=404, detail="Node not found")
+    _evict_node_caches(user_id, workspace_id, node_id)
 
     return {"success": True, "message": "Node deleted successfully"}
 
 
+# -----------------------------------------------------------------------------
+# Node conversions: (source kind, target kind) -> handler(data, document_column)
+# -----------------------------------------------------------------------------
+
+
+def _frame_kind(data: Any) -> Optional[str]:
+    """Conversion kind of node data (Doc* wrappers are checked first)"""
+    if DocDataFrame is not None and isinstance(data, DocDataFrame):
+        return "docdataframe"
+    if DocLazyFrame is not None and isinstance(data, DocLazyFrame):
+        return "doclazyframe"
+    if isinstance(data, pl.DataFrame):
+        return "dataframe"
+    if isinstance(data, pl.LazyFrame):
+        return "lazyframe"
+    return None
+
+
+def _guessed_document_column(
+    guess: Callable[[Any], Optional[str]], data: Any, frame: Any = None
+) -> str:
+    try:
+        doc_col = _cached_guess(guess, data, frame)
+    except Exception:
+        doc_col = None
+    if not doc_col:
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                "Unable to auto-detect a document column. Please specify document_column."
+            ),
+        )
+    return doc_col
+
+
+def _require_column(document_column: str, columns: list, where: str) -> None:
+    if document_column not in columns:
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f"Document column '{document_column}' not found in {where}. "
+                f"Available: {columns}"
+            ),
+        )
+
+
+def _ddf_to_ddf(data: Any, document_column: Optional[str]) -> Any:
+    # If user specified a different document column, validate and update
+    if document_column and document_column != data.document_column:
+        return data.set_document(document_column)
+    return data
+
+
+def _dlf_to_ddf(data: Any, document_column: Optional[str]) -> Any:
+    # Materialize once and wrap with the final document column
+    # (no intermediate DocDataFrame to re-wrap via set_document)
+    return DocDataFrame(  # type: ignore[misc]
+        data.lazyframe.collect(),
+        document_column=document_column or data.document_column,
+    )
+
+
+def _df_to_ddf(data: pl.DataFrame, document_column: Optional[str]) -> Any:
+    doc_col = document_column or _guessed_document_column(
+        DocDataFrame.guess_document_column, data  # type: ignore[union-attr]
+    )
+    return DocDataFrame(data, document_column=doc_col)  # type: ignore[misc]
+
+
+def _lf_to_ddf(data: pl.LazyFrame, document_column: Optional[str]) -> Any:
+    doc_col = document_column or _guessed_document_column(
+        DocDataFrame.guess_document_column, data  # type: ignore[union-attr]
+    )
+    return DocDataFrame(data.collect(), document_column=doc_col)  # type: ignore[misc]
+
+
+def _dlf_to_dlf(data: Any, document_column: Optional[str]) -> Any:
+    # If user specified a different document column, validate and update
+    if document_column and document_column != data.document_column:
+        # Schema names straight from the plan; .columns on a lazy frame resolves
+        # the schema behind a performance warning
+        _require_column(document_column, _schema_columns(data), "node")
+        return data.with_document_column(document_column)
+    return data
+
+
+def _ddf_to_dlf(data: Any, document_column: Optional[str]) -> Any:
+    if document_column:
+        _require_column(document_column, data.dataframe.columns, "node")
+    return DocLazyFrame(  # type: ignore[misc]
+        data.dataframe.lazy(), document_column=document_column or data.document_column
+    )
+
+
+def _lf_to_dlf(data: pl.LazyFrame, document_column: Optional[str]) -> Any:
+    if document_column:
+        _require_column(
+            document_column, data.collect_schema().names(), "node schema"
+        )
+        doc_col = document_column
+    else:
+        doc_col = _guessed_document_column(
+            DocLazyFrame.guess_document_column, data  # type: ignore[union-attr]
+        )
+    return DocLazyFrame(data, document_column=doc_col)  # type: ignore[misc]
+
+
+def _df_to_dlf(data: pl.DataFrame, document_column: Optional[str]) -> Any:
+    lf = data.lazy()
+    if document_column:
+        # Eager frames know their columns; no schema resolution needed
+        _require_column(document_column, data.columns, "node")
+        doc_col = document_column
+    else:
+        doc_col = _guessed_document_column(
+            DocLazyFrame.guess_document_column, data, lf  # type: ignore[union-attr]
+        )
+    return DocLazyFrame(lf, document_column=doc_col)  # type: ignore[misc]
+
+
+_CONVERT_HANDLERS: Dict[Tuple[str, str], Callable[[Any, Optional[str]], Any]] = {
+    ("docdataframe", "docdataframe"): _ddf_to_ddf,
+    ("doclazyframe", "docdataframe"): _dlf_to_ddf,
+    ("dataframe", "docdataframe"): _df_to_ddf,
+    ("lazyframe", "docdataframe"): _lf_to_ddf,
+    ("docdataframe", "dataframe"): lambda data, _: data.dataframe,
+    # Plain frame wanted: collect the inner plan, skip the Doc* wrapper
+    ("doclazyframe", "dataframe"): lambda data, _: data.lazyframe.collect(),
+    ("dataframe", "dataframe"): lambda data, _: data,
+    ("lazyframe", "dataframe"): lambda data, _: data.collect(),
+    ("doclazyframe", "doclazyframe"): _dlf_to_dlf,
+    ("docdataframe", "doclazyframe"): _ddf_to_dlf,
+    ("lazyframe", "doclazyframe"): _lf_to_dlf,
+    ("dataframe", "doclazyframe"): _df_to_dlf,
+    ("doclazyframe", "lazyframe"): lambda data, _: data.to_lazyframe(),
+    ("docdataframe", "lazyframe"): lambda data, _: data.dataframe.lazy(),
+    ("dataframe", "lazyframe"): lambda data, _: data.lazy(),
+    ("lazyframe", "lazyframe"): lambda data, _: data,
+}
+
+
 @router.post("/{workspace_id}/nodes/{node_id}/convert")
 async def convert_node(
     workspace_id: str,
@@ -1106,182 +1993,28 @@ async def convert_node(
     if not src_node:
         raise HTTPException(status_code=404, detail="Node not found")
 
-    data = getattr(src_node, "data", None)
-    if data is None:
-        raise HTTPException(status_code=400, detail="Node has no data")
-
-    import polars as pl
-
-    try:
-        new_data = None
-        operation_name = f"convert_to_{target}"
-
-        if target == "docdataframe":
-            # Convert to DocDataFrame
-            if isinstance(data, DocDataFrame):  # type: ignore[arg-type]
-                # If user specified a different document column, validate and update
-                if document_column and document_column != data.document_column:
-                    new_data = data.set_document(document_column)
-                else:
-                    new_data = data
-
-            elif isinstance(data, DocLazyFrame):  # type: ignore[arg-type]
-                # Materialize and wrap
-                collected = data.to_docdataframe()
-                if document_column and document_column != collected.document_column:
-                    new_data = collected.set_document(document_column)
-                else:
-                    new_data = collected
-
-            elif isinstance(data, pl.DataFrame):
-                # Wrap as DocDataFrame
-                doc_col = document_column
-                if not doc_col:
-                    try:
-                        doc_col = DocDataFrame.guess_document_column(data)  # type: ignore[attr-defined]
-                    except Exception:
-                        doc_col = None
-                    if not doc_col:
-                        raise HTTPException(
-                            status_code=400,
-                            detail=(
-                                "Unable to auto-detect a document column. Please specify document_column."
-                            ),
-                        )
-                new_data = DocDataFrame(data, document_column=doc_col)  # type: ignore[call-arg]
-
-            elif isinstance(data, pl.LazyFrame):
-                # Collect and wrap
-                doc_col = document_column
-                if not doc_col:
-                    try:
-                        doc_col = DocDataFrame.guess_document_column(data)  # type: ignore[attr-defined]
-                    except Exception:
-                        doc_col = None
-                    if not doc_col:
-                        raise HTTPException(
-                            status_code=400,
-                            detail=(
-                                "Unable to auto-detect a document column. Please specify document_column."
-                            ),
-                        )
-                new_data = DocDataFrame(data.collect(), document_column=doc_col)  # type: ignore[call-arg]
-
-        elif target == "dataframe":
-            # Convert to Polars DataFrame
-            if DocDataFrame is not None and isinstance(data, DocDataFrame):  # type: ignore[arg-type]
-                new_data = data.dataframe
-            elif DocLazyFrame is not None and isinstance(data, DocLazyFrame):  # type: ignore[arg-type]
-                new_data = data.to_docdataframe().dataframe
-            elif hasattr(data, "collect"):
-                new_data = data.collect()
-            elif isinstance(data, pl.DataFrame):
-                new_data = data
-            else:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Unsupported data type for conversion: {type(data).__name__}",
-                )
-
-        elif target == "doclazyframe":
-            # Convert to DocLazyFrame
-            if isinstance(data, DocLazyFrame):  # type: ignore[arg-type]
-                # If user specified a different document column, validate and update
-                if document_column and document_column != data.document_column:
-                    if document_column not in getattr(data, "columns", []):
-                        raise HTTPException(
-                            status_code=400,
-                            detail=(
-                                f"Document column '{document_column}' not found in node. "
-                                f"Available columns: {getattr(data, 'columns', [])}"
-                            ),
-                        )
-                    new_data = data.with_document_column(document_column)
-                else:
-                    new_data = data
-
-            elif isinstance(data, DocDataFrame):  # type: ignore[arg-type]
-                # Convert to lazy and wrap
-                lf = data.dataframe.lazy()
-                if document_column and document_column not in data.dataframe.columns:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=(
-                            f"Document column '{document_column}' not found in node. "
-                            f"Available columns: {data.dataframe.columns}"
-                        ),
-                    )
-                doc_col = document_column or data.document_column
-                new_data = DocLazyFrame(lf, document_column=doc_col)  # type: ignore[misc]
-
-            elif isinstance(data, pl.LazyFrame):
-                # Wrap as DocLazyFrame
-                if document_column:
-                    if document_column not in data.collect_schema().keys():
-                        raise HTTPException(
-                            status_code=400,
-                            detail=(
-                                f"Document column '{document_column}' not found in node schema. "
-                                f"Available: {list(data.collect_schema().keys())}"
-                            ),
-                        )
-                    doc_col = document_column
-                else:
-                    try:
-                        doc_col = DocLazyFrame.guess_document_column(data)  # type: ignore[attr-defined]
-                    except Exception:
-                        doc_col = None
-                    if not doc_col:
-                        raise HTTPException(
-                            status_code=400,
-                            detail=(
-                                "Unable to auto-detect a document column. Please specify document_column."
-                            ),
-                        )
-                new_data = DocLazyFrame(data, document_column=doc_col)  # type: ignore[misc]
+    data = getattr(src_node, "data", None)
+    if data is None:
+        raise HTTPException(status_code=400, detail="Node has no data")
 
-            elif isinstance(data, pl.DataFrame):
-                # To lazy and wrap
-                lf = data.lazy()
-                if document_column:
-                    if document_column not in data.columns:
-                        raise HTTPException(
-                            status_code=400,
-                            detail=(
-                                f"Document column '{document_column}' not found in node. "
-                                f"Available columns: {data.columns}"
-                            ),
-                        )
-                    doc_col = document_column
-                else:
-                    try:
-                        doc_col = DocLazyFrame.guess_document_column(lf)  # type: ignore[attr-defined]
-                    except Exception:
-                        doc_col = None
-                    if not doc_col:
-                        raise HTTPException(
-                            status_code=400,
-                            detail=(
-                                "Unable to auto-detect a document column. Please specify document_column."
-                            ),
-                        )
-                new_data = DocLazyFrame(lf, document_column=doc_col)  # type: ignore[misc]
-
-        elif target == "lazyframe":
-            # Convert to Polars LazyFrame
-            if DocLazyFrame is not None and isinstance(data, DocLazyFrame):  # type: ignore[arg-type]
-                new_data = data.to_lazyframe()
-            elif DocDataFrame is not None and isinstance(data, DocDataFrame):  # type: ignore[arg-type]
-                new_data = data.dataframe.lazy()
-            elif isinstance(data, pl.DataFrame):
-                new_data = data.lazy()
-            elif isinstance(data, pl.LazyFrame):
-                new_data = data
-            else:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Unsupported data type for conversion: {type(data).__name__}",
-                )
+    try:
+        operation_name = f"convert_to_{target}"
+
+        source = _frame_kind(data)
+        if source == target and document_column in (
+            None,
+            getattr(data, "document_column", None),
+        ):
+            # Already the requested kind: nothing to convert, record or persist
+            return DocWorkspaceAPIUtils.convert_node_info_for_api(src_node)
+        handler = _CONVERT_HANDLERS.get((source, target)) if source else None
+        if handler is None:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unsupported data type for conversion: {type(data).__name__}",
+            )
+        # Conversions may collect the whole node; run them off the event loop
+        new_data = await asyncio.to_thread(handler, data, document_column)
 
         # Validate conversion result
         if new_data is None:
@@ -1300,7 +2033,7 @@ async def convert_node(
         # Persist workspace
         workspace = workspace_manager.get_workspace(user_id, workspace_id)
         if workspace is not None:
-            workspace_manager.persist(user_id, workspace_id)
+            workspace_manager.persist(user_id, workspace_id, defer=True)
 
         return DocWorkspaceAPIUtils.convert_node_info_for_api(src_node)
 
@@ -1399,8 +2132,6 @@ async def reset_node_document_column(
     if data is None:
         raise HTTPException(status_code=400, detail="Node has no data")
 
-    import polars as pl
-
     try:
         new_data = None
 
@@ -1409,7 +2140,11 @@ async def reset_node_document_column(
             current_col = data.document_column  # type: ignore[attr-defined]
             target_col = document_column
             if not target_col:
-                target_col = DocDataFrame.guess_document_column(data.dataframe)  # type: ignore[attr-defined]
+                target_col = _cached_guess(
+                    DocDataFrame.guess_document_column,  # type: ignore[attr-defined]
+                    data,
+                    data.dataframe,
+                )
             if not target_col:
                 raise HTTPException(
                     status_code=400,
@@ -1432,15 +2167,24 @@ async def reset_node_document_column(
         elif isinstance(data, DocLazyFrame):  # type: ignore[arg-type]
             current_col = data.document_column  # type: ignore[attr-defined]
             target_col = document_column
+            # Resolve the schema once for guessing and validation
+            schema = data.lazyframe.collect_schema()
             if not target_col:
-                target_col = DocLazyFrame.guess_document_column(data.lazyframe)  # type: ignore[attr-defined]
+                # Only string columns pass the dtype check below, so the guesser
+                # only needs to sample those
+                string_cols = [c for c, t in schema.items() if t in (pl.Utf8, pl.String)]
+                if string_cols:
+                    target_col = _cached_guess(
+                        DocLazyFrame.guess_document_column,  # type: ignore[attr-defined]
+                        data,
+                        data.lazyframe.select(string_cols),
+                    )
             if not target_col:
                 raise HTTPException(
                     status_code=400,
                     detail="Unable to auto-detect document column; please provide document_column",
                 )
             # Validate column exists in schema
-            schema = data.lazyframe.collect_schema()
             if target_col not in schema:
                 raise HTTPException(
                     status_code=400,
@@ -1474,7 +2218,7 @@ async def reset_node_document_column(
 
         workspace = workspace_manager.get_workspace(user_id, workspace_id)
         if workspace is not None:
-            workspace_manager.persist(user_id, workspace_id)
+            workspace_manager.persist(user_id, workspace_id, defer=True)
 
         return DocWorkspaceAPIUtils.convert_node_info_for_api(src_node)
     except HTTPException:
@@ -1493,6 +2237,7 @@ async def update_node_name(
     workspace_id: str,
     node_id: str,
     new_name: str,
+    node: Any = Depends(get_workspace_node),
     current_user: dict = Depends(get_current_user),
 ):
     """RESTful node rename endpoint (preferred).
@@ -1501,9 +2246,6 @@ async def update_node_name(
     Accepts new_name as a query parameter (same pattern as workspace rename).
     """
     user_id = current_user["id"]
-    node = workspace_manager.get_node_from_workspace(user_id, workspace_id, node_id)
-    if not node:
-        raise HTTPException(status_code=404, detail="Node not found")
 
     try:
         node.name = new_name
@@ -1511,7 +2253,7 @@ async def update_node_name(
         workspace = workspace_manager.get_workspace(user_id, workspace_id)
         if workspace is not None:
             try:  # noqa: SIM105
-                workspace_manager.persist(user_id, workspace_id)
+                workspace_manager.persist(user_id, workspace_id, defer=True)
             except Exception:  # pragma: no cover
                 logger.exception("Failed to persist workspace after node rename")
         # Return updated node info (consistent shape for frontend)
@@ -1547,28 +2289,15 @@ async def upload_file_to_workspace(
         user_folder = get_user_data_folder(user_id)
         file_path = user_folder / (file.filename or "uploaded_file")
 
-        with open(file_path, "wb") as f:
-            content = await file.read()
-            f.write(content)
-
-        # Load data using utility function
-        data = load_data_file(file_path)
+        # Chunked copy in a worker thread: memory stays flat and the event
+        # loop keeps serving other requests during large uploads
+        await asyncio.to_thread(save_upload, file.file, file_path, file.size)
+        # Same user data folder as the files API: drop its stale metadata
+        invalidate_file_meta(user_id, file.filename or "uploaded_file")
 
-        # Normalize to Polars types
-        # If pandas, convert to Polars (check for pandas specifically)
-        if (
-            hasattr(data, "iloc")
-            and hasattr(data, "dtypes")
-            and not isinstance(data, (pl.DataFrame, pl.LazyFrame))
-        ):
-            # This is pandas - convert to Polars
-            data = pl.DataFrame(data)
-        # Prefer LazyFrame for Polars DataFrames
-        try:
-            if isinstance(data, pl.DataFrame):
-                data = data.lazy()
-        except Exception:
-            pass
+        # Load data using utility function; eager parsers run in a worker thread
+        data = await asyncio.to_thread(_load_as_polars, file_path)
+        _register_parquet_scan(data, file_path)
 
         # Create node using DocWorkspace
         node_name = node_name or file.filename or "uploaded_file"
@@ -1605,6 +2334,32 @@ async def upload_file_to_workspace(
 # ============================================================================
 
 
+# Trailing +HHMM offset; fromisoformat before 3.11 needs +HH:MM
+TZ_OFFSET_NO_COLON_PATTERN = re.compile(r"([+\-]\d{2})(\d{2})$")
+
+# Scalar comparison operators of filter conditions (Polars overloads these)
+FILTER_COMPARISONS: Dict[str, Callable[[Any, Any], Any]] = {
+    "eq": operator.eq,
+    "equals": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "greater_than": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "less_than": operator.lt,
+    "lte": operator.le,
+}
+
+
+def _lazy_node_data(data: Any) -> Any:
+    """Lazy form of node data; docframe wrappers keep their document column"""
+    if isinstance(data, pl.DataFrame):
+        return data.lazy()
+    if DocDataFrame is not None and isinstance(data, DocDataFrame):
+        return _ddf_to_dlf(data, None)
+    return data
+
+
 @router.post("/{workspace_id}/nodes/{node_id}/filter")
 async def filter_node(
     workspace_id: str,
@@ -1622,83 +2377,88 @@ async def filter_node(
             raise ValueError("Node not found")
 
         # Build filter expression from conditions
-        iso_pattern = re.compile(
-            r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}(:\d{2}(\.\d{1,6})?)?(Z|[+\-]\d{2}:?\d{2})$"
-        )
-
         def parse_temporal(val):
             """Parse ISO8601 preserving timezone.
 
             If value matches ISO8601 with timezone or 'Z', convert to aware datetime.
             Otherwise return original value.
             """
-            if isinstance(val, str) and iso_pattern.match(val):
-                s = val
-                if s.endswith("Z"):
-                    s = s[:-1] + "+00:00"
-                # Normalize timezone without colon e.g. +0000 to +00:00
-                if re.search(r"([+\-]\d{2})(\d{2})$", s):
-                    s = re.sub(r"([+\-]\d{2})(\d{2})$", r"\1:\2", s)
+            # Cheap shape check (date, "T", time) before the C parser
+            if not isinstance(val, str) or len(val) < 16 or val[10:11] != "T":
+                return val
+            if val.endswith("Z"):
+                # UTC: parse the naive part and attach the shared timezone.utc
+                # instead of building a "+00:00" string and a new tzinfo
                 try:
-                    dt = datetime.fromisoformat(s)
-                    return dt
-                except Exception:
+                    dt = datetime.fromisoformat(val[:-1])
+                except ValueError:
+                    return val
+                return dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else val
+            try:
+                dt = datetime.fromisoformat(val)
+            except ValueError:
+                # Python < 3.11 rejects offsets without a colon, e.g. +0000
+                try:
+                    dt = datetime.fromisoformat(
+                        TZ_OFFSET_NO_COLON_PATTERN.sub(r"\1:\2", val)
+                    )
+                except ValueError:
                     return val
-            return val
+            # Only timezone-aware values are converted
+            return dt if dt.tzinfo is not None else val
 
         def coerce_scalar(v):
-            # Attempt numeric coercion if appropriate
+            # Attempt numeric coercion if appropriate; only strings that start
+            # like a number pay for a parse attempt (and a possible exception)
             if isinstance(v, str):
-                try:
-                    if "." in v:
-                        return float(v)
-                    return int(v)
-                except Exception:
-                    pass
+                first = v.lstrip()[:1]
+                if first.isdigit() or (first and first in "+-."):
+                    try:
+                        return float(v) if "." in v else int(v)
+                    except ValueError:
+                        pass
             return v
 
-        filter_expr = None
+        source = _lazy_node_data(node.data)
+        # Resolved once; values compared against string columns are used as
+        # sent rather than parsed as datetimes or numbers
+        lazy = (
+            source
+            if isinstance(source, pl.LazyFrame)
+            else getattr(source, "lazyframe", None)
+        )
+        schema = lazy.collect_schema() if isinstance(lazy, pl.LazyFrame) else {}
+
+        exprs: list[pl.Expr] = []
+        # Faceted filters often put several conditions on one column
+        col_cache: Dict[str, pl.Expr] = {}
         for condition in request.conditions:
-            column_expr = pl.col(condition.column)
+            column_expr = col_cache.get(condition.column)
+            if column_expr is None:
+                column_expr = col_cache[condition.column] = pl.col(condition.column)
 
             op = condition.operator
             raw_value = condition.value
 
             expr = None
-            if op in {
-                "eq",
-                "equals",
-                "ne",
-                "gt",
-                "greater_than",
-                "gte",
-                "lt",
-                "less_than",
-                "lte",
-            }:
-                value = parse_temporal(raw_value)
-                value = coerce_scalar(value)
+            compare = FILTER_COMPARISONS.get(op)
+            if compare is not None:
+                if schema.get(condition.column) == pl.String:
+                    value = raw_value
+                else:
+                    value = coerce_scalar(parse_temporal(raw_value))
                 # For aware datetimes ensure we compare with timezone aware columns; Polars expects same time unit & tz
                 lit_val = pl.lit(value) if isinstance(value, datetime) else value
-                if op in {"eq", "equals"}:
-                    expr = column_expr == lit_val
-                elif op == "ne":
-                    expr = column_expr != lit_val
-                elif op in {"gt", "greater_than"}:
-                    expr = column_expr > lit_val
-                elif op == "gte":
-                    expr = column_expr >= lit_val
-                elif op in {"lt", "less_than"}:
-                    expr = column_expr < lit_val
-                elif op == "lte":
-                    expr = column_expr <= lit_val
+                expr = compare(column_expr, lit_val)
             elif op == "contains":
                 # regex flag controls regex vs literal
                 pattern = str(raw_value)
                 if getattr(condition, "regex", False):
                     expr = column_expr.str.contains(pattern)
                 else:
-                    expr = column_expr.str.contains(pl.lit(pattern), literal=True)
+                    # A plain str pattern is a constant substring search;
+                    # pl.lit would make it an expression evaluated per row
+                    expr = column_expr.str.contains(pattern, literal=True)
             elif op == "startswith":
                 # Always use Polars built-in; ignore regex flag per product requirement
                 expr = column_expr.str.starts_with(str(raw_value))
@@ -1710,33 +2470,18 @@ async def filter_node(
             elif op == "is_not_null":
                 expr = column_expr.is_not_null()
             elif op == "between":
-                if isinstance(raw_value, dict):
-                    start_val = (
-                        parse_temporal(raw_value.get("start"))
-                        if raw_value.get("start") is not None
-                        else None
-                    )
-                    end_val = (
-                        parse_temporal(raw_value.get("end"))
-                        if raw_value.get("end") is not None
-                        else None
-                    )
-                    if start_val is not None and end_val is not None:
-                        if isinstance(start_val, datetime):
-                            start_val = pl.lit(start_val)
-                        if isinstance(end_val, datetime):
-                            end_val = pl.lit(end_val)
-                        expr = column_expr.is_between(start_val, end_val, closed="both")
-                    elif start_val is not None:
-                        if isinstance(start_val, datetime):
-                            start_val = pl.lit(start_val)
-                        expr = column_expr >= start_val
-                    elif end_val is not None:
-                        if isinstance(end_val, datetime):
-                            end_val = pl.lit(end_val)
-                        expr = column_expr <= end_val
-                    else:
-                        expr = pl.lit(True)
+                bounds = raw_value if isinstance(raw_value, dict) else {}
+                # Parse each bound once; datetimes compare as literals
+                start = parse_temporal(bounds.get("start"))
+                end = parse_temporal(bounds.get("end"))
+                lo = pl.lit(start) if isinstance(start, datetime) else start
+                hi = pl.lit(end) if isinstance(end, datetime) else end
+                if lo is not None and hi is not None:
+                    expr = column_expr.is_between(lo, hi, closed="both")
+                elif lo is not None:
+                    expr = column_expr >= lo
+                elif hi is not None:
+                    expr = column_expr <= hi
                 else:
                     expr = pl.lit(True)
             else:
@@ -1744,27 +2489,17 @@ async def filter_node(
 
             # Apply negate flag if present
             if getattr(condition, "negate", False) and expr is not None:
-                try:
-                    expr = expr.not_()
-                except Exception:
-                    # Fallback: invert via ~ operator
-                    expr = ~expr
+                expr = ~expr
 
-            if filter_expr is None:
-                filter_expr = expr
-            else:
-                if request.logic == "or":
-                    filter_expr = filter_expr | expr
-                else:  # default to "and"
-                    filter_expr = filter_expr & expr
-
-        # Apply filter using DocWorkspace Node's data manipulation methods
-        if hasattr(node.data, "filter"):
-            # LazyFrame or DataFrame with filter method
-            filtered_data = node.data.filter(filter_expr)
-        else:
-            # Fallback: convert to LazyFrame and filter
-            filtered_data = node.data.lazy().filter(filter_expr)
+            exprs.append(expr)
+
+        # Combine once; logic defaults to "and"
+        combine = operator.or_ if request.logic == "or" else operator.and_
+        filter_expr = functools.reduce(combine, exprs) if exprs else pl.lit(True)
+
+        # Filter lazily, so the predicate is optimized together with the
+        # node's scan and anything later derived from the filtered node
+        filtered_data = source.filter(filter_expr)
 
         # Create new node with filtered data using workspace method
         new_node_name = request.new_node_name or f"{node.name}_filtered"
@@ -1808,8 +2543,13 @@ async def slice_node(
         if not node:
             raise ValueError("Node not found")
 
-        # Apply slicing using DocWorkspace Node's data manipulation methods
-        sliced_data = node.data
+        # One lazy pipeline: nothing is materialized here, and the projection
+        # narrows what the row slice has to carry
+        sliced_data = _lazy_node_data(node.data)
+
+        # Apply column selection if specified
+        if request.columns:
+            sliced_data = sliced_data.select(request.columns)
 
         # Apply row slicing if specified
         if request.start_row is not None or request.end_row is not None:
@@ -1817,18 +2557,7 @@ async def slice_node(
             length = None
             if request.end_row is not None:
                 length = request.end_row - start
-
-            if hasattr(sliced_data, "slice"):
-                sliced_data = sliced_data.slice(start, length)
-            else:
-                sliced_data = sliced_data.lazy().slice(start, length)
-
-        # Apply column selection if specified
-        if request.columns:
-            if hasattr(sliced_data, "select"):
-                sliced_data = sliced_data.select(request.columns)
-            else:
-                sliced_data = sliced_data.lazy().select(request.columns)
+            sliced_data = sliced_data.slice(start, length)
 
         # Create new node with sliced data using workspace method
         new_node_name = request.new_node_name or f"{node.name}_sliced"
@@ -1856,6 +2585,10 @@ async def slice_node(
     return result_obj
 
 
+# Join strategies accepted by join_nodes (Polars names)
+JOIN_HOWS = frozenset({"inner", "left", "right", "full", "semi", "anti", "cross"})
+
+
 @router.post("/{workspace_id}/nodes/join")
 async def join_nodes(
     workspace_id: str,
@@ -1874,23 +2607,20 @@ async def join_nodes(
     user_id = current_user["id"]
     try:
         # Lookup nodes
-        left_node = workspace_manager.get_node_from_workspace(
-            user_id, workspace_id, left_node_id
-        )
-        right_node = workspace_manager.get_node_from_workspace(
-            user_id, workspace_id, right_node_id
+        left_node, right_node = workspace_manager.get_nodes_from_workspace(
+            user_id, workspace_id, [left_node_id, right_node_id]
         )
         if not left_node or not right_node:
             raise HTTPException(status_code=404, detail="One or both nodes not found")
 
-        # Inputs
-        left_data = left_node.data
-        right_data = right_node.data
+        # Inputs, both lazy so the join and anything derived from the joined
+        # node (filters, slices, projections) optimize as one query
+        left_data = _lazy_node_data(left_node.data)
+        right_data = _lazy_node_data(right_node.data)
 
         # Validate and pass-through Polars-supported join strategies only
-        allowed_hows = {"inner", "left", "right", "full", "semi", "anti", "cross"}
         how_val = (how or "inner").lower()
-        if how_val not in allowed_hows:
+        if how_val not in JOIN_HOWS:
             raise HTTPException(
                 status_code=400,
                 detail=(
@@ -1899,8 +2629,9 @@ async def join_nodes(
             )
 
         # Prefer docframe's realization via data.join; handle cross-join separately (no keys)
-        print(type(left_data))
-        print(type(right_data))
+        logger.debug(
+            "join types: %s %s", type(left_data).__name__, type(right_data).__name__
+        )
         if how_val == "cross":
             joined_data = left_data.join(
                 right_data,
@@ -1955,12 +2686,7 @@ async def get_concordance(
             raise HTTPException(status_code=404, detail="Node not found")
 
         # Check if the column exists in the data
-        if hasattr(node.data, "columns"):
-            available_columns = node.data.columns
-        elif hasattr(node.data, "schema"):
-            available_columns = list(node.data.schema.keys())
-        else:
-            available_columns = []
+        available_columns = _schema_columns(node.data)
 
         if available_columns and request.column not in available_columns:
             raise HTTPException(
@@ -1970,67 +2696,74 @@ async def get_concordance(
 
         # Try to use DocFrame text methods if available
         if hasattr(node.data, "text"):
-            # DocFrame integration - use text namespace
-            concordance_result = node.data.text.concordance(
-                column=request.column,
-                search_word=request.search_word,
-                num_left_tokens=request.num_left_tokens,
-                num_right_tokens=request.num_right_tokens,
-                regex=request.regex,
-                case_sensitive=request.case_sensitive,
+            # DocFrame integration - use text namespace. The unsorted result is
+            # cached (shared with the multi-node endpoint), so paging, sorting
+            # and metadata toggles reuse it
+            cache_key = _concordance_cache_key(
+                user_id,
+                workspace_id,
+                node_id,
+                request.column,
+                request.search_word,
+                request.num_left_tokens,
+                request.num_right_tokens,
+                request.regex,
+                request.case_sensitive,
             )
-
-            import polars as pl
+            concordance_result = _get_cached_concordance_df(cache_key, node.data)
+            if concordance_result is None:
+                concordance_result = node.data.text.concordance(
+                    column=request.column,
+                    search_word=request.search_word,
+                    num_left_tokens=request.num_left_tokens,
+                    num_right_tokens=request.num_right_tokens,
+                    regex=request.regex,
+                    case_sensitive=request.case_sensitive,
+                )
+                _store_concordance_df(cache_key, concordance_result, node.data)
 
             # Optionally join metadata (original row) by document_idx when requested
+            late_metadata = False
             if request.show_metadata:
                 # Ensure document_idx exists in concordance_result for join
-                cdf = concordance_result
-                if "document_idx" not in cdf.columns:
-                    cdf = cdf.with_row_index("document_idx")
-                # Materialize original node data and add document_idx
-                base = node.data
-                if hasattr(base, "to_lazyframe"):
-                    base_df = base.to_lazyframe().collect()
-                elif hasattr(base, "_df"):
-                    base_df = base._df  # type: ignore[attr-defined]
-                elif hasattr(base, "collect"):
-                    base_df = base.collect()
+                if "document_idx" not in concordance_result.columns:
+                    concordance_result = concordance_result.with_row_index(
+                        "document_idx"
+                    )
+                sort_by = request.sort_by
+                if sort_by and sort_by not in concordance_result.columns:
+                    # Sorting by a metadata column needs every match's metadata
+                    concordance_result = _join_concordance_metadata(
+                        concordance_result,
+                        node.data,
+                        (user_id, workspace_id, node_id),
+                        page=False,
+                    )
                 else:
-                    base_df = base
-                if isinstance(base_df, pl.LazyFrame):
-                    base_df = base_df.collect()
-                # Align document_idx dtype across both sides before join
-                orig = base_df.with_row_index("document_idx")
-                try:
-                    idx_dtype = cdf.schema.get("document_idx")
-                    if idx_dtype is not None:
-                        orig = orig.with_columns(pl.col("document_idx").cast(idx_dtype))
-                except Exception:
-                    pass
-                # Join original metadata to the right
-                concordance_result = cdf.join(orig, on="document_idx", how="left")
-
-            # Apply sorting if requested (after join so metadata columns are sortable)
-            if request.sort_by and request.sort_by in concordance_result.columns:
-                concordance_result = concordance_result.sort(
-                    pl.col(request.sort_by),
-                    descending=request.sort_order.lower() == "desc",
-                )
+                    # Otherwise only the page's rows are joined, after slicing
+                    late_metadata = True
 
-            # Get total count before pagination
+            # Sort (metadata columns are sortable when joined) and paginate
             total_matches = len(concordance_result)
-
-            # Apply pagination
             start_idx = (request.page - 1) * request.page_size
             end_idx = start_idx + request.page_size
-            paginated_result = concordance_result.slice(start_idx, request.page_size)
+            paginated_result = _concordance_page(
+                concordance_result,
+                request.sort_by,
+                request.sort_order,
+                start_idx,
+                request.page_size,
+            )
+            if late_metadata:
+                paginated_result = _join_concordance_metadata(
+                    paginated_result, node.data, (user_id, workspace_id, node_id)
+                )
 
             # Convert concordance DataFrame to format expected by frontend
             if hasattr(paginated_result, "to_dicts"):
                 return {
                     "data": paginated_result.to_dicts(),
-                    "columns": list(concordance_result.columns),
+                    "columns": list(paginated_result.columns),
                     "total_matches": total_matches,
                     "pagination": {
                         "page": request.page,
@@ -2125,10 +2858,7 @@ async def get_concordance(
         raise
     except Exception as e:
         # Log and handle unexpected errors
-        import traceback
-
-        print(f"❌ Unexpected concordance error: {str(e)}")
-        print(f"Traceback: {traceback.format_exc()}")
+        logger.exception("Unexpected concordance error")
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
@@ -2151,11 +2881,105 @@ async def get_multi_node_concordance(
                 status_code=400, detail="Maximum 2 nodes supported for comparison"
             )
 
-        results = {}
-        full_dfs = []  # store full cached dfs for combined view
-        per_node_columns = {}
+        def _shape_node_result(node_id: str, node: Any, concordance_result):
+            """Metadata join and page for one node (blocking Polars work)"""
+            # Work on a non-mutating sorted view for this request
+            working_df = concordance_result
+            # If metadata requested, join original row by document_idx. The
+            # combined view and metadata sorts need it on every match;
+            # otherwise only the page's rows are joined after slicing
+            late_metadata = False
+            if request.show_metadata:
+                try:
+                    if "document_idx" not in working_df.columns:
+                        working_df = working_df.with_row_index("document_idx")
+                    if request.combined or (
+                        request.sort_by and request.sort_by not in working_df.columns
+                    ):
+                        working_df = _join_concordance_metadata(
+                            working_df,
+                            node.data,
+                            (user_id, workspace_id, node_id),
+                            page=False,
+                        )
+                    else:
+                        late_metadata = True
+                except Exception as je:
+                    logger.warning(
+                        "Failed to join metadata for node %s: %s", node_id, je
+                    )
+            # The combined view re-sorts the concatenated frames itself, so
+            # only this node's page needs sorting
+            total_matches = len(working_df)
+            start_idx = (request.page - 1) * request.page_size
+            end_idx = start_idx + request.page_size
+            paginated_result = _concordance_page(
+                working_df,
+                request.sort_by,
+                request.sort_order,
+                start_idx,
+                request.page_size,
+            )
+            if late_metadata:
+                try:
+                    paginated_result = _join_concordance_metadata(
+                        paginated_result, node.data, (user_id, workspace_id, node_id)
+                    )
+                except Exception as je:
+                    logger.warning(
+                        "Failed to join metadata for node %s: %s", node_id, je
+                    )
 
-        for node_id in request.node_ids:
+            node_name = node.name if hasattr(node, "name") and node.name else node_id
+            columns = list(paginated_result.columns)
+            df_with_source = None
+            if hasattr(paginated_result, "to_dicts"):
+                entry = {
+                    "data": paginated_result.to_dicts(),
+                    "columns": list(paginated_result.columns),
+                    "total_matches": total_matches,
+                    "pagination": {
+                        "page": request.page,
+                        "page_size": request.page_size,
+                        "total_pages": (total_matches + request.page_size - 1)
+                        // request.page_size,
+                        "has_next": end_idx < total_matches,
+                        "has_prev": request.page > 1,
+                    },
+                    "sorting": {
+                        "sort_by": request.sort_by,
+                        "sort_order": request.sort_order,
+                    },
+                }
+                if request.combined:
+                    try:
+                        df_with_source = working_df.with_columns(
+                            pl.lit(node_name).alias("__source_node")
+                        )  # type: ignore
+                    except Exception:
+                        pass
+            else:
+                entry = {
+                    "data": [],
+                    "columns": [],
+                    "total_matches": 0,
+                    "pagination": {
+                        "page": 1,
+                        "page_size": request.page_size,
+                        "total_pages": 0,
+                        "has_next": False,
+                        "has_prev": False,
+                    },
+                    "sorting": {
+                        "sort_by": request.sort_by,
+                        "sort_order": request.sort_order,
+                    },
+                }
+            return node_name, columns, entry, df_with_source
+
+        async def _run_one_node(node_id: str):
+            """One node's result; the concordance cache is only touched here,
+            on the event loop, while the Polars work runs in worker threads"""
             # Fetch node
             node = workspace_manager.get_node_from_workspace(
                 user_id, workspace_id, node_id
@@ -2171,12 +2995,7 @@ async def get_multi_node_concordance(
                 )
 
             # Validate column existence if we can introspect
-            if hasattr(node.data, "columns"):
-                available_columns = node.data.columns
-            elif hasattr(node.data, "schema"):
-                available_columns = list(node.data.schema.keys())
-            else:
-                available_columns = []
+            available_columns = _schema_columns(node.data)
             if available_columns and column not in available_columns:
                 raise HTTPException(
                     status_code=400,
@@ -2195,12 +3014,14 @@ async def get_multi_node_concordance(
                 request.regex,
                 request.case_sensitive,
             )
-            concordance_result = _get_cached_concordance_df(cache_key)
+            concordance_result = _get_cached_concordance_df(cache_key, node.data)
 
             # Compute if not cached
             if concordance_result is None:
                 if hasattr(node.data, "text"):
-                    concordance_result = node.data.text.concordance(
+                    # Polars releases the GIL, so the nodes compute in parallel
+                    concordance_result = await asyncio.to_thread(
+                        node.data.text.concordance,
                         column=column,
                         search_word=request.search_word,
                         num_left_tokens=request.num_left_tokens,
@@ -2213,91 +3034,24 @@ async def get_multi_node_concordance(
                         status_code=400,
                         detail=f"Node {node_id} does not support text operations",
                     )
-                _store_concordance_df(cache_key, concordance_result)  # store unsorted
-
-            # Work on a non-mutating sorted view for this request
-            working_df = concordance_result
-            # If metadata requested, join original row by document_idx
-            if request.show_metadata:
-                try:
-                    cdf = working_df
-                    if "document_idx" not in cdf.columns:
-                        cdf = cdf.with_row_index("document_idx")
-                    base = node.data
-                    if hasattr(base, "to_lazyframe"):
-                        base_df = base.to_lazyframe().collect()
-                    elif hasattr(base, "_df"):
-                        base_df = base._df  # type: ignore[attr-defined]
-                    elif hasattr(base, "collect"):
-                        base_df = base.collect()
-                    else:
-                        base_df = base
-                    if isinstance(base_df, pl.LazyFrame):
-                        base_df = base_df.collect()
-                    orig = base_df.with_row_index("document_idx")
-                    working_df = cdf.join(orig, on="document_idx", how="left")
-                except Exception as je:
-                    logger.warning(f"Failed to join metadata for node {node_id}: {je}")
-            if (
-                request.sort_by
-                and hasattr(working_df, "columns")
-                and request.sort_by in working_df.columns
-            ):  # type: ignore
-                working_df = working_df.sort(
-                    pl.col(request.sort_by),
-                    descending=request.sort_order.lower() == "desc",
-                )  # type: ignore
-
-            total_matches = len(working_df)
-            start_idx = (request.page - 1) * request.page_size
-            end_idx = start_idx + request.page_size
-            paginated_result = working_df.slice(start_idx, request.page_size)
+                # store unsorted
+                _store_concordance_df(cache_key, concordance_result, node.data)
+            return await asyncio.to_thread(
+                _shape_node_result, node_id, node, concordance_result
+            )
 
-            node_name = node.name if hasattr(node, "name") and node.name else node_id
-            per_node_columns[node_name] = list(working_df.columns)
-            if hasattr(paginated_result, "to_dicts"):
-                results[node_name] = {
-                    "data": paginated_result.to_dicts(),
-                    "columns": list(working_df.columns),
-                    "total_matches": total_matches,
-                    "pagination": {
-                        "page": request.page,
-                        "page_size": request.page_size,
-                        "total_pages": (total_matches + request.page_size - 1)
-                        // request.page_size,
-                        "has_next": end_idx < total_matches,
-                        "has_prev": request.page > 1,
-                    },
-                    "sorting": {
-                        "sort_by": request.sort_by,
-                        "sort_order": request.sort_order,
-                    },
-                }
-                if request.combined:
-                    try:
-                        df_with_source = working_df.with_columns(
-                            pl.lit(node_name).alias("__source_node")
-                        )  # type: ignore
-                        full_dfs.append(df_with_source)
-                    except Exception:
-                        pass
-            else:
-                results[node_name] = {
-                    "data": [],
-                    "columns": [],
-                    "total_matches": 0,
-                    "pagination": {
-                        "page": 1,
-                        "page_size": request.page_size,
-                        "total_pages": 0,
-                        "has_next": False,
-                        "has_prev": False,
-                    },
-                    "sorting": {
-                        "sort_by": request.sort_by,
-                        "sort_order": request.sort_order,
-                    },
-                }
+        results = {}
+        full_dfs = []  # store full cached dfs for combined view
+        per_node_columns = {}
+        # gather keeps request.node_ids order
+        node_results = await asyncio.gather(
+            *(_run_one_node(node_id) for node_id in request.node_ids)
+        )
+        for node_name, columns, entry, df_with_source in node_results:
+            per_node_columns[node_name] = columns
+            results[node_name] = entry
+            if df_with_source is not None:
+                full_dfs.append(df_with_source)
 
         # Build combined view dynamically (uncached)
         if request.combined and len(full_dfs) >= 2:
@@ -2362,10 +3116,7 @@ async def get_multi_node_concordance(
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
-
-        print(f"❌ Unexpected multi-node concordance error: {str(e)}")
-        print(f"Traceback: {traceback.format_exc()}")
+        logger.exception("Unexpected multi-node concordance error")
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
@@ -2431,10 +3182,7 @@ async def get_concordance_detail(
         raise
     except Exception as e:
         # Log and handle unexpected errors
-        import traceback
-
-        print(f"❌ Unexpected concordance detail error: {str(e)}")
-        print(f"Traceback: {traceback.format_exc()}")
+        logger.exception("Unexpected concordance detail error")
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
@@ -2455,12 +3203,7 @@ async def get_frequency_analysis(
             raise HTTPException(status_code=404, detail="Node not found")
 
         # Check if the time column exists in the data
-        if hasattr(node.data, "columns"):
-            available_columns = node.data.columns
-        elif hasattr(node.data, "schema"):
-            available_columns = list(node.data.schema.keys())
-        else:
-            available_columns = []
+        available_columns = _schema_columns(node.data)
 
         if available_columns and request.time_column not in available_columns:
             raise HTTPException(
@@ -2539,10 +3282,7 @@ async def get_frequency_analysis(
         raise
     except Exception as e:
         # Log and handle unexpected errors
-        import traceback
-
-        print(f"❌ Unexpected frequency analysis error: {str(e)}")
-        print(f"Traceback: {traceback.format_exc()}")
+        logger.exception("Unexpected frequency analysis error")
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
@@ -2569,8 +3309,6 @@ async def cast_node(
         Dictionary with the updated node information after casting
     """
     try:
-        import polars as pl
-
         user_id = current_user["id"]
 
         # Validate cast_data structure
@@ -2685,18 +3423,7 @@ async def cast_node(
             elif target_lower in ("string", "utf8", "str", "text"):
                 # Datetime -> string (optionally with format) or no-op if already string
                 # Detect current dtype (best effort)
-                try:
-                    if (
-                        hasattr(current_df, "schema")
-                        and column_name in current_df.schema
-                    ):  # DataFrame
-                        col_dtype = current_df.schema[column_name]
-                    elif hasattr(current_df, "collect_schema"):  # LazyFrame
-                        col_dtype = current_df.collect_schema().get(column_name, None)
-                    else:
-                        col_dtype = None
-                except Exception:
-                    col_dtype = None
+                col_dtype = _schema_dtype(current_df, column_name)
 
                 if str(col_dtype).startswith("Datetime"):
                     if datetime_format:
@@ -2770,7 +3497,7 @@ async def cast_node(
 
             # Save workspace to disk
             # Ensure current workspace is persisted after casting
-            workspace_manager.persist(user_id, workspace_id)
+            workspace_manager.persist(user_id, workspace_id, defer=True)
             # Get new data type for response
             if hasattr(casted_data, "collect"):
                 # LazyFrame - use collect_schema to avoid warning
@@ -2863,14 +3590,9 @@ async def calculate_token_frequencies(
                 status_code=404, detail=f"Workspace {workspace_id} not found"
             )
 
-        # Import required classes
-        try:
-            import polars as pl
-
-            from docframe import DocDataFrame, DocLazyFrame
-        except ImportError as e:
+        if not _DOC_TYPES:
             raise HTTPException(
-                status_code=500, detail=f"Required libraries not available: {str(e)}"
+                status_code=500, detail="Required libraries not available: docframe"
             )
 
         # Get nodes and validate they exist, create frames with selected columns
@@ -2893,17 +3615,7 @@ async def calculate_token_frequencies(
                 is_lazy = isinstance(node_data, (DocLazyFrame, pl.LazyFrame))
 
                 # Get available columns
-                if hasattr(node_data, "columns"):
-                    # For DataFrames and DocDataFrames
-                    available_columns = node_data.columns
-                elif hasattr(node_data, "collect_schema"):
-                    # For LazyFrames and DocLazyFrames - use efficient schema access
-                    available_columns = list(node_data.collect_schema().keys())
-                elif hasattr(node_data, "schema"):
-                    # Fallback for other types with schema
-                    available_columns = list(node_data.schema.keys())
-                else:
-                    available_columns = []
+                available_columns = _schema_columns(node_data)
 
                 # Determine the column to use
                 column_name = request.node_columns.get(node_id)
@@ -2956,16 +3668,7 @@ async def calculate_token_frequencies(
                     # recent delegation change) returns a raw polars frame when the
                     # original document column is dropped, causing compute_token_frequencies
                     # to raise a TypeError. We now explicitly re-wrap.
-                    try:  # Local import to avoid mandatory dependency at module load
-                        from docframe import DocDataFrame as _DDF  # type: ignore
-                        from docframe import DocLazyFrame as _DLF
-                    except Exception as _e:  # pragma: no cover
-                        raise HTTPException(
-                            status_code=500,
-                            detail=f"docframe not available for token frequency: {_e}",
-                        )
-
-                    if isinstance(node_data, _DLF):
+                    if isinstance(node_data, DocLazyFrame):
                         if column_name == node_data.document_column:
                             processed_frame = node_data
                         else:
@@ -2973,7 +3676,7 @@ async def calculate_token_frequencies(
                             selected_lazy = base_lazy.select(
                                 pl.col(column_name).alias("document")
                             )
-                            processed_frame = _DLF(
+                            processed_frame = DocLazyFrame(
                                 selected_lazy, document_column="document"
                             )
                     else:  # DocDataFrame
@@ -2999,7 +3702,7 @@ async def calculate_token_frequencies(
                                     status_code=500,
                                     detail="Failed to materialize DataFrame for token frequency calculation",
                                 )
-                            processed_frame = _DDF(
+                            processed_frame = DocDataFrame(
                                 selected_df_any, document_column="document"
                             )
                 else:
@@ -3133,12 +3836,7 @@ async def detach_concordance(
             raise HTTPException(status_code=404, detail="Node not found")
 
         # Check if the column exists in the data
-        if hasattr(node.data, "columns"):
-            available_columns = node.data.columns
-        elif hasattr(node.data, "schema"):
-            available_columns = list(node.data.schema.keys())
-        else:
-            available_columns = []
+        available_columns = _schema_columns(node.data)
 
         if available_columns and request.column not in available_columns:
             raise HTTPException(
@@ -3167,8 +3865,6 @@ async def detach_concordance(
                 concordance_with_idx = concordance_result
 
             # Simplified eager path: always materialize underlying data, perform join eagerly.
-            import polars as pl
-
             if "DocLazyFrame" in type(node.data).__name__ and hasattr(
                 node.data, "to_lazyframe"
             ):
@@ -3212,32 +3908,17 @@ async def detach_concordance(
                 )
                 new_node_name = f"{original_name}_conc_{request.search_word}"
 
-            # Wrap back as DocDataFrame if original was Doc*Frame and original doc column still present
-            try:  # pragma: no cover (optional wrapping for client use)
-                from docframe import DocDataFrame as _DDF  # type: ignore
-                from docframe import DocLazyFrame as _DLF
-
-                if isinstance(node.data, (_DDF, _DLF)):
-                    doc_col = getattr(node.data, "document_column", None)
-                    if doc_col and doc_col in final_data.columns:
-                        _ = _DDF(
-                            final_data, document_column=doc_col
-                        )  # constructed for potential future use
-            except Exception:
-                pass
-
             data_for_node = final_data
             # If original was Doc type, wrap result as DocDataFrame preserving document column
-            try:  # pragma: no cover (best-effort wrapping)
-                from docframe import DocDataFrame as _DDF  # type: ignore
-                from docframe import DocLazyFrame as _DLF  # type: ignore
-
-                if isinstance(node.data, (_DDF, _DLF)):
-                    doc_col = getattr(node.data, "document_column", None)
-                    if doc_col and doc_col in final_data.columns:
-                        data_for_node = _DDF(final_data, document_column=doc_col)
-            except Exception:
-                pass
+            if isinstance(node.data, _DOC_TYPES):
+                doc_col = getattr(node.data, "document_column", None)
+                if doc_col and doc_col in final_data.columns:
+                    try:  # pragma: no cover (best-effort wrapping)
+                        data_for_node = DocDataFrame(
+                            final_data, document_column=doc_col
+                        )
+                    except Exception:
+                        pass
 
             new_node = workspace_manager.add_node_to_workspace(
                 user_id=user_id,
@@ -40,6 +40,13 @@ class Settings(BaseSettings):
     # Server Configuration
     server_host: str = Field(default="0.0.0.0", description="Server host")
     server_port: int = Field(default=8001, description="Server port")
+    server_workers: int = Field(
+        default=1,
+        description="Uvicorn worker processes (open workspaces are held per process)",
+    )
+    server_limit_concurrency: int | None = Field(
+        default=1024, description="Max concurrent connections before returning 503"
+    )
     debug: bool = Field(default=False, description="Debug mode")
 
     # CORS Configuration - using string field to avoid JSON parsing issues
@@ -3,12 +3,14 @@ Authentication utilities and dependencies
 """
 
 import logging
+from pathlib import Path
 from typing import Optional
 
 from fastapi import Depends, Header, HTTPException
 
 from ..config import settings
 from ..db import validate_access_token
+from .utils import get_user_data_folder
 
 logger = logging.getLogger(__name__)
 
@@ -77,3 +79,10 @@ def require_admin(current_user: dict = Depends(get_current_user)):
     """Dependency to require admin privileges"""
     # TODO: Implement admin role checking logic
     return current_user
+
+
+async def get_current_user_data_folder(
+    current_user: dict = Depends(get_current_user),
+) -> Path:
+    """Dependency resolving the current user's data folder once per request"""
+    return get_user_data_folder(current_user["id"])
@@ -0,0 +1,132 @@
+"""
+Lightweight file metadata helpers for listing-heavy endpoints.
+
+On Linux we call ``statx`` directly with ``AT_STATX_DONT_SYNC`` and a reduced
+field mask (type, size, ctime, mtime) so network filesystems can answer from
+cached attributes. Everywhere else (or on kernels/libcs without ``statx``) the
+helpers fall back to ``os.stat``.
+"""
+
+import ctypes
+import errno
+import os
+import sys
+from typing import NamedTuple, Union
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+# Constants from <linux/fcntl.h> and <linux/stat.h>
+_AT_FDCWD = -100
+_AT_SYMLINK_NOFOLLOW = 0x100
+_AT_STATX_DONT_SYNC = 0x4000
+_STATX_TYPE = 0x0001
+_STATX_MTIME = 0x0040
+_STATX_CTIME = 0x0080
+_STATX_SIZE = 0x0200
+_STATX_MASK = _STATX_TYPE | _STATX_SIZE | _STATX_CTIME | _STATX_MTIME
+
+
+class _StatxTimestamp(ctypes.Structure):
+    _fields_ = [
+        ("tv_sec", ctypes.c_int64),
+        ("tv_nsec", ctypes.c_uint32),
+        ("_reserved", ctypes.c_int32),
+    ]
+
+
+class _Statx(ctypes.Structure):
+    _fields_ = [
+        ("stx_mask", ctypes.c_uint32),
+        ("stx_blksize", ctypes.c_uint32),
+        ("stx_attributes", ctypes.c_uint64),
+        ("stx_nlink", ctypes.c_uint32),
+        ("stx_uid", ctypes.c_uint32),
+        ("stx_gid", ctypes.c_uint32),
+        ("stx_mode", ctypes.c_uint16),
+        ("_spare0", ctypes.c_uint16),
+        ("stx_ino", ctypes.c_uint64),
+        ("stx_size", ctypes.c_uint64),
+        ("stx_blocks", ctypes.c_uint64),
+        ("stx_attributes_mask", ctypes.c_uint64),
+        ("stx_atime", _StatxTimestamp),
+        ("stx_btime", _StatxTimestamp),
+        ("stx_ctime", _StatxTimestamp),
+        ("stx_mtime", _StatxTimestamp),
+        ("stx_rdev_major", ctypes.c_uint32),
+        ("stx_rdev_minor", ctypes.c_uint32),
+        ("stx_dev_major", ctypes.c_uint32),
+        ("stx_dev_minor", ctypes.c_uint32),
+        # Trailing space reserved by the kernel (struct statx is 256 bytes)
+        ("_spare", ctypes.c_uint64 * 14),
+    ]
+
+
+def _load_statx():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        fn = ctypes.CDLL("libc.so.6", use_errno=True).statx
+    except (OSError, AttributeError):
+        return None
+    fn.argtypes = [
+        ctypes.c_int,
+        ctypes.c_char_p,
+        ctypes.c_int,
+        ctypes.c_uint,
+        ctypes.POINTER(_Statx),
+    ]
+    fn.restype = ctypes.c_int
+    return fn
+
+
+_statx = _load_statx()
+
+
+class FastStat(NamedTuple):
+    """Subset of ``os.stat_result`` used by the file endpoints."""
+
+    st_mode: int
+    st_size: int
+    st_ctime: float
+    st_mtime: float
+
+
+def _from_os_stat(st: os.stat_result) -> FastStat:
+    return FastStat(st.st_mode, st.st_size, st.st_ctime, st.st_mtime)
+
+
+def fast_stat(path: PathLike, follow_symlinks: bool = True) -> FastStat:
+    """Return type/size/ctime/mtime for ``path``.
+
+    Raises the same ``OSError`` subclasses as ``os.stat`` (e.g.
+    ``FileNotFoundError``) so callers can treat both paths identically.
+    """
+    global _statx
+    if _statx is not None:
+        buf = _Statx()
+        flags = _AT_STATX_DONT_SYNC
+        if not follow_symlinks:
+            flags |= _AT_SYMLINK_NOFOLLOW
+        rc = _statx(_AT_FDCWD, os.fsencode(path), flags, _STATX_MASK, ctypes.byref(buf))
+        if rc == 0:
+            return FastStat(
+                buf.stx_mode,
+                buf.stx_size,
+                buf.stx_ctime.tv_sec + buf.stx_ctime.tv_nsec / 1e9,
+                buf.stx_mtime.tv_sec + buf.stx_mtime.tv_nsec / 1e9,
+            )
+        err = ctypes.get_errno()
+        if err != errno.ENOSYS:
+            raise OSError(err, os.strerror(err), os.fspath(path))
+        # Kernel without statx: stop trying and use os.stat from now on
+        _statx = None
+    return _from_os_stat(os.stat(path, follow_symlinks=follow_symlinks))
+
+
+def fast_exists(path: PathLike) -> bool:
+    """Cheap existence check built on :func:`fast_stat`."""
+    try:
+        fast_stat(path)
+    except (OSError, ValueError):
+        return False
+    return True
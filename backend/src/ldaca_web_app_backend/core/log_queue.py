@@ -0,0 +1,52 @@
+"""Background logging for the backend's own loggers.
+
+Records from ``ldaca_web_app_backend.*`` are put on a queue by a
+``QueueHandler`` and formatted/written to stderr by a ``QueueListener`` thread,
+so request handlers (notably exception paths that format tracebacks) never
+block on stream I/O.
+"""
+
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+PACKAGE_LOGGER = "ldaca_web_app_backend"
+
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[QueueHandler] = None
+
+
+def start_log_listener(level: int = logging.INFO) -> None:
+    """Route package logs through a queue to a background stderr writer"""
+    global _listener, _queue_handler
+    if _listener is not None:
+        return
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    stream = logging.StreamHandler(sys.stderr)
+    stream.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    )
+    _listener = QueueListener(log_queue, stream, respect_handler_level=True)
+    _queue_handler = QueueHandler(log_queue)
+
+    logger = logging.getLogger(PACKAGE_LOGGER)
+    logger.addHandler(_queue_handler)
+    logger.setLevel(level)
+    logger.propagate = False
+    _listener.start()
+
+
+def stop_log_listener() -> None:
+    """Flush queued records and detach the queue handler"""
+    global _listener, _queue_handler
+    if _listener is None:
+        return
+    logger = logging.getLogger(PACKAGE_LOGGER)
+    if _queue_handler is not None:
+        logger.removeHandler(_queue_handler)
+    logger.propagate = True
+    _listener.stop()
+    _listener = None
+    _queue_handler = None
@@ -0,0 +1,210 @@
+"""Backend-side helpers for topic modeling.
+
+docframe's ``topic_visualization`` owns the BERTopic fit. These helpers prepare
+optional inputs for it (e.g. precomputed embeddings) and only pass keyword
+arguments the installed docframe version actually accepts, so older versions
+keep working with their default pipeline.
+"""
+
+import inspect
+import logging
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# BERTopic's default English sentence-transformer
+DEFAULT_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+
+
+@lru_cache(maxsize=8)
+def _accepted_kwargs(fn: Callable[..., Any]) -> Optional[FrozenSet[str]]:
+    """Keyword names ``fn`` accepts, or None if it takes ``**kwargs``"""
+    try:
+        params = inspect.signature(fn).parameters.values()
+    except (TypeError, ValueError):
+        return frozenset()
+    if any(p.kind is inspect.Parameter.VAR_KEYWORD for p in params):
+        return None
+    return frozenset(p.name for p in params)
+
+
+def accepts_kwarg(fn: Callable[..., Any], name: str) -> bool:
+    accepted = _accepted_kwargs(fn)
+    return accepted is None or name in accepted
+
+
+def hashed_embeddings(docs: List[str], n_components: int = 100):
+    """Cheap document embeddings: hashed n-grams -> TF-IDF -> truncated SVD.
+
+    Hashing is a single streaming pass with fixed memory (no vocabulary), and
+    the three differently sized hash spaces make collisions between the same
+    terms unlikely to line up. Orders of magnitude faster than a transformer
+    embedding pass on CPU, at some cost in topic quality.
+    """
+    from sklearn.decomposition import TruncatedSVD
+    from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+    from sklearn.pipeline import make_pipeline, make_union
+
+    n_components = max(2, min(n_components, len(docs) - 1))
+    pipe = make_pipeline(
+        make_union(
+            HashingVectorizer(n_features=10_000),
+            HashingVectorizer(n_features=9_000),
+            HashingVectorizer(n_features=8_000),
+        ),
+        TfidfTransformer(),
+        TruncatedSVD(n_components=n_components),
+    )
+    return pipe.fit_transform(docs)
+
+
+def embed_unique(docs: List[str], encode: Callable[[List[str]], Any]):
+    """Embed each distinct document once and expand rows back to ``docs`` order.
+
+    Reposts and boilerplate make exact duplicates common in social media
+    corpora; they get identical embeddings anyway, so only the distinct texts
+    go through ``encode``. Every document keeps its own row, so topic sizes and
+    per-corpus counts are unchanged.
+    """
+    import numpy as np
+
+    index: Dict[str, int] = {}
+    inverse = np.fromiter(
+        (index.setdefault(doc, len(index)) for doc in docs),
+        dtype=np.intp,
+        count=len(docs),
+    )
+    if len(index) == len(docs):
+        return encode(docs)
+    return encode(list(index))[inverse]
+
+
+@lru_cache(maxsize=1)
+def _cuml_available() -> bool:
+    """True when RAPIDS cuML imports and a CUDA device is visible"""
+    try:
+        import cuml  # type: ignore  # noqa: F401
+        from cupy.cuda import runtime  # type: ignore
+
+        return runtime.getDeviceCount() > 0
+    except Exception:
+        return False
+
+
+def gpu_cluster_models(min_topic_size: int) -> Dict[str, Any]:
+    """GPU UMAP + HDBSCAN for BERTopic, or {} to keep the CPU defaults.
+
+    Mirrors BERTopic's default reducer/clusterer settings so only the device
+    changes; on tens of thousands of documents this turns minutes into seconds.
+    """
+    if not _cuml_available():
+        return {}
+    from cuml.cluster import HDBSCAN  # type: ignore
+    from cuml.manifold import UMAP  # type: ignore
+
+    return {
+        "umap_model": UMAP(n_components=5, n_neighbors=15, min_dist=0.0),
+        "hdbscan_model": HDBSCAN(
+            min_cluster_size=min_topic_size, prediction_data=True
+        ),
+    }
+
+
+@lru_cache(maxsize=2)
+def quantized_embedding_model(model_name: str = DEFAULT_EMBEDDING_MODEL):
+    """Sentence-transformer with its Linear layers dynamically quantized to int8.
+
+    Dynamic int8 quantization roughly halves the weight bandwidth of the
+    transformer and typically gives a 2-4x CPU speedup with negligible loss
+    for sentence embeddings. Loaded once per process since loading dominates
+    short runs.
+
+    Documents need no length-sorting before they reach this model:
+    ``SentenceTransformer.encode`` already orders inputs by length, batches
+    similar lengths together to minimise padding, and restores the original
+    order in its output.
+    """
+    import torch
+    from sentence_transformers import SentenceTransformer  # type: ignore
+
+    model = SentenceTransformer(model_name, device="cpu")
+    return torch.quantization.quantize_dynamic(
+        model, {torch.nn.Linear}, dtype=torch.qint8
+    )
+
+
+def resolve_embedding_options(
+    topic_visualization: Callable[..., dict], fast_embed: bool, quantize: bool
+) -> Tuple[bool, bool]:
+    """The (fast_embed, quantize) options ``topic_visualization`` can honour.
+
+    Requested options it has no keyword for are logged and dropped, so callers
+    can leave them out of cache keys. The fast path takes precedence over
+    quantization.
+    """
+    if fast_embed and not accepts_kwarg(topic_visualization, "embeddings"):
+        logger.warning(
+            "topic_visualization has no embeddings= option; ignoring fast_embed"
+        )
+        fast_embed = False
+    quantize = quantize and not fast_embed
+    if quantize and not accepts_kwarg(topic_visualization, "embedding_model"):
+        logger.warning(
+            "topic_visualization has no embedding_model= option; ignoring quantize"
+        )
+        quantize = False
+    return fast_embed, quantize
+
+
+def run_topic_visualization(
+    topic_visualization: Callable[..., dict],
+    corpora: List[List[str]],
+    min_topic_size: int,
+    use_ctfidf: bool,
+    fast_embed: bool = False,
+    quantize: bool = False,
+) -> dict:
+    """Call ``topic_visualization`` with whatever optional inputs it supports.
+
+    Blocking; callers in async handlers should run it in a worker thread.
+    """
+    extra: Dict[str, Any] = {}
+    takes_embeddings = accepts_kwarg(topic_visualization, "embeddings")
+    fast_embed, quantize = resolve_embedding_options(
+        topic_visualization, fast_embed, quantize
+    )
+
+    def flat_docs() -> List[str]:
+        # Embeddings follow the concatenated corpora order
+        return [doc for docs in corpora for doc in docs]
+
+    if fast_embed:
+        extra["embeddings"] = embed_unique(flat_docs(), hashed_embeddings)
+    elif quantize:
+        model = quantized_embedding_model()
+        extra["embedding_model"] = model
+        if takes_embeddings:
+            extra["embeddings"] = embed_unique(flat_docs(), model.encode)
+        else:
+            logger.info(
+                "topic_visualization has no embeddings= option; "
+                "duplicate documents are embedded individually"
+            )
+
+    if accepts_kwarg(topic_visualization, "umap_model") and accepts_kwarg(
+        topic_visualization, "hdbscan_model"
+    ):
+        extra.update(gpu_cluster_models(min_topic_size))
+    elif _cuml_available():
+        logger.warning(
+            "topic_visualization has no umap_model=/hdbscan_model= options; "
+            "clustering on CPU despite an available GPU"
+        )
+
+    return topic_visualization(
+        corpora=corpora,
+        min_topic_size=min_topic_size,
+        use_ctfidf=use_ctfidf,
+        **extra,
+    )
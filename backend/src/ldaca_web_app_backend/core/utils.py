@@ -2,20 +2,44 @@
 Core utilities for the LDaCA Web App
 """
 
+import os
 import shutil
+import time
 import uuid
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Union
+from typing import IO, Any, Dict, Optional, Union
 
 import pandas as pd
 import polars as pl
 
 from ..config import config
+from .fs_fast import fast_stat
 
 # Direct imports - assuming proper package installation
 # (Optional) Import heavy libs lazily where needed to reduce import cost.
 
 
+# Folders created recently (str path -> timestamp), so per-request lookups can
+# skip the mkdir syscall. The TTL bounds how long an externally removed folder
+# goes unnoticed.
+ENSURED_FOLDER_TTL = 60.0
+_ENSURED_FOLDERS: Dict[str, float] = {}
+
+# Uploads are copied to disk in chunks of this size to keep memory flat
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+
+def _ensure_folder(folder: Path) -> None:
+    """mkdir -p ``folder`` unless it was ensured within the TTL"""
+    key = str(folder)
+    now = time.time()
+    if now - _ENSURED_FOLDERS.get(key, 0.0) < ENSURED_FOLDER_TTL:
+        return
+    folder.mkdir(parents=True, exist_ok=True)
+    _ENSURED_FOLDERS[key] = now
+
+
 def get_user_data_folder(user_id: str) -> Path:
     """Get user-specific data folder with proper structure"""
     # In single-user mode, always use 'user_root' folder
@@ -27,7 +51,7 @@ def get_user_data_folder(user_id: str) -> Path:
     # Base under DATA_ROOT/users/<folder_name>
     user_folder = config.get_data_root() / config.user_data_folder / folder_name
     user_data_folder = user_folder / "user_data"
-    user_data_folder.mkdir(parents=True, exist_ok=True)
+    _ensure_folder(user_data_folder)
     return user_data_folder
 
 
@@ -42,7 +66,7 @@ def get_user_workspace_folder(user_id: str) -> Path:
     # Base under DATA_ROOT/users/<folder_name>
     user_folder = config.get_data_root() / config.user_data_folder / folder_name
     workspace_folder = user_folder / "user_workspaces"
-    workspace_folder.mkdir(parents=True, exist_ok=True)
+    _ensure_folder(workspace_folder)
     return workspace_folder
 
 
@@ -94,31 +118,67 @@ def copy_sample_data_to_user(user_id: str) -> None:
 
 def get_file_size_mb(file_path: Path) -> float:
     """Get file size in MB"""
-    return file_path.stat().st_size / (1024 * 1024) if file_path.exists() else 0.0
+    try:
+        return fast_stat(file_path).st_size / (1024 * 1024)
+    except OSError:
+        return 0.0
 
 
 def get_folder_size_mb(folder_path: Path) -> float:
     """Get total size of folder in MB"""
+    # scandir without following symlinks: type checks come from the directory
+    # entry and each file costs a single lstat
     total_size = 0
-    for file_path in folder_path.rglob("*"):
-        if file_path.is_file():
-            total_size += file_path.stat().st_size
+    stack = [str(folder_path)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total_size += entry.stat(follow_symlinks=False).st_size
+        except FileNotFoundError:
+            continue
     return total_size / (1024 * 1024)
 
 
+# Lowercased file suffix -> file type, built once at import
+FILE_TYPE_MAP: Dict[str, str] = {
+    ".csv": "csv",
+    ".json": "json",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".parquet": "parquet",
+    ".xlsx": "excel",
+    ".txt": "text",
+    ".tsv": "tsv",
+}
+
+
+def save_upload(src: IO[bytes], dest: Path, size: Optional[int] = None) -> int:
+    """Copy an uploaded file object to ``dest`` in chunks; return bytes written.
+
+    When the size is known up front the target is preallocated in one call so
+    the filesystem can reserve contiguous extents instead of growing the file
+    chunk by chunk.
+    """
+    with open(dest, "wb") as buffer:
+        if size and hasattr(os, "posix_fallocate"):
+            try:
+                os.posix_fallocate(buffer.fileno(), 0, size)
+            except OSError:
+                pass  # not supported by this filesystem; plain writes still work
+        shutil.copyfileobj(src, buffer, UPLOAD_CHUNK_SIZE)
+        written = buffer.tell()
+        if size and written < size:
+            buffer.truncate(written)
+        return written
+
+
 def detect_file_type(filename: str) -> str:
     """Detect file type from extension"""
-    ext = Path(filename).suffix.lower()
-    type_map = {
-        ".csv": "csv",
-        ".json": "json",
-        ".jsonl": "jsonl",
-        ".parquet": "parquet",
-        ".xlsx": "excel",
-        ".txt": "text",
-        ".tsv": "tsv",
-    }
-    return type_map.get(ext, "unknown")
+    return FILE_TYPE_MAP.get(os.path.splitext(filename)[1].lower(), "unknown")
 
 
 def load_data_file(
@@ -138,6 +198,9 @@ def load_data_file(
         elif file_type == "json":
             # JSON doesn't have scan_json, fall back to read_json
             return pl.read_json(file_path)
+        elif file_type == "jsonl":
+            # Line-delimited JSON scans lazily, like CSV and Parquet
+            return pl.scan_ndjson(file_path)
         elif file_type == "tsv":
             return pl.scan_csv(file_path, separator="\t")
     except Exception as e:
@@ -148,6 +211,8 @@ def load_data_file(
         return pd.read_csv(file_path)
     elif file_type == "json":
         return pd.read_json(file_path)
+    elif file_type == "jsonl":
+        return pd.read_json(file_path, lines=True)
     elif file_type == "parquet":
         return pd.read_parquet(file_path)
     elif file_type == "excel":
@@ -362,6 +427,38 @@ def serialize_dataframe_for_json(df) -> Dict[str, Any]:
         }
 
 
+def probe_schema(file_path: Path, file_type: str) -> Dict[str, Any]:
+    """
+    Describe a data file from its header/footer only.
+
+    Returns the same shape as serialize_dataframe_for_json without materializing
+    the file. Parquet row counts come from the footer metadata; CSV/TSV rows are
+    counted by a streaming scan that never holds the data in memory. Other
+    formats fall back to load_data_file + serialize_dataframe_for_json.
+    """
+    if file_type == "parquet":
+        lf = pl.scan_parquet(file_path)
+        row_count = lf.select(pl.len()).collect().item()
+    elif file_type in ("csv", "tsv"):
+        separator = "\t" if file_type == "tsv" else ","
+        lf = pl.scan_csv(file_path, separator=separator)
+        row_count = lf.select(pl.len()).collect().item()
+    else:
+        return serialize_dataframe_for_json(load_data_file(file_path))
+
+    schema = lf.collect_schema()
+    preview_df = lf.head(5).collect()
+    return {
+        "shape": (row_count, len(schema)),
+        "columns": list(schema.names()),
+        "dtypes": {col: str(dtype) for col, dtype in schema.items()},
+        "preview": preview_df.to_pandas().fillna("None").to_dict(orient="records"),
+        "is_text_data": False,
+        "data_type": f"{type(lf).__module__}.{type(lf).__name__}",
+        "is_lazy": True,
+    }
+
+
 def generate_node_id() -> str:
     """Generate a unique node ID"""
     return str(uuid.uuid4())
@@ -372,13 +469,19 @@ def generate_workspace_id() -> str:
     return str(uuid.uuid4())
 
 
+@lru_cache(maxsize=1024)
+def _resolved_folder_prefix(folder: str) -> str:
+    """Resolve a user folder once and return it with a trailing separator"""
+    return os.path.join(os.path.realpath(folder), "")
+
+
 def validate_file_path(file_path: Path, user_folder: Path) -> bool:
     """Validate that file path is within user's allowed directory"""
-    try:
-        file_path.resolve().relative_to(user_folder.resolve())
-        return True
-    except ValueError:
-        return False
+    # The user folder is fixed per user, so its resolution is cached; only the
+    # requested path needs a realpath() per call.
+    prefix = _resolved_folder_prefix(os.fspath(user_folder))
+    resolved = os.path.join(os.path.realpath(file_path), "")
+    return resolved.startswith(prefix)
 
 
 def convert_to_react_flow_graph(generic_graph: Dict[str, Any]) -> Dict[str, Any]:
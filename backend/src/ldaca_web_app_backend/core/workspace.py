@@ -8,9 +8,12 @@ Design Goals:
 * Backward compatibility deliberately dropped.
 """
 
+import asyncio
+import logging
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import polars as pl
 
@@ -18,12 +21,21 @@ from docworkspace import Node, Workspace  # type: ignore
 
 from .utils import generate_workspace_id, get_user_workspace_folder
 
+logger = logging.getLogger(__name__)
+
+# Deferred saves (persist(..., defer=True)) wait this long, so a burst of edits
+# to one workspace is written out as a single serialization
+PERSIST_DEBOUNCE_SECONDS = 2.0
+
 
 class WorkspaceManager:
     """Single-workspace-per-user in-memory manager."""
 
     def __init__(self) -> None:
         self._current: Dict[str, Dict[str, Any]] = {}
+        self._pending_saves: Dict[Tuple[str, str], asyncio.TimerHandle] = {}
+        # Serializes workspace file writes, which may run in worker threads
+        self._write_lock = threading.Lock()
 
     # ---------------- Core helpers ----------------
     def _get_current_entry(self, user_id: str) -> tuple[Optional[str], Optional[Any]]:
@@ -33,11 +45,33 @@ class WorkspaceManager:
         return entry.get("id"), entry.get("ws")
 
     def _save(self, user_id: str, workspace_id: str, workspace: Workspace) -> None:
+        self.begin_save(user_id, workspace_id, workspace)
+        self.write_workspace_file(user_id, workspace_id, workspace)
+
+    def begin_save(self, user_id: str, workspace_id: str, workspace: Workspace) -> None:
+        """First half of a save; call on the event loop thread.
+
+        Cancels any deferred save (its TimerHandle is not thread-safe) and
+        stamps ``modified_at``.
+        """
+        pending = self._pending_saves.pop((user_id, workspace_id), None)
+        if pending is not None:
+            pending.cancel()
+        workspace.set_metadata("modified_at", datetime.now().isoformat())
+
+    def write_workspace_file(
+        self, user_id: str, workspace_id: str, workspace: Workspace
+    ) -> None:
+        """Second half of a save: serialize ``workspace`` to its file.
+
+        Safe in a worker thread, but handlers may edit the live workspace
+        meanwhile, so offloaded writes should be given a copy of it.
+        """
         user_folder = get_user_workspace_folder(user_id)
         user_folder.mkdir(parents=True, exist_ok=True)
-        workspace.set_metadata("modified_at", datetime.now().isoformat())
         workspace_file = user_folder / f"workspace_{workspace_id}.json"
-        workspace.serialize(workspace_file)
+        with self._write_lock:
+            workspace.serialize(workspace_file)
 
     def _load(self, user_id: str, workspace_id: str) -> Workspace | None:
         if not Workspace:
@@ -217,6 +251,15 @@ class WorkspaceManager:
             return None
         return ws.get_node(node_id)
 
+    def get_nodes_from_workspace(
+        self, user_id: str, workspace_id: str, node_ids: List[str]
+    ) -> List[Optional[Any]]:
+        """Look up several nodes with a single workspace resolution"""
+        ws = self.get_workspace(user_id, workspace_id)
+        if ws is None:
+            return [None] * len(node_ids)
+        return [ws.get_node(node_id) for node_id in node_ids]
+
     def delete_node_from_workspace(
         self, user_id: str, workspace_id: str, node_id: str
     ) -> bool:
@@ -283,11 +326,57 @@ class WorkspaceManager:
         self._save(user_id, workspace_id, ws)
         return result
 
-    def persist(self, user_id: str, workspace_id: str) -> None:
+    def persist(self, user_id: str, workspace_id: str, defer: bool = False) -> None:
+        """Save the workspace to disk.
+
+        With ``defer=True`` (and a running event loop) ``modified_at`` is
+        stamped now but the file write is scheduled PERSIST_DEBOUNCE_SECONDS
+        later; further deferred requests in that window are coalesced. Switching,
+        unloading or deleting the workspace still saves immediately, so only a
+        crash can lose the pending edits.
+        """
+        if defer:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+            if loop is not None:
+                cid, cws = self._get_current_entry(user_id)
+                # Not resident: it was saved when switched away (or deleted)
+                if cid != workspace_id or cws is None:
+                    return
+                cws.set_metadata("modified_at", datetime.now().isoformat())
+                key = (user_id, workspace_id)
+                if key not in self._pending_saves:
+                    self._pending_saves[key] = loop.call_later(
+                        PERSIST_DEBOUNCE_SECONDS,
+                        self._deferred_save,
+                        user_id,
+                        workspace_id,
+                    )
+                return
         ws = self.get_workspace(user_id, workspace_id)
         if ws is not None:
             self._save(user_id, workspace_id, ws)
 
+    def _deferred_save(self, user_id: str, workspace_id: str) -> None:
+        self._pending_saves.pop((user_id, workspace_id), None)
+        cid, cws = self._get_current_entry(user_id)
+        # Not resident any more: it was saved when switched away (or deleted)
+        if cid != workspace_id or cws is None:
+            return
+        # modified_at was already stamped by persist(), only the write remains
+        try:
+            self.write_workspace_file(user_id, workspace_id, cws)
+        except Exception:  # pragma: no cover
+            logger.exception("Deferred save of workspace %s failed", workspace_id)
+
+    def flush_pending_saves(self) -> None:
+        """Run every deferred save now (e.g. on shutdown)"""
+        for user_id, workspace_id in list(self._pending_saves):
+            self._pending_saves.pop((user_id, workspace_id)).cancel()
+            self._deferred_save(user_id, workspace_id)
+
 
 # Global singleton
 workspace_manager = WorkspaceManager()
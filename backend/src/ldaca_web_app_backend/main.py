@@ -7,6 +7,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 # Import API routers
 from .api.admin import router as admin_router
@@ -17,6 +18,8 @@ from .api.text import router as text_router
 from .api.users import router as users_router
 from .api.workspaces import router as workspaces_router
 from .config import settings
+from .core.log_queue import start_log_listener, stop_log_listener
+from .core.workspace import workspace_manager
 from .db import cleanup_expired_sessions, init_db
 
 # Ensure DocWorkspace classes are extended with API methods (e.g., to_api_graph)
@@ -32,6 +35,7 @@ except Exception:
 async def lifespan(app: FastAPI):
     """Application lifespan manager"""
     # Startup
+    start_log_listener()
     print("🚀 Starting LDaCA Web App...")
     print("=" * 50)
     print("🔧 DocFrame: ✅ Available")
@@ -59,7 +63,9 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     print("👋 Shutting down Enhanced LDaCA Web App API...")
+    workspace_manager.flush_pending_saves()
     await cleanup_expired_sessions()
+    stop_log_listener()
 
 
 # Create FastAPI application
@@ -68,6 +74,8 @@ app = FastAPI(
     version="3.0.0",
     description="Multi-user text analysis platform with workspace management and DocFrame integration",
     lifespan=lifespan,
+    # orjson encodes large previews/listings much faster than stdlib json
+    default_response_class=ORJSONResponse,
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
@@ -213,10 +221,17 @@ if __name__ == "__main__":
 
     print("🚀 Starting Enhanced LDaCA Web App API server...")
 
+    # Workers and reload both need an import string rather than the app object.
+    # loop/http "auto" pick uvloop and httptools when installed (uvicorn[standard]).
     uvicorn.run(
-        app,
+        "ldaca_web_app_backend.main:app",
         host=settings.server_host,
         port=settings.server_port,
         reload=settings.debug,
+        workers=None if settings.debug else settings.server_workers,
+        loop="auto",
+        http="auto",
+        backlog=2048,
+        limit_concurrency=settings.server_limit_concurrency,
         log_level="info",
     )
@@ -498,6 +498,11 @@ class TopicModelingRequest(BaseModel):
     node_columns: Optional[Dict[str, str]] = None  # Maps node_id -> column_name
     min_topic_size: Optional[int] = 5
     use_ctfidf: Optional[bool] = False
+    # Hashed TF-IDF + SVD embeddings instead of the transformer model (opt-in:
+    # much faster on large corpora, at some cost in topic quality)
+    fast_embed: Optional[bool] = False
+    # int8-quantized transformer embeddings (CPU); ignored on the fast path
+    quantize: Optional[bool] = False
 
     class Config:
         json_schema_extra = {
@@ -26,6 +26,10 @@ def start_server_async(host="localhost", port=8001):
         log_level="info",
         timeout_keep_alive=30,
         lifespan="on",
+        # Runs on the caller's loop, so only the HTTP parser is selectable here
+        http="auto",
+        backlog=2048,
+        limit_concurrency=1024,
     )
     _server = uvicorn.Server(config)
     loop = asyncio.get_running_loop()
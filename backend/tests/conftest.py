@@ -406,3 +406,31 @@ def test_user_cleanup():
                 shutil.rmtree(folder_path)
             except Exception as e:
                 print(f"Warning: Could not remove {folder_path}: {e}")
+
+
+@pytest.fixture(autouse=True)
+def empty_caches():
+    """Start and finish every test with empty module-level API caches"""
+    from ldaca_web_app_backend.api import files, workspaces
+
+    def clear():
+        for cache in (
+            workspaces.CONCORDANCE_CACHE,
+            workspaces.CONCORDANCE_INDEX,
+            workspaces.CONCORDANCE_METADATA_CACHE,
+            workspaces.TOPIC_MODELING_CACHE,
+            workspaces.DOCUMENT_COLUMN_GUESS_CACHE,
+            workspaces.GUESS_CACHE,
+            workspaces.PARQUET_SCANS,
+            workspaces.NODE_SHAPE_CACHE,
+            workspaces.NODE_INFO_CACHE,
+            workspaces.UNIQUE_VALUES_CACHE,
+            files.FILE_META_CACHE,
+        ):
+            cache.clear()
+        workspaces._concordance_cache_bytes = 0
+        workspaces._concordance_last_hit = None
+
+    clear()
+    yield
+    clear()
@@ -567,22 +567,20 @@ class TestWorkspaceAPI:
 
         with (
             patch(
-                "ldaca_web_app_backend.api.workspaces.workspace_manager.get_node_from_workspace"
-            ) as mock_get_node,
+                "ldaca_web_app_backend.api.workspaces.workspace_manager.get_nodes_from_workspace"
+            ) as mock_get_nodes,
             patch(
                 "ldaca_web_app_backend.api.workspaces.workspace_manager.add_node_to_workspace",
                 return_value=joined_node,
             ),
         ):
             # Configure node retrieval
-            def get_node_side_effect(use_id, workspace_id, node_id):
-                if node_id == "left-node-id":
-                    return left_node
-                elif node_id == "right-node-id":
-                    return right_node
-                return None
-
-            mock_get_node.side_effect = get_node_side_effect
+            nodes = {"left-node-id": left_node, "right-node-id": right_node}
+
+            def get_nodes_side_effect(user_id, workspace_id, node_ids):
+                return [nodes.get(node_id) for node_id in node_ids]
+
+            mock_get_nodes.side_effect = get_nodes_side_effect
 
             # Test join with the new parameter format (matching frontend)
             response = self.client.post(
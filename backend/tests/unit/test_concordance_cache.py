@@ -0,0 +1,102 @@
+"""
+Tests for the concordance result cache
+"""
+
+from unittest.mock import patch
+
+import polars as pl
+
+from ldaca_web_app_backend.api import workspaces
+from ldaca_web_app_backend.api.workspaces import (
+    _clear_concordance_cache_for,
+    _concordance_cache_key,
+    _get_cached_concordance_df,
+    _store_concordance_df,
+)
+
+
+def _key(node_id: str):
+    return _concordance_cache_key("u", "w", node_id, "text", "cat", 5, 5, False, False)
+
+
+class TestConcordanceCache:
+    """Test LRU and size bounds of the concordance cache"""
+
+    def test_store_and_get(self):
+        """Test that stored frames are returned on lookup"""
+        df = pl.DataFrame({"left": ["a"], "matched": ["cat"], "right": ["b"]})
+        _store_concordance_df(_key("n1"), df)
+
+        assert _get_cached_concordance_df(_key("n1")).equals(df)
+        assert _get_cached_concordance_df(_key("n2")) is None
+
+    def test_entries_stored_as_ipc(self):
+        """Test that entries hold Arrow IPC bytes that decode to the frame"""
+        df = pl.DataFrame({"matched": ["cat", "cats"], "document_idx": [0, 3]})
+        _store_concordance_df(_key("n1"), df)
+        _store_concordance_df(_key("n2"), df)  # n1 is no longer the hot entry
+
+        entry = workspaces.CONCORDANCE_CACHE[_key("n1")]
+        assert isinstance(entry["ipc"], bytes)
+        assert entry["bytes"] == len(entry["ipc"])
+        decoded = _get_cached_concordance_df(_key("n1"))
+        assert decoded.equals(df)
+        # Back-to-back hits reuse the decoded frame
+        assert _get_cached_concordance_df(_key("n1")) is decoded
+
+    def test_evicts_least_recently_used(self):
+        """Test that the entry limit evicts the least recently used key"""
+        df = pl.DataFrame({"x": [1]})
+        with patch.object(workspaces, "CONCORDANCE_CACHE_MAX_ENTRIES", 2):
+            _store_concordance_df(_key("n1"), df)
+            _store_concordance_df(_key("n2"), df)
+            _get_cached_concordance_df(_key("n1"))  # n2 is now oldest
+            _store_concordance_df(_key("n3"), df)
+
+        assert _get_cached_concordance_df(_key("n1")) is not None
+        assert _get_cached_concordance_df(_key("n2")) is None
+        assert _get_cached_concordance_df(_key("n3")) is not None
+
+    def test_byte_budget(self):
+        """Test that the byte budget evicts old entries and tracks totals"""
+        df = pl.DataFrame({"x": list(range(1000))})
+        _store_concordance_df(_key("n0"), df)
+        size = workspaces.CONCORDANCE_CACHE[_key("n0")]["bytes"]
+        _clear_concordance_cache_for("u", "w")
+        with patch.object(workspaces, "CONCORDANCE_CACHE_MAX_BYTES", size * 2):
+            for node in ("n1", "n2", "n3"):
+                _store_concordance_df(_key(node), df)
+
+        assert len(workspaces.CONCORDANCE_CACHE) == 2
+        assert workspaces._concordance_cache_bytes == size * 2
+
+        assert _clear_concordance_cache_for("u", "w") == 2
+        assert workspaces._concordance_cache_bytes == 0
+
+    def test_clear_uses_workspace_index(self):
+        """Test clears only touch the workspace's keys and keep the index in sync"""
+        df = pl.DataFrame({"x": [1]})
+        other = _concordance_cache_key("u", "w2", "n1", "text", "cat", 5, 5, False, False)
+        _store_concordance_df(_key("n1"), df)
+        _store_concordance_df(_key("n2"), df)
+        _store_concordance_df(other, df)
+
+        assert _clear_concordance_cache_for("u", "w") == 2
+        assert list(workspaces.CONCORDANCE_CACHE) == [other]
+        assert dict(workspaces.CONCORDANCE_INDEX) == {("u", "w2"): {other}}
+
+        # Evicted entries leave the index too
+        with patch.object(workspaces, "CONCORDANCE_CACHE_MAX_ENTRIES", 1):
+            _store_concordance_df(_key("n3"), df)
+        assert dict(workspaces.CONCORDANCE_INDEX) == {("u", "w"): {_key("n3")}}
+
+    def test_replaced_node_data_misses(self):
+        """Test that a result computed from replaced node data is not returned"""
+        df = pl.DataFrame({"x": [1, 2]})
+        before = pl.DataFrame({"text": ["a"]})
+        after = pl.DataFrame({"text": ["a"]})
+        _store_concordance_df(_key("n1"), df, before)
+
+        assert _get_cached_concordance_df(_key("n1"), before).equals(df)
+        assert _get_cached_concordance_df(_key("n1"), after) is None
+        assert _key("n1") not in workspaces.CONCORDANCE_CACHE
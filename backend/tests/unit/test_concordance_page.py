@@ -0,0 +1,95 @@
+"""
+Tests for concordance result pagination
+"""
+
+import polars as pl
+
+from ldaca_web_app_backend.api.workspaces import (
+    CONCORDANCE_METADATA_CACHE,
+    _concordance_metadata,
+    _concordance_page,
+    _join_concordance_metadata,
+)
+
+
+class TestConcordancePage:
+    """Test sorted pages taken from a concordance frame"""
+
+    def test_sorted_page_matches_full_sort(self):
+        """Test that a page equals the same slice of a fully sorted frame"""
+        df = pl.DataFrame({"matched": list("dbeacf"), "document_idx": range(6)})
+
+        page = _concordance_page(df, "matched", "asc", 2, 2)
+        assert page["matched"].to_list() == ["c", "d"]
+
+        page = _concordance_page(df, "matched", "DESC", 0, 3)
+        assert page["matched"].to_list() == ["f", "e", "d"]
+
+    def test_unknown_sort_column_keeps_order(self):
+        """Test that an absent or empty sort column only slices"""
+        df = pl.DataFrame({"matched": ["b", "a", "c"]})
+
+        assert _concordance_page(df, "missing", "asc", 1, 5)["matched"].to_list() == [
+            "a",
+            "c",
+        ]
+        assert _concordance_page(df, None, "asc", 0, 1)["matched"].to_list() == ["b"]
+
+
+class TestConcordanceMetadata:
+    """Test joining original node rows onto concordance rows"""
+
+    def test_joins_only_requested_documents(self):
+        """Test that page rows get their own document's metadata"""
+        base = pl.DataFrame({"text": ["a", "b", "c", "d"], "year": [1, 2, 3, 4]})
+        page = pl.DataFrame(
+            {"matched": ["x", "y", "z"], "document_idx": [3, 1, 3]},
+            schema_overrides={"document_idx": pl.Int64},
+        )
+
+        joined = _join_concordance_metadata(page, base.lazy())
+
+        assert joined["matched"].to_list() == ["x", "y", "z"]
+        assert joined["year"].to_list() == [4, 2, 4]
+        assert joined.schema["document_idx"] == pl.Int64
+
+    def test_sorted_page_order_kept_after_join(self):
+        """Test that joining metadata keeps a sorted page's row order"""
+        base = pl.DataFrame({"year": list(range(100))})
+        matches = pl.DataFrame(
+            {"matched": [f"w{i:03d}" for i in range(200)]}
+        ).with_columns((pl.int_range(200) * 7 % 100).alias("document_idx"))
+
+        page = _concordance_page(matches, "matched", "desc", 10, 50)
+        joined = _join_concordance_metadata(page, base)
+
+        assert joined["matched"].to_list() == page["matched"].to_list()
+        assert joined["document_idx"].to_list() == page["document_idx"].to_list()
+        assert joined["year"].to_list() == page["document_idx"].to_list()
+
+    def test_metadata_rows_filtered_by_ids(self):
+        """Test that only the requested row indices are materialized"""
+        base = pl.DataFrame({"text": ["a", "b", "c"]})
+
+        rows = _concordance_metadata(base, pl.UInt32, pl.Series([2, 0]))
+
+        assert sorted(rows["document_idx"].to_list()) == [0, 2]
+
+    def test_full_join_cached_per_node_data(self):
+        """Test that a full join caches indexed rows until the data changes"""
+        key = ("user", "ws", "node")
+        base = pl.DataFrame({"text": ["a", "b"], "year": [1, 2]})
+        matches = pl.DataFrame({"document_idx": [1, 0]})
+        CONCORDANCE_METADATA_CACHE.pop(key, None)
+
+        joined = _join_concordance_metadata(matches, base, key, page=False)
+        assert joined["year"].to_list() == [2, 1]
+        assert CONCORDANCE_METADATA_CACHE[key][0]() is base
+
+        page = _join_concordance_metadata(matches.head(1), base, key)
+        assert page["year"].to_list() == [2]
+
+        replaced = pl.DataFrame({"text": ["a", "b"], "year": [5, 6]})
+        joined = _join_concordance_metadata(matches, replaced, key, page=False)
+        assert joined["year"].to_list() == [6, 5]
+        CONCORDANCE_METADATA_CACHE.pop(key, None)
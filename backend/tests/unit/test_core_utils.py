@@ -5,6 +5,7 @@ Tests for core utilities
 from unittest.mock import MagicMock, patch
 
 import pandas as pd
+import polars as pl
 import pytest
 from ldaca_web_app_backend.core.utils import (
     detect_file_type,
@@ -15,6 +16,7 @@ from ldaca_web_app_backend.core.utils import (
     get_user_data_folder,
     get_user_workspace_folder,
     load_data_file,
+    probe_schema,
     serialize_dataframe_for_json,
     setup_user_folders,
     validate_file_path,
@@ -51,6 +53,17 @@ class TestUserFolders:
         assert folder == expected_path
         assert folder.exists()
 
+    @patch("ldaca_web_app_backend.core.utils.config")
+    def test_get_user_data_folder_skips_repeat_mkdir(self, mock_config, temp_dir):
+        """Test that a recently ensured folder is not created again"""
+        mock_config.get_data_root.return_value = temp_dir
+        mock_config.user_data_folder = "users"
+
+        folder = get_user_data_folder("repeat_user")
+        with patch("pathlib.Path.mkdir") as mock_mkdir:
+            assert get_user_data_folder("repeat_user") == folder
+        mock_mkdir.assert_not_called()
+
     @patch("ldaca_web_app_backend.core.utils.config")
     def test_setup_user_folders(self, mock_config, temp_dir):
         """Test setting up complete user folder structure"""
@@ -112,12 +125,24 @@ class TestFileOperations:
         total_size = get_folder_size_mb(temp_dir)
         assert abs(total_size - 1.5) < 0.1  # Should be approximately 1.5MB
 
+    def test_get_folder_size_mb_nested_without_symlinks(self, temp_dir):
+        """Test that nested files count and symlinked files are not followed"""
+        nested = temp_dir / "a" / "b"
+        nested.mkdir(parents=True)
+        target = nested / "data.txt"
+        target.write_text("x" * (1024 * 1024))
+        (temp_dir / "link.txt").symlink_to(target)
+
+        total_size = get_folder_size_mb(temp_dir)
+        assert abs(total_size - 1.0) < 0.1
+
     def test_detect_file_type(self):
         """Test file type detection"""
         test_cases = [
             ("data.csv", "csv"),
             ("document.json", "json"),
             ("logs.jsonl", "jsonl"),
+            ("events.ndjson", "jsonl"),
             ("table.parquet", "parquet"),
             ("spreadsheet.xlsx", "excel"),
             ("notes.txt", "text"),
@@ -178,6 +203,16 @@ class TestFileOperations:
         assert "age" in columns
         assert "city" in columns
 
+    def test_load_data_file_jsonl_is_lazy(self, temp_dir):
+        """Test that JSON Lines files are scanned lazily"""
+        jsonl_file = temp_dir / "test.jsonl"
+        jsonl_file.write_text('{"name": "a", "age": 1}\n{"name": "b", "age": 2}\n')
+
+        df = load_data_file(jsonl_file)
+
+        assert hasattr(df, "collect")
+        assert df.collect().shape == (2, 2)
+
     def test_load_data_file_unsupported(self, temp_dir):
         """Test loading unsupported file type"""
         unsupported_file = temp_dir / "test.xyz"
@@ -351,6 +386,29 @@ class TestDataFrameUtils:
         assert result["is_text_data"] is True
 
 
+    def test_probe_schema_csv(self, sample_csv_file):
+        """Test schema probe for CSV reports columns and the counted rows"""
+        result = probe_schema(sample_csv_file, "csv")
+
+        assert result["columns"] == ["name", "age", "city"]
+        assert result["shape"] == (3, 3)
+        assert set(result["dtypes"]) == {"name", "age", "city"}
+        assert len(result["preview"]) == 3
+        assert result["is_lazy"] is True
+
+    def test_probe_schema_parquet(self, temp_dir):
+        """Test schema probe for Parquet takes the row count from metadata"""
+        parquet_file = temp_dir / "sample.parquet"
+        pl.DataFrame({"text": ["a", "b", "c", "d"], "n": [1, 2, 3, 4]}).write_parquet(
+            parquet_file
+        )
+
+        result = probe_schema(parquet_file, "parquet")
+
+        assert result["shape"] == (4, 2)
+        assert result["columns"] == ["text", "n"]
+
+
 class TestUtilityFunctions:
     """Test general utility functions"""
 
@@ -404,3 +462,13 @@ class TestUtilityFunctions:
         malicious_path = user_folder / ".." / "secret.txt"
 
         assert validate_file_path(malicious_path, user_folder) is False
+
+    def test_validate_file_path_sibling_prefix(self, temp_dir):
+        """Test that a sibling folder sharing the name prefix is rejected"""
+        user_folder = temp_dir / "user_data"
+        user_folder.mkdir()
+        sibling = temp_dir / "user_data_other"
+        sibling.mkdir()
+
+        assert validate_file_path(user_folder, user_folder) is True
+        assert validate_file_path(sibling / "data.csv", user_folder) is False
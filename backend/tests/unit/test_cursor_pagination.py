@@ -0,0 +1,49 @@
+"""
+Tests for cursor (keyset) pagination of node data
+"""
+
+from datetime import date
+
+import polars as pl
+
+from ldaca_web_app_backend.api.workspaces import _cursor_page
+
+
+class TestCursorPage:
+    """Test pages that follow a cursor on a monotonic column"""
+
+    def test_walks_pages_with_next_cursor(self):
+        """Test that following next_cursor visits every row once"""
+        lazy = pl.LazyFrame({"id": list(range(1, 8)), "text": list("abcdefg")})
+
+        first, cursor, has_next = _cursor_page(lazy, "id", None, 3)
+        assert first["id"].to_list() == [1, 2, 3]
+        assert cursor == "3"
+        assert has_next
+
+        second, cursor, has_next = _cursor_page(lazy, "id", cursor, 3)
+        assert second["id"].to_list() == [4, 5, 6]
+        assert has_next
+
+        last, cursor, has_next = _cursor_page(lazy, "id", cursor, 3)
+        assert last["id"].to_list() == [7]
+        assert cursor == "7"
+        assert not has_next
+
+    def test_empty_page_after_last_row(self):
+        """Test that a cursor past the end returns no rows and no cursor"""
+        lazy = pl.LazyFrame({"id": [1, 2]})
+
+        page, cursor, has_next = _cursor_page(lazy, "id", "2", 5)
+        assert page.height == 0
+        assert cursor is None
+        assert not has_next
+
+    def test_temporal_cursor_round_trips(self):
+        """Test that a date cursor string casts back to the column dtype"""
+        lazy = pl.LazyFrame({"day": [date(2024, 1, d) for d in range(1, 5)]})
+
+        _, cursor, _ = _cursor_page(lazy, "day", None, 2)
+        page, _, has_next = _cursor_page(lazy, "day", cursor, 2)
+        assert page["day"].to_list() == [date(2024, 1, 3), date(2024, 1, 4)]
+        assert not has_next
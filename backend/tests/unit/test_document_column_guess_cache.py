@@ -0,0 +1,64 @@
+"""
+Tests for the document column guess caches
+"""
+
+import os
+from unittest.mock import Mock
+
+from ldaca_web_app_backend.api.workspaces import (
+    _cached_guess,
+    _guess_file_document_column,
+)
+
+
+class TestDocumentColumnGuessCache:
+    """Test caching of guessed document columns by file version"""
+
+    def test_reuses_guess_for_unchanged_file(self, sample_csv_file):
+        """Test that an unchanged file is only guessed once"""
+        guess = Mock(return_value="name")
+
+        assert _guess_file_document_column(sample_csv_file, None, guess) == "name"
+        assert _guess_file_document_column(sample_csv_file, None, guess) == "name"
+        assert guess.call_count == 1
+
+    def test_modified_file_is_guessed_again(self, sample_csv_file):
+        """Test that a new mtime invalidates the cached guess"""
+        guess = Mock(side_effect=["name", "city"])
+        _guess_file_document_column(sample_csv_file, None, guess)
+
+        st = sample_csv_file.stat()
+        os.utime(sample_csv_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert _guess_file_document_column(sample_csv_file, None, guess) == "city"
+
+    def test_failed_guess_not_cached(self, sample_csv_file):
+        """Test that empty guesses are retried"""
+        guess = Mock(return_value=None)
+        _guess_file_document_column(sample_csv_file, None, guess)
+        _guess_file_document_column(sample_csv_file, None, guess)
+        assert guess.call_count == 2
+
+
+class TestCachedGuess:
+    """Test guesses memoized per node data object"""
+
+    def test_reuses_guess_for_same_data(self):
+        """Test that the same data object is only guessed once"""
+        data = object()
+        guess = Mock(return_value="text")
+
+        assert _cached_guess(guess, data) == "text"
+        assert _cached_guess(guess, data) == "text"
+        assert guess.call_count == 1
+
+    def test_guesses_on_frame_keyed_by_data(self):
+        """Test that the frame is guessed on while the cache follows the data"""
+        data, frame = object(), object()
+        guess = Mock(return_value="text")
+
+        _cached_guess(guess, data, frame)
+
+        guess.assert_called_once_with(frame)
+        assert _cached_guess(guess, object()) == "text"
+        assert guess.call_count == 2
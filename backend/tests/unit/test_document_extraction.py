@@ -0,0 +1,34 @@
+"""
+Tests for extracting topic modeling documents from node columns
+"""
+
+import polars as pl
+
+from ldaca_web_app_backend.api.workspaces import _document_text_expr, _schema_dtype
+
+
+def _extract(df, column):
+    lazy = df.lazy()
+    expr = _document_text_expr(column, _schema_dtype(lazy, column))
+    return lazy.select(expr).collect().get_column("__doc_col__").to_list()
+
+
+class TestDocumentTextExpr:
+    """Test dtype-specialised conversion of document columns to strings"""
+
+    def test_string_column(self):
+        """Test that string columns only have nulls filled"""
+        df = pl.DataFrame({"text": ["a", None, "c"]})
+        assert _extract(df, "text") == ["a", "", "c"]
+
+    def test_numeric_column(self):
+        """Test that numeric columns are cast to strings"""
+        df = pl.DataFrame({"n": [1, None, 3]})
+        assert _extract(df, "n") == ["1", "", "3"]
+
+    def test_nested_column(self):
+        """Test that list columns fall back to per-value formatting"""
+        df = pl.DataFrame({"tags": [["a", "b"], None]})
+        docs = _extract(df, "tags")
+        assert docs[1] == ""
+        assert "a" in docs[0] and "b" in docs[0]
@@ -0,0 +1,135 @@
+"""
+Tests for file preview and upload helpers
+"""
+
+import asyncio
+import io
+import json
+from unittest.mock import Mock, patch
+
+import polars as pl
+import pytest
+from fastapi import HTTPException
+
+from ldaca_web_app_backend.api import files
+from ldaca_web_app_backend.api.files import (
+    _build_preview,
+    _get_file_meta,
+    _lazy_scan,
+    _read_json_array_head,
+)
+from ldaca_web_app_backend.core.utils import save_upload
+
+
+class TestJsonPreview:
+    """Test bounded JSON preview reads"""
+
+    def test_reads_only_requested_records(self, temp_dir):
+        """Test that records are decoded across read boundaries and capped"""
+        records = [{"id": i, "text": "word " * i, "score": 1234.5} for i in range(50)]
+        path = temp_dir / "data.json"
+        path.write_text(json.dumps(records, indent=2))
+
+        with patch.object(files, "JSON_PREVIEW_READ_SIZE", 7):
+            assert _read_json_array_head(path, 10) == records[:10]
+            assert _read_json_array_head(path, 100) == records
+
+    def test_non_array_returns_none(self, temp_dir):
+        """Test that non-array documents are left to the full reader"""
+        path = temp_dir / "data.json"
+        path.write_text('{"id": 1}')
+        assert _read_json_array_head(path, 10) is None
+
+    def test_lazy_scan_limit(self, temp_dir):
+        """Test that a limited JSON scan returns a frame with the head rows"""
+        records = [{"id": i, "text": f"doc {i}"} for i in range(30)]
+        path = temp_dir / "data.json"
+        path.write_text(json.dumps(records))
+
+        df = _lazy_scan(path, "json", limit=5).collect()
+        assert df.height == 5
+        assert df.columns == ["id", "text"]
+        assert df["id"].to_list() == [0, 1, 2, 3, 4]
+
+
+class TestBuildPreview:
+    """Test preview page construction"""
+
+    def test_parquet_total_rows_from_footer(self, temp_dir):
+        """Test that parquet previews report the footer row count"""
+        path = temp_dir / "data.parquet"
+        pl.DataFrame({"id": list(range(25))}).write_parquet(path)
+
+        records, columns, total_rows = _build_preview(path, "parquet", 20, 10)
+
+        assert columns == ["id"]
+        assert [r["id"] for r in records] == [20, 21, 22, 23, 24]
+        assert total_rows == 25
+
+    def test_csv_total_rows_unknown(self, sample_csv_file):
+        """Test that CSV previews leave total_rows as unknown"""
+        records, columns, total_rows = _build_preview(sample_csv_file, "csv", 0, 2)
+
+        assert len(records) == 2
+        assert columns == ["name", "age", "city"]
+        assert total_rows == 0
+
+
+class TestCopyUpload:
+    """Test the chunked upload copy"""
+
+    def test_preallocated_copy_matches_source(self, temp_dir):
+        """Test that preallocation leaves the exact content on disk"""
+        payload = b"x" * 3000
+        dest = temp_dir / "upload.bin"
+
+        written = save_upload(io.BytesIO(payload), dest, len(payload))
+
+        assert written == len(payload)
+        assert dest.read_bytes() == payload
+
+    def test_overstated_size_is_truncated(self, temp_dir):
+        """Test that a size hint larger than the data does not pad the file"""
+        dest = temp_dir / "upload.bin"
+
+        written = save_upload(io.BytesIO(b"abc"), dest, 4096)
+
+        assert written == 3
+        assert dest.read_bytes() == b"abc"
+
+    def test_failed_upload_keeps_concurrent_file(self, temp_dir):
+        """Test that a failed upload only removes its own partial file"""
+        upload = Mock(filename="data.csv", file=io.BytesIO(b"a\n1\n"), size=4)
+
+        def concurrent_then_fail(src, dest, size):
+            (temp_dir / "data.csv").write_text("other upload")
+            dest.write_bytes(b"partial")
+            raise OSError("disk full")
+
+        with (
+            patch.object(files, "save_upload", side_effect=concurrent_then_fail),
+            pytest.raises(HTTPException),
+        ):
+            asyncio.run(files.upload_file(upload, {"id": "u"}, temp_dir))
+
+        assert [p.name for p in temp_dir.iterdir()] == ["data.csv"]
+        assert (temp_dir / "data.csv").read_text() == "other upload"
+
+
+class TestFileMetaCache:
+    """Test the short-lived file metadata cache"""
+
+    def test_misses_are_not_cached(self, temp_dir):
+        """Test that a file written after a 404 is found on the next lookup"""
+        assert _get_file_meta("u", "late.csv", temp_dir)["stat"] is None
+        (temp_dir / "late.csv").write_text("a\n1\n")
+
+        assert _get_file_meta("u", "late.csv", temp_dir)["stat"].st_size == 4
+
+    def test_symlinks_are_not_files(self, temp_dir):
+        """Test that a symlink is not served, matching the listing"""
+        (temp_dir / "real.csv").write_text("a\n1\n")
+        (temp_dir / "link.csv").symlink_to(temp_dir / "real.csv")
+
+        assert _get_file_meta("u", "real.csv", temp_dir)["stat"] is not None
+        assert _get_file_meta("u", "link.csv", temp_dir)["stat"] is None
@@ -0,0 +1,43 @@
+"""
+Tests for fast file metadata helpers
+"""
+
+import os
+import stat
+from unittest.mock import patch
+
+import pytest
+
+from ldaca_web_app_backend.core import fs_fast
+from ldaca_web_app_backend.core.fs_fast import fast_exists, fast_stat
+
+
+class TestFastStat:
+    """Test statx-backed metadata lookups"""
+
+    def test_matches_os_stat(self, sample_csv_file):
+        """Test that size, type and ctime agree with os.stat"""
+        expected = os.stat(sample_csv_file)
+        result = fast_stat(sample_csv_file)
+
+        assert result.st_size == expected.st_size
+        assert stat.S_ISREG(result.st_mode)
+        assert result.st_ctime == pytest.approx(expected.st_ctime)
+        assert result.st_mtime == pytest.approx(expected.st_mtime)
+
+    def test_missing_file_raises(self, temp_dir):
+        """Test that missing paths raise FileNotFoundError like os.stat"""
+        with pytest.raises(FileNotFoundError):
+            fast_stat(temp_dir / "missing.csv")
+
+    def test_fallback_without_statx(self, sample_csv_file):
+        """Test the os.stat fallback used on non-Linux platforms"""
+        with patch.object(fs_fast, "_statx", None):
+            result = fast_stat(sample_csv_file)
+        assert result.st_size == os.stat(sample_csv_file).st_size
+
+    def test_fast_exists(self, sample_csv_file, temp_dir):
+        """Test existence checks"""
+        assert fast_exists(sample_csv_file)
+        assert fast_exists(temp_dir)
+        assert not fast_exists(temp_dir / "missing.csv")
@@ -0,0 +1,40 @@
+"""
+Tests for queued background logging
+"""
+
+import logging
+
+from ldaca_web_app_backend.core.log_queue import (
+    PACKAGE_LOGGER,
+    start_log_listener,
+    stop_log_listener,
+)
+
+
+class TestLogQueue:
+    """Test the QueueHandler/QueueListener setup"""
+
+    def test_records_reach_stderr_after_stop(self, capsys):
+        """Test that queued records are written by the listener and flushed on stop"""
+        start_log_listener()
+        try:
+            logging.getLogger(f"{PACKAGE_LOGGER}.api.workspaces").warning(
+                "queued message"
+            )
+        finally:
+            stop_log_listener()
+
+        assert "queued message" in capsys.readouterr().err
+
+    def test_stop_restores_propagation(self):
+        """Test that stopping detaches the queue handler"""
+        logger = logging.getLogger(PACKAGE_LOGGER)
+        handlers_before = list(logger.handlers)
+
+        start_log_listener()
+        start_log_listener()  # idempotent
+        assert logger.propagate is False
+        stop_log_listener()
+
+        assert logger.propagate is True
+        assert logger.handlers == handlers_before
@@ -0,0 +1,88 @@
+"""
+Tests for dropping node cache entries when nodes and workspaces go away
+"""
+
+import asyncio
+import gc
+from unittest.mock import patch
+
+import polars as pl
+
+from ldaca_web_app_backend.api import workspaces
+from ldaca_web_app_backend.api.workspaces import (
+    _get_node_cached,
+    _store_node_cached,
+    delete_node,
+    unload_workspace,
+)
+
+USER = {"id": "u"}
+
+
+def _fill(node_id, data):
+    for cache in (
+        workspaces.NODE_SHAPE_CACHE,
+        workspaces.NODE_INFO_CACHE,
+        workspaces.CONCORDANCE_METADATA_CACHE,
+    ):
+        _store_node_cached(cache, ("u", "w", node_id), data, "value", 8)
+    _store_node_cached(
+        workspaces.UNIQUE_VALUES_CACHE, ("u", "w", node_id, "c", False), data, b"", 8
+    )
+
+
+def _node_keys():
+    return {
+        key[2]
+        for cache in (
+            workspaces.NODE_SHAPE_CACHE,
+            workspaces.NODE_INFO_CACHE,
+            workspaces.CONCORDANCE_METADATA_CACHE,
+            workspaces.UNIQUE_VALUES_CACHE,
+        )
+        for key in cache
+    }
+
+
+class TestNodeCacheEviction:
+    """Test that node caches don't outlive their nodes"""
+
+    def test_delete_node_drops_its_entries(self):
+        """Test that deleting a node removes only that node's entries"""
+        data = pl.DataFrame({"c": [1]})
+        _fill("n1", data)
+        _fill("n2", data)
+
+        with patch.object(
+            workspaces.workspace_manager,
+            "delete_node_from_workspace",
+            return_value=True,
+        ):
+            asyncio.run(delete_node("w", "n1", current_user=USER))
+
+        assert _node_keys() == {"n2"}
+
+    def test_unload_workspace_drops_all_entries(self):
+        """Test that unloading a workspace removes every node's entries"""
+        data = pl.DataFrame({"c": [1]})
+        _fill("n1", data)
+        _fill("n2", data)
+
+        with patch.object(
+            workspaces.workspace_manager, "unload_workspace", return_value=True
+        ):
+            asyncio.run(unload_workspace("w", save=False, current_user=USER))
+
+        assert _node_keys() == set()
+
+    def test_entries_do_not_keep_data_alive(self):
+        """Test that a freed frame is not held by the cache"""
+        data = pl.DataFrame({"c": [1]})
+        _store_node_cached(workspaces.GUESS_CACHE, (id(data), "g"), data, "c", 8)
+        assert _get_node_cached(workspaces.GUESS_CACHE, (id(data), "g"), data) == "c"
+
+        ref = workspaces.GUESS_CACHE[(id(data), "g")][0]
+        del data
+        gc.collect()
+
+        assert ref() is None
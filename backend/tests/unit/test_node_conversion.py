@@ -0,0 +1,43 @@
+"""
+Tests for the node conversion dispatch table
+"""
+
+import polars as pl
+import pytest
+from fastapi import HTTPException
+
+from ldaca_web_app_backend.api.workspaces import _CONVERT_HANDLERS, _frame_kind
+
+TARGETS = ("docdataframe", "dataframe", "doclazyframe", "lazyframe")
+
+
+class TestNodeConversion:
+    """Test conversion dispatch between node data kinds"""
+
+    def test_table_covers_every_pair(self):
+        """Test that every source/target pair has a handler"""
+        assert set(_CONVERT_HANDLERS) == {(s, t) for s in TARGETS for t in TARGETS}
+
+    def test_frame_kind(self):
+        """Test that plain Polars frames are classified"""
+        df = pl.DataFrame({"text": ["a"]})
+        assert _frame_kind(df) == "dataframe"
+        assert _frame_kind(df.lazy()) == "lazyframe"
+        assert _frame_kind(object()) is None
+
+    def test_plain_conversions(self):
+        """Test conversions between eager and lazy Polars frames"""
+        df = pl.DataFrame({"text": ["a", "b"]})
+
+        lazy = _CONVERT_HANDLERS[("dataframe", "lazyframe")](df, None)
+        assert isinstance(lazy, pl.LazyFrame)
+        eager = _CONVERT_HANDLERS[("lazyframe", "dataframe")](lazy, None)
+        assert eager.equals(df)
+
+    def test_missing_document_column_is_rejected(self):
+        """Test that an unknown document column is a 400"""
+        lf = pl.LazyFrame({"text": ["a"]})
+
+        with pytest.raises(HTTPException) as exc:
+            _CONVERT_HANDLERS[("lazyframe", "doclazyframe")](lf, "missing")
+        assert exc.value.status_code == 400
@@ -0,0 +1,52 @@
+"""
+Tests for the serialized node info cache
+"""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from ldaca_web_app_backend.api import workspaces
+from ldaca_web_app_backend.api.workspaces import _node_info_payload
+
+KEY = ("u", "w", "n1")
+
+
+def _node(data, name="node"):
+    return SimpleNamespace(data=data, name=name, operation=None, parents=[])
+
+
+class TestNodeInfoCache:
+    """Test reuse and invalidation of serialized node info"""
+
+    def _payload(self, node):
+        with patch.object(
+            workspaces.DocWorkspaceAPIUtils,
+            "convert_node_info_for_api",
+            side_effect=lambda n: {"name": n.name},
+        ) as convert:
+            result = _node_info_payload(KEY, node)
+        return result, convert.call_count
+
+    def test_reuses_payload_for_same_node_state(self):
+        """Test that an unchanged node is serialized only once"""
+        node = _node(object())
+        (etag, body), calls = self._payload(node)
+        assert calls == 1
+        assert body == b'{"name":"node"}'
+        assert etag.startswith('"') and etag.endswith('"')
+
+        again, calls = self._payload(node)
+        assert calls == 0
+        assert again == (etag, body)
+
+    def test_rename_or_new_data_invalidates(self):
+        """Test that a renamed node or replaced data gets a new payload"""
+        data = object()
+        (etag, _), _ = self._payload(_node(data))
+
+        (renamed, _), calls = self._payload(_node(data, name="renamed"))
+        assert calls == 1
+        assert renamed != etag
+
+        _, calls = self._payload(_node(object(), name="renamed"))
+        assert calls == 1
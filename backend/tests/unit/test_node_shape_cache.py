@@ -0,0 +1,47 @@
+"""
+Tests for the lazy node shape cache
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import polars as pl
+
+from ldaca_web_app_backend.api import workspaces
+from ldaca_web_app_backend.api.workspaces import _lazy_shape, _register_parquet_scan
+
+
+def _shape(key, data, lazy):
+    return asyncio.run(_lazy_shape(key, data, lazy))
+
+
+class TestLazyShape:
+    """Test shapes cached per node data object"""
+
+    def test_shape_reused_for_same_data(self):
+        """Test that the cached shape is returned while the data is unchanged"""
+        lf = pl.LazyFrame({"x": [1, 2, 3]})
+        key = ("u", "w", "n")
+
+        assert _shape(key, lf, lf) == (3, 1)
+        # Same object: served from the cache without re-counting
+        workspaces.NODE_SHAPE_CACHE[key] = (lf, (99, 1))
+        assert _shape(key, lf, lf) == (99, 1)
+
+    def test_replaced_data_is_reshaped(self):
+        """Test that a node holding new data gets a fresh shape"""
+        key = ("u", "w", "n")
+        _shape(key, pl.LazyFrame({"x": [1]}), pl.LazyFrame({"x": [1]}))
+
+        replacement = pl.LazyFrame({"x": [1, 2]})
+        assert _shape(key, replacement, replacement) == (2, 1)
+
+    def test_parquet_scan_uses_footer(self, temp_dir):
+        """Test that registered parquet scans are counted from the footer"""
+        path = temp_dir / "data.parquet"
+        pl.DataFrame({"x": list(range(25)), "y": ["a"] * 25}).write_parquet(path)
+        lf = pl.scan_parquet(path)
+        _register_parquet_scan(lf, path)
+
+        with patch.object(pl.LazyFrame, "select", side_effect=AssertionError):
+            assert _shape(("u", "w", "n"), lf, lf) == (25, 2)
@@ -0,0 +1,75 @@
+"""
+Tests for the paginated rows JSON response
+"""
+
+from datetime import date, datetime, timedelta
+
+import orjson
+import polars as pl
+from fastapi.encoders import jsonable_encoder
+
+from ldaca_web_app_backend.api.workspaces import _rows_response
+
+
+class TestRowsResponse:
+    """Test natively encoded row pages"""
+
+    def test_rows_and_metadata(self):
+        """Test that rows and metadata decode to the usual response shape"""
+        df = pl.DataFrame({"id": [1, 2], "text": ['a "quoted"\nline', None]})
+
+        response = _rows_response(df, {"columns": df.columns, "pagination": {}})
+        body = orjson.loads(response.body)
+
+        assert response.media_type == "application/json"
+        assert body["data"] == df.to_dicts()
+        assert body["columns"] == ["id", "text"]
+        assert body["pagination"] == {}
+
+    def test_empty_page(self):
+        """Test that an empty page encodes as an empty list"""
+        df = pl.DataFrame({"id": []}, schema={"id": pl.Int64})
+
+        body = orjson.loads(_rows_response(df, {"columns": ["id"]}).body)
+
+        assert body["data"] == []
+
+    def test_temporal_values_keep_json_encoding(self):
+        """Test that datetimes, dates and durations encode as before"""
+        df = pl.DataFrame(
+            {
+                "at": [datetime(2024, 1, 2, 3, 4, 5), None],
+                "day": [date(2024, 1, 2), date(2024, 2, 29)],
+                "took": [timedelta(seconds=3), timedelta(milliseconds=1500)],
+            }
+        )
+
+        body = orjson.loads(_rows_response(df, {"columns": df.columns}).body)
+
+        assert body["data"] == jsonable_encoder(df.to_dicts())
+        assert body["data"][0] == {
+            "at": "2024-01-02T03:04:05",
+            "day": "2024-01-02",
+            "took": 3.0,
+        }
+
+    def test_nested_temporal_values_keep_json_encoding(self):
+        """Test that temporal values inside lists and structs encode as before"""
+        df = pl.DataFrame(
+            {
+                "days": [[date(2024, 1, 2)]],
+                "span": [{"start": datetime(2024, 1, 2), "n": 1}],
+            }
+        )
+
+        body = orjson.loads(_rows_response(df, {"columns": df.columns}).body)
+
+        assert body["data"] == [
+            {"days": ["2024-01-02"], "span": {"start": "2024-01-02T00:00:00", "n": 1}}
+        ]
+
+    def test_empty_metadata(self):
+        """Test that a response without metadata is still valid JSON"""
+        df = pl.DataFrame({"id": [1]})
+
+        assert orjson.loads(_rows_response(df, {}).body) == {"data": [{"id": 1}]}
@@ -0,0 +1,131 @@
+"""
+Tests for topic modeling helpers
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+
+from ldaca_web_app_backend.core import topic_modeling
+from ldaca_web_app_backend.core.topic_modeling import (
+    accepts_kwarg,
+    embed_unique,
+    gpu_cluster_models,
+    hashed_embeddings,
+    resolve_embedding_options,
+    run_topic_visualization,
+)
+
+
+def _tv_without_options(corpora, min_topic_size=5, use_ctfidf=False):
+    return {"corpora": corpora}
+
+
+class TestTopicModelingHelpers:
+    """Test optional-input plumbing for topic_visualization"""
+
+    def test_accepts_kwarg(self):
+        """Test keyword detection including **kwargs"""
+
+        def with_kwargs(corpora, **kwargs):
+            return {}
+
+        assert accepts_kwarg(_tv_without_options, "use_ctfidf")
+        assert not accepts_kwarg(_tv_without_options, "embeddings")
+        assert accepts_kwarg(with_kwargs, "embeddings")
+
+    def test_hashed_embeddings_shape(self):
+        """Test one embedding row per document"""
+        docs = [f"document number {i} about topic {i % 3}" for i in range(20)]
+        embeddings = hashed_embeddings(docs, n_components=5)
+        assert embeddings.shape == (20, 5)
+
+    def test_embed_unique_encodes_duplicates_once(self):
+        """Test duplicates are encoded once and rows expand to input order"""
+        encoded = []
+
+        def encode(docs):
+            encoded.append(list(docs))
+            return np.array([[len(doc)] for doc in docs])
+
+        docs = ["a", "bbb", "a", "cc", "bbb"]
+        embeddings = embed_unique(docs, encode)
+
+        assert encoded == [["a", "bbb", "cc"]]
+        assert embeddings[:, 0].tolist() == [1, 3, 1, 2, 3]
+
+    def test_run_passes_embeddings_when_supported(self):
+        """Test embeddings are passed only when asked and to versions accepting them"""
+        seen = {}
+
+        def tv_with_embeddings(corpora, min_topic_size, use_ctfidf, embeddings=None):
+            seen["embeddings"] = embeddings
+            return {}
+
+        corpora = [["cats purr", "dogs bark", "birds sing"], ["fish swim"]]
+        run_topic_visualization(tv_with_embeddings, corpora, 2, False)
+        assert seen["embeddings"] is None
+
+        run_topic_visualization(tv_with_embeddings, corpora, 2, False, True)
+        assert seen["embeddings"].shape[0] == 4
+
+        # Older signature: fast_embed is dropped (with a warning)
+        assert run_topic_visualization(_tv_without_options, corpora, 2, False, True)
+
+    def test_gpu_models_fall_back_to_cpu(self):
+        """Test no cluster overrides are produced without cuML/CUDA"""
+        with patch.object(topic_modeling, "_cuml_available", return_value=False):
+            assert gpu_cluster_models(5) == {}
+
+    def test_run_passes_gpu_models_when_supported(self):
+        """Test GPU models are forwarded only to versions that accept them"""
+        seen = {}
+
+        def tv_with_models(corpora, min_topic_size, use_ctfidf, **kwargs):
+            seen.update(kwargs)
+            return {}
+
+        models = {"umap_model": object(), "hdbscan_model": object()}
+        with patch.object(topic_modeling, "gpu_cluster_models", return_value=models):
+            run_topic_visualization(tv_with_models, [["a", "b"]], 2, False, False)
+            run_topic_visualization(_tv_without_options, [["a", "b"]], 2, False, False)
+
+        assert seen == models
+
+    def test_run_passes_quantized_model_when_requested(self):
+        """Test the quantized model is used only when asked and not on the fast path"""
+        seen = []
+
+        def tv_with_model(corpora, min_topic_size, use_ctfidf, embedding_model=None):
+            seen.append(embedding_model)
+            return {}
+
+        model = object()
+        with patch.object(
+            topic_modeling, "quantized_embedding_model", return_value=model
+        ):
+            run_topic_visualization(tv_with_model, [["a"]], 2, False, False, True)
+            run_topic_visualization(tv_with_model, [["a"]], 2, False, False, False)
+
+        assert seen == [model, None]
+
+    def test_resolve_drops_unsupported_options_with_warning(self, caplog):
+        """Test options the installed version can't take are dropped and logged"""
+
+        def tv_with_model(corpora, min_topic_size, use_ctfidf, embedding_model=None):
+            return {}
+
+        with caplog.at_level("WARNING", logger=topic_modeling.__name__):
+            assert resolve_embedding_options(_tv_without_options, True, True) == (
+                False,
+                False,
+            )
+        messages = [record.getMessage() for record in caplog.records]
+        assert any("ignoring fast_embed" in message for message in messages)
+        assert any("ignoring quantize" in message for message in messages)
+
+        assert resolve_embedding_options(tv_with_model, True, True) == (False, True)
+        assert resolve_embedding_options(tv_with_model, False, False) == (
+            False,
+            False,
+        )
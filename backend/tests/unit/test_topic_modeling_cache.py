@@ -0,0 +1,39 @@
+"""
+Tests for the topic modeling result cache
+"""
+
+from unittest.mock import patch
+
+from ldaca_web_app_backend.api import workspaces
+from ldaca_web_app_backend.api.workspaces import (
+    _get_cached_topic_modeling,
+    _store_topic_modeling,
+    _topic_modeling_cache_key,
+)
+
+
+class TestTopicModelingCache:
+    """Test content-addressed caching of topic modeling results"""
+
+    def test_key_depends_on_content_and_params(self):
+        """Test that keys change with documents, corpus split and parameters"""
+        base = _topic_modeling_cache_key([["a b", "c"]], 5, False)
+
+        assert base == _topic_modeling_cache_key([["a b", "c"]], 5, False)
+        assert base != _topic_modeling_cache_key([["a b", "d"]], 5, False)
+        assert base != _topic_modeling_cache_key([["a b"], ["c"]], 5, False)
+        assert base != _topic_modeling_cache_key([["a", "b c"]], 5, False)
+        assert base != _topic_modeling_cache_key([["a b", "c"]], 6, False)
+        assert base != _topic_modeling_cache_key([["a b", "c"]], 5, True)
+
+    def test_store_and_evict(self):
+        """Test lookups and LRU eviction beyond the entry cap"""
+        with patch.object(workspaces, "TOPIC_MODELING_CACHE_MAX_ENTRIES", 2):
+            _store_topic_modeling("k1", {"topics": [1]})
+            _store_topic_modeling("k2", {"topics": [2]})
+            assert _get_cached_topic_modeling("k1") == {"topics": [1]}
+            _store_topic_modeling("k3", {"topics": [3]})
+
+        assert _get_cached_topic_modeling("k2") is None
+        assert _get_cached_topic_modeling("k1") == {"topics": [1]}
+        assert _get_cached_topic_modeling("k3") == {"topics": [3]}
@@ -0,0 +1,48 @@
+"""
+Tests for the column unique values endpoint
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import orjson
+import polars as pl
+
+from ldaca_web_app_backend.api import workspaces
+from ldaca_web_app_backend.api.workspaces import get_column_unique_values
+
+
+def _unique_values(df, column, exact=False):
+    node = SimpleNamespace(data=df)
+    response = asyncio.run(
+        get_column_unique_values(
+            "ws", "node", column, exact=exact, node=node, current_user={"id": "u"}
+        )
+    )
+    return orjson.loads(response.body)
+
+
+class TestColumnUniqueValues:
+    """Test sample values and their has_more/partial flags"""
+
+    def test_has_more_follows_the_sample(self):
+        """Test that has_more is set only when the sample exceeds the limit"""
+        few = pl.DataFrame({"c": [i % 100 for i in range(500)]})
+        many = pl.DataFrame({"c": list(range(101))})
+
+        assert _unique_values(few, "c")["has_more"] is False
+        assert _unique_values(many, "c")["has_more"] is True
+
+    def test_sample_partial_past_scanned_rows(self):
+        """Test that values from only the first rows are flagged as partial"""
+        df = pl.DataFrame({"c": ["a"] * 20 + ["b"] * 5})
+
+        with patch.object(workspaces, "UNIQUE_SAMPLE_SCAN_ROWS", 20):
+            body = _unique_values(df, "c")
+            assert body["sample_values"] == ["a"]
+            assert body["sample_partial"] is True
+
+            exact = _unique_values(df, "c", exact=True)
+            assert sorted(exact["sample_values"]) == ["a", "b"]
+            assert exact["sample_partial"] is False
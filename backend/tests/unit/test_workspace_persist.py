@@ -0,0 +1,113 @@
+"""
+Tests for deferred workspace saves
+"""
+
+import asyncio
+from unittest.mock import Mock, patch
+
+from ldaca_web_app_backend.core import workspace
+from ldaca_web_app_backend.core.workspace import WorkspaceManager
+
+
+def _manager_with_workspace():
+    manager = WorkspaceManager()
+    ws = Mock()
+    manager._current["u"] = {"id": "w", "ws": ws}
+    manager.write_workspace_file = Mock()
+    return manager, ws
+
+
+class TestDeferredPersist:
+    """Test coalescing of persist(defer=True) calls"""
+
+    def test_deferred_saves_are_coalesced(self):
+        """Test that a burst of deferred saves writes the workspace once"""
+        manager, ws = _manager_with_workspace()
+
+        async def burst():
+            for _ in range(5):
+                manager.persist("u", "w", defer=True)
+            assert manager.write_workspace_file.call_count == 0
+            await asyncio.sleep(0.05)
+
+        with patch.object(workspace, "PERSIST_DEBOUNCE_SECONDS", 0.01):
+            asyncio.run(burst())
+
+        manager.write_workspace_file.assert_called_once_with("u", "w", ws)
+
+    def test_modified_at_stamped_before_write(self):
+        """Test that metadata is current while the deferred write is pending"""
+        manager, ws = _manager_with_workspace()
+
+        async def defer():
+            manager.persist("u", "w", defer=True)
+            ws.set_metadata.assert_called_once()
+            assert ws.set_metadata.call_args.args[0] == "modified_at"
+            manager.write_workspace_file.assert_not_called()
+            manager.flush_pending_saves()
+
+        asyncio.run(defer())
+
+        ws.set_metadata.assert_called_once()
+        manager.write_workspace_file.assert_called_once_with("u", "w", ws)
+
+    def test_defer_skips_workspace_not_resident(self):
+        """Test that deferring a workspace that is not loaded does not load it"""
+        manager, _ = _manager_with_workspace()
+        manager.get_workspace = Mock()
+
+        async def defer():
+            manager.persist("u", "other", defer=True)
+
+        asyncio.run(defer())
+
+        manager.get_workspace.assert_not_called()
+        assert manager._pending_saves == {}
+
+    def test_defer_without_loop_saves_immediately(self):
+        """Test that deferral outside an event loop falls back to a direct save"""
+        manager, ws = _manager_with_workspace()
+
+        manager.persist("u", "w", defer=True)
+
+        manager.write_workspace_file.assert_called_once_with("u", "w", ws)
+
+    def test_flush_pending_saves(self):
+        """Test that pending saves run on flush and are not repeated"""
+        manager, ws = _manager_with_workspace()
+
+        async def defer_and_flush():
+            manager.persist("u", "w", defer=True)
+            manager.flush_pending_saves()
+            await asyncio.sleep(0.05)
+
+        with patch.object(workspace, "PERSIST_DEBOUNCE_SECONDS", 0.01):
+            asyncio.run(defer_and_flush())
+
+        manager.write_workspace_file.assert_called_once_with("u", "w", ws)
+        assert manager._pending_saves == {}
+
+    def test_split_save_cancels_pending_and_writes_copy(self, tmp_path):
+        """Test that begin_save drops the deferred save and the copy is written"""
+        manager, ws = _manager_with_workspace()
+        del manager.write_workspace_file
+        snapshot = Mock()
+
+        async def defer_then_save():
+            manager.persist("u", "w", defer=True)
+            manager.begin_save("u", "w", ws)
+            assert manager._pending_saves == {}
+            await asyncio.to_thread(manager.write_workspace_file, "u", "w", snapshot)
+            await asyncio.sleep(0.05)
+
+        with (
+            patch.object(workspace, "PERSIST_DEBOUNCE_SECONDS", 0.01),
+            patch.object(
+                workspace, "get_user_workspace_folder", return_value=tmp_path
+            ),
+        ):
+            asyncio.run(defer_then_save())
+
+        assert ws.set_metadata.call_count == 2
+        ws.serialize.assert_not_called()
+        snapshot.serialize.assert_called_once_with(tmp_path / "workspace_w.json")
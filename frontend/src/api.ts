@@ -92,6 +92,8 @@ export interface ColumnUniqueValuesResponse {
   unique_count: number;
   sample_values: any[];
   has_more: boolean;
+  sample_partial?: boolean; // sample_values only cover the first rows scanned
+  approximate?: boolean;
 }
 
 // =============================================================================
@@ -903,6 +905,8 @@ export interface TopicModelingRequest {
   node_columns?: Record<string, string>;
   min_topic_size?: number;
   use_ctfidf?: boolean;
+  fast_embed?: boolean; // opt-in hashed embeddings (faster, lower topic quality)
+  quantize?: boolean; // int8 transformer embeddings
 }
 
 export interface TopicModelingTopic {